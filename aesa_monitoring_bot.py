@@ -1,14 +1,23 @@
 import os
+import re
+import html
+import json
 import time
+import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed, CancelledError
 import feedparser
 import anthropic
-import requests
 from datetime import datetime, time as dtime, timezone, timedelta
 
 KST = timezone(timedelta(hours=9))
 from app import create_app, db
-from app.models.aesa_article import AesaArticle
+from app.models.aesa_article import AesaArticle, AesaScoreCache
+from app.utils.feed_fetcher import get_feed_fetcher
+from app.utils.llm_json import parse_json_response
+from app.utils.telegram_delivery import send_message
+from app.utils.ttl_cache import TTLSet
+from sqlalchemy import tuple_, insert as sa_insert
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -57,6 +66,9 @@ RSS_FEEDS = {
     'ANSA': 'https://www.ansa.it/sito/notizie/mondo/mondo_rss.xml',
 }
 
+# RSS 병렬 수집 스레드 수 (호스트별 연결은 프로세스 수명 동안 재사용)
+RSS_FETCH_WORKERS = int(os.environ.get('AESA_RSS_WORKERS', 10))
+
 # Google News RSS 프록시를 사용하는 소스: entry.link가 Google 리다이렉트 URL일 수 있음
 GOOGLE_NEWS_SOURCES = {'Nikkei Asia', 'Reuters', 'Caixin Global', 'Brookings', 'CFR', 'Arab News'}
 
@@ -191,38 +203,357 @@ def _clean_title(title):
     return title
 
 
+# Claude 채점 동시 실행 수 / 캐시 키 버전 (PROMPT_TEMPLATE 을 바꾸면 올릴 것)
+SCORING_WORKERS = int(os.environ.get('AESA_SCORING_WORKERS', 4))
+SCORING_CACHE_VERSION = 'v1'
+
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def _normalize_for_hash(text):
+    text = _TAG_RE.sub(' ', html.unescape(text or ''))
+    return ' '.join(text.lower().split())
+
+
+def scoring_cache_key(title, summary_text):
+    raw = f"{SCORING_CACHE_VERSION}|{_normalize_for_hash(title)}|{_normalize_for_hash(summary_text[:1500])}"
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def _score_with_claude(client, cand):
+    """기사 1건 채점 → (result dict 또는 None, meta). 크레딧 고갈 BadRequestError 는 그대로 올린다."""
+    source_name, title = cand['source'], cand['title']
+    meta = {'errors': 0, 'input_tokens': 0, 'output_tokens': 0, 'latency': 0.0}
+    prompt = PROMPT_TEMPLATE.format(title=title, summary=cand['summary_text'][:1500], source=source_name)
+    started = time.monotonic()
+    try:
+        response = client.messages.create(
+            model="claude-sonnet-4-6",
+            max_tokens=1024,
+            thinking={"type": "disabled"},
+            system="당신은 최고 수준의 국제정치, 기술 트렌드, 글로벌 금융 분석가입니다.",
+            messages=[{"role": "user", "content": prompt}]
+        )
+    except anthropic.BadRequestError as e:
+        if _is_credit_exhausted_error(e):
+            raise
+        logger.error(f"[AESA] {source_name}: BadRequestError: {e}")
+        meta['errors'] = 1
+        return None, meta
+    except Exception as e:
+        logger.error(f"[AESA] {source_name}: Claude API 에러: {e}")
+        meta['errors'] = 1
+        return None, meta
+    finally:
+        meta['latency'] = time.monotonic() - started
+
+    usage = getattr(response, 'usage', None)
+    meta['input_tokens'] = getattr(usage, 'input_tokens', 0) or 0
+    meta['output_tokens'] = getattr(usage, 'output_tokens', 0) or 0
+
+    # 응답이 max_tokens로 잘리면 닫는 '}'가 빠져 조용한 score=0이 됨.
+    # 무증상으로 넘기지 않도록 경고+errors 집계 (1024로도 또 잘리면 상향 신호).
+    truncated = (response.stop_reason == 'max_tokens')
+    if truncated:
+        logger.warning(
+            f"[AESA] {source_name}: 응답이 max_tokens로 잘림 "
+            f"(stop_reason=max_tokens) — JSON 보정 파싱 시도: {title[:50]}"
+        )
+        meta['errors'] = 1
+
+    result, repaired = parse_json_response(response.content[0].text)
+    if repaired:
+        logger.info(f"[AESA] {source_name}: 잘린 JSON 보정 파싱 성공")
+    if result is None:
+        # 응답은 왔으나 보정으로도 JSON 추출 실패 → 그때만 에러로 집계
+        meta['errors'] = 1
+        logger.error(f"[AESA] {source_name}: JSON 파싱 실패(보정 후에도) — score=0 처리: {title[:50]}")
+    return result, meta
+
+
+def score_candidates(client, candidates):
+    """한 사이클의 신규 기사 전체 채점.
+
+    같은 (제목, 요약) 해시는 한 번만 채점하고, aesa_score_cache 에 있으면 Claude 를 건너뛴다.
+    캐시 미스는 SCORING_WORKERS 개 스레드로 동시에 호출한다.
+    반환: (해시 → (result, meta) 딕셔너리, 사이클 합계, 크레딧 고갈 여부)
+    """
+    totals = {'candidates': len(candidates), 'unique': 0, 'cache_hits': 0, 'calls': 0,
+              'input_tokens': 0, 'output_tokens': 0, 'model_seconds': 0.0, 'wall_seconds': 0.0}
+    started = time.monotonic()
+    by_hash = {}
+    for cand in candidates:
+        by_hash.setdefault(cand['hash'], cand)
+    totals['unique'] = len(by_hash)
+
+    results = {}
+    if by_hash:
+        for row in AesaScoreCache.query.filter(AesaScoreCache.content_hash.in_(list(by_hash))).all():
+            results[row.content_hash] = (json.loads(row.result), {'errors': 0, 'cached': True})
+    totals['cache_hits'] = len(results)
+
+    misses = [cand for h, cand in by_hash.items() if h not in results]
+    credit_exhausted = False
+    if misses:
+        with ThreadPoolExecutor(max_workers=min(SCORING_WORKERS, len(misses)),
+                                thread_name_prefix='aesa-score') as pool:
+            futures = {pool.submit(_score_with_claude, client, cand): cand for cand in misses}
+            for future in as_completed(futures):
+                cand = futures[future]
+                try:
+                    result, meta = future.result()
+                except anthropic.BadRequestError:
+                    # 크레딧 고갈: 아직 시작 안 한 호출은 취소
+                    credit_exhausted = True
+                    for f in futures:
+                        f.cancel()
+                    continue
+                except CancelledError:
+                    continue
+                results[cand['hash']] = (result, meta)
+                totals['calls'] += 1
+                totals['input_tokens'] += meta['input_tokens']
+                totals['output_tokens'] += meta['output_tokens']
+                totals['model_seconds'] += meta['latency']
+                if result is not None:
+                    db.session.merge(AesaScoreCache(
+                        content_hash=cand['hash'], result=json.dumps(result, ensure_ascii=False),
+                        input_tokens=meta['input_tokens'], output_tokens=meta['output_tokens'],
+                    ))
+        try:
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.warning(f"[AESA] 채점 캐시 저장 실패: {e}")
+
+    totals['wall_seconds'] = time.monotonic() - started
+    return results, totals, credit_exhausted
+
+
+# 이미 저장된 기사 키(URL, (제목, 소스)) — 사이클 간 유지해 DB 조회 자체를 줄인다
+_known_keys = TTLSet(ttl=3 * 24 * 3600, max_size=50000)
+_DEDUPE_CHUNK = 500
+
+
+def _title_key(cand):
+    # 짧은 카테고리성 제목("Opinion", "Offbeat" 등)은 다른 기사끼리 공유되므로 30자 초과 제목만
+    return (cand['title'], cand['source']) if len(cand['title']) > 30 else None
+
+
+def dedupe_entries(entries, stats):
+    """사이클 전체 RSS 항목 중 신규 기사만 반환.
+
+    1차: URL 동일성, 2차: (title, source) 동일성 — URL은 달라도 같은 기사인 경우 차단
+    (Google News RSS가 같은 기사에 다른 CBMi 인코딩을 주거나, 발행사가 같은 기사를
+    여러 URL 경로로 재게시할 때 중복 발송이 발생).
+    사이클 내 중복 → 최근 본 키(메모리) → DB 순으로 거르고, DB 는 키 종류별 IN 쿼리 1회.
+    """
+    pending, seen_urls, seen_titles = [], set(), set()
+    for cand in entries:
+        tkey = _title_key(cand)
+        if (cand['url'] in seen_urls or ('u', cand['url']) in _known_keys
+                or (tkey and (tkey in seen_titles or ('t',) + tkey in _known_keys))):
+            stats[cand['source']]['skipped_dup'] += 1
+            continue
+        seen_urls.add(cand['url'])
+        if tkey:
+            seen_titles.add(tkey)
+        pending.append(cand)
+
+    urls = [c['url'] for c in pending]
+    title_keys = [k for k in (_title_key(c) for c in pending) if k]
+    existing_urls, existing_titles = set(), {}
+    for i in range(0, len(urls), _DEDUPE_CHUNK):
+        existing_urls.update(url for (url,) in db.session.query(AesaArticle.url).filter(
+            AesaArticle.url.in_(urls[i:i + _DEDUPE_CHUNK])))
+    for i in range(0, len(title_keys), _DEDUPE_CHUNK):
+        for row in db.session.query(AesaArticle.title, AesaArticle.source, AesaArticle.id, AesaArticle.status).filter(
+                tuple_(AesaArticle.title, AesaArticle.source).in_(title_keys[i:i + _DEDUPE_CHUNK])):
+            existing_titles[(row.title, row.source)] = row
+
+    fresh = []
+    for cand in pending:
+        tkey = _title_key(cand)
+        if cand['url'] in existing_urls:
+            _known_keys.add(('u', cand['url']))
+        elif tkey and tkey in existing_titles:
+            row = existing_titles[tkey]
+            _known_keys.add(('t',) + tkey)
+            logger.info(
+                f"[AESA] {cand['source']}: 제목 중복 스킵 "
+                f"(기존 id={row.id} status={row.status}): {cand['title'][:60]}"
+            )
+        else:
+            fresh.append(cand)
+            continue
+        stats[cand['source']]['skipped_dup'] += 1
+    return fresh
+
+
+def remember_persisted(cand):
+    _known_keys.add(('u', cand['url']))
+    if _title_key(cand):
+        _known_keys.add(('t',) + _title_key(cand))
+
+
+def _insert_article(values):
+    """INSERT ... ON CONFLICT (url) DO NOTHING → 새 기사 id, 이미 있는 URL이면 None"""
+    dialect = db.engine.dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        insert = None
+    if insert is None:
+        stmt = sa_insert(AesaArticle).values(**values)
+    else:
+        stmt = insert(AesaArticle).values(**values).on_conflict_do_nothing(index_elements=['url'])
+    article_id = db.session.execute(stmt.returning(AesaArticle.id)).scalar()
+    db.session.commit()
+    return article_id
+
+
+def _persist_and_alert(cand, result, source_stats):
+    """채점 결과로 status 결정 → DB 저장 → (9점 이상) 긴급 발송"""
+    source_name, url, title = cand['source'], cand['url'], cand['title']
+    lenses = []
+    korea_link = False
+    score = 0
+    summary = "분석 실패"
+    korea_insight = None
+    if result is not None:
+        score = min(int(result.get("score", 0)), 10)
+        summary = result.get("korean_summary", "")
+        lenses = result.get("lenses", [])
+        korea_link = bool(result.get("korea_investment_link", False))
+        korea_insight = result.get("korea_insight")
+        logger.info(f"[AESA] korea_insight 추출 완료: {korea_insight}")
+
+    lens_tag = ''.join(f'[{l}]' for l in lenses) if lenses else '[?]'
+    source_stats['scored'] += 1
+    logger.info(f"[AESA] {source_name}: score={score} lens={lens_tag} kr_link={korea_link} kr_insight={bool(korea_insight)} | {title[:50]}")
+
+    now_kst = datetime.now(KST)
+    is_night = dtime(2, 0) <= now_kst.time() < dtime(6, 0)
+
+    # 9점 이상: 즉시 발송 (긴급 속보) + Threads 초안 동시 발송
+    # 7~8점: 배치 대기열에 적재
+    # 6점 이하: 일간 요약 대기
+    # 중복 방지: status는 DB 저장 전에 먼저 결정하고,
+    # 긴급 발송(score>=9) 케이스는 DB insert/commit이 성공한 "다음"에만 텔레그램을 쏜다.
+    if score >= 9:
+        status = 'queued_for_morning' if is_night else 'sent_urgent'
+    elif score >= 7:
+        status = 'queued_batch' if not is_night else 'queued_for_morning'
+        source_stats['queued'] += 1
+    else:
+        status = 'queued_for_summary'
+        source_stats['low_score'] += 1
+
+    article_kwargs = dict(
+        url=url,
+        title=title,
+        source=source_name,
+        score=score,
+        summary=summary,
+        status=status
+    )
+    # lenses/korea_investment_link 컬럼이 아직 없을 수 있음 (마이그레이션 미적용)
+    try:
+        article_kwargs['lenses'] = ','.join(lenses) if lenses else ''
+        article_kwargs['korea_investment_link'] = korea_link
+        article_kwargs['korea_insight'] = korea_insight
+    except Exception:
+        pass
+
+    persisted = False
+    article_id = None
+    try:
+        article_id = _insert_article(article_kwargs)
+    except Exception as db_err:
+        db.session.rollback()
+        # lenses/korea_investment_link 없이 재시도
+        logger.warning(f"[AESA] DB 저장 실패, 기본 컬럼만 재시도: {db_err}")
+        try:
+            article_id = _insert_article(dict(
+                url=url, title=title, source=source_name,
+                score=score, summary=summary, status=status
+            ))
+        except Exception as retry_err:
+            db.session.rollback()
+            logger.error(f"[AESA] DB 저장 최종 실패 — 텔레그램 발송도 건너뜀(중복방지): {retry_err}")
+            source_stats['errors'] += 1
+            return
+    remember_persisted(cand)
+    if article_id is None:
+        # 다른 프로세스가 먼저 저장한 URL (ON CONFLICT DO NOTHING) — 발송도 그쪽 몫
+        source_stats['skipped_dup'] += 1
+        return
+    persisted = True
+
+    # 긴급 발송은 DB persist 성공 이후에만 실행.
+    # DB 실패 시 텔레그램 발송도 건너뛰어, 다음 폴링 사이클에서 재시도 가능한 대신
+    # "같은 URL이 DB에 없어 또 발송되는 중복" 시나리오를 막는다.
+    if persisted and score >= 9 and not is_night:
+        try:
+            send_telegram_alert(
+                source_name, title, url, score, summary,
+                lenses=lenses, korea_link=korea_link,
+                is_urgent=True, korea_insight=korea_insight
+            )
+            # Threads 초안 생성 및 발송 (SOB Scrap 채널 전용)
+            threads_draft = generate_threads_draft(title, summary, lenses, url)
+            if threads_draft:
+                threads_msg = f"✍️ *Threads 초안 (복사용)*\n"
+                threads_msg += "━" * 20 + "\n\n"
+                threads_msg += threads_draft
+                _send_threads_draft(threads_msg)
+            source_stats['urgent_sent'] += 1
+        except Exception as tg_err:
+            logger.error(f"[AESA] 긴급 텔레그램 발송 실패 (id={article_id}): {tg_err}")
+
+
 def process_rss_feeds():
-    """5분마다 실행: RSS 수집 → Claude 채점 → DB 저장.
+    """5분마다 실행: RSS 병렬 수집 → 신규 기사 추림 → Claude 일괄 채점 → DB 저장.
     9점 이상은 즉시 텔레그램 발송, 7~8점은 queued_batch로 대기.
     """
-    import json
     app = create_app()
     with app.app_context():
         client = anthropic.Anthropic(api_key=os.environ.get('ANTHROPIC_API_KEY'), timeout=25.0)
 
         stats = {}
 
-        for source_name, feed_url in RSS_FEEDS.items():
-            logger.info(f"[AESA] Polling RSS: {source_name}")
-            source_stats = {'fetched': 0, 'skipped_dup': 0, 'scored': 0, 'urgent_sent': 0, 'queued': 0, 'low_score': 0, 'errors': 0}
+        # 1단계: 전체 피드 병렬 수집 (조건부 GET + 피드별 시간 예산 + 서킷 브레이커)
+        fetcher = get_feed_fetcher('aesa', max_workers=RSS_FETCH_WORKERS)
+        fetch_started = time.monotonic()
+        fetched_feeds = fetcher.fetch_all(RSS_FEEDS)
+        logger.info(f"[AESA] RSS {len(fetched_feeds)}개 병렬 수집 완료 ({time.monotonic() - fetch_started:.1f}s)")
+
+        # 2단계: 피드별 파싱 → 사이클 전체 일괄 중복 제거 → 채점 후보
+        entries_found = []
+        parsed_feeds = []      # 끝까지 처리하면 ETag 를 저장할 피드
+        for source_name, fetched in fetched_feeds.items():
+            source_stats = {'fetched': 0, 'skipped_dup': 0, 'scored': 0, 'urgent_sent': 0, 'queued': 0, 'low_score': 0, 'errors': 0,
+                            'http': fetched.status if fetched.status != 'ok' else fetched.http_status,
+                            'fetch_ms': int(fetched.elapsed * 1000), 'bytes': fetched.bytes}
+            stats[source_name] = source_stats
 
-            try:
-                resp = requests.get(feed_url, timeout=20, headers={
-                    'User-Agent': 'Mozilla/5.0 (compatible; AESA-Monitor/1.0)'
-                })
-                if resp.status_code != 200:
-                    logger.error(f"[AESA] {source_name}: HTTP {resp.status_code} — RSS 피드 접근 실패")
-                    source_stats['errors'] = 1
-                    stats[source_name] = source_stats
-                    continue
+            if fetched.status in ('not_modified', 'skipped'):
+                continue
+            if fetched.status != 'ok':
+                logger.error(f"[AESA] {source_name}: {fetched.error} — RSS 피드 접근 실패")
+                source_stats['errors'] = 1
+                continue
 
-                feed = feedparser.parse(resp.content)
+            try:
+                feed = feedparser.parse(fetched.content)
                 entries = feed.entries[:10]
                 source_stats['fetched'] = len(entries)
 
                 if not entries:
                     logger.warning(f"[AESA] {source_name}: RSS 파싱 성공하나 entries 0개 (bozo={feed.bozo})")
-                    stats[source_name] = source_stats
+                    fetcher.remember(fetched)
                     continue
 
                 for entry in entries:
@@ -234,205 +565,56 @@ def process_rss_feeds():
                     if not url:
                         continue
 
-                    # 1차: URL 동일성 체크
-                    existing = AesaArticle.query.filter_by(url=url).first()
-                    if existing:
-                        source_stats['skipped_dup'] += 1
-                        continue
+                    entries_found.append({
+                        'source': source_name, 'url': url,
+                        'title': _clean_title(entry.get('title', 'No title')),
+                        'summary_text': entry.get('summary', '') or entry.get('description', ''),
+                    })
+                parsed_feeds.append(fetched)
+            except Exception as e:
+                logger.error(f"[AESA] {source_name}: 폴링 중 에러 발생: {e}", exc_info=True)
+                source_stats['errors'] += 1
 
-                    title = _clean_title(entry.get('title', 'No title'))
-                    summary_text = entry.get('summary', '') or entry.get('description', '')
-
-                    # 2차: (title, source) 동일성 체크 — URL은 달라도 같은 기사인 경우 차단
-                    # Google News RSS가 같은 기사에 다른 CBMi 인코딩을 주거나,
-                    # 발행사가 같은 기사를 여러 URL 경로(예: /europa/ vs /mediooriente/)로 재게시할 때
-                    # 중복 발송이 발생. 짧은 카테고리성 제목("Opinion", "Offbeat" 등)은
-                    # 다른 기사끼리 공유되므로 길이 30자 초과 제목에만 적용.
-                    if len(title) > 30:
-                        existing_by_title = AesaArticle.query.filter_by(
-                            title=title, source=source_name
-                        ).first()
-                        if existing_by_title:
-                            source_stats['skipped_dup'] += 1
-                            logger.info(
-                                f"[AESA] {source_name}: 제목 중복 스킵 "
-                                f"(기존 id={existing_by_title.id} status={existing_by_title.status}): "
-                                f"{title[:60]}"
-                            )
-                            continue
-
-                    prompt = PROMPT_TEMPLATE.format(title=title, summary=summary_text[:1500], source=source_name)
-
-                    lenses = []
-                    korea_link = False
-                    score = 0
-                    summary = ""
-                    korea_insight = None
-
-                    try:
-                        response = client.messages.create(
-                            model="claude-sonnet-4-6",
-                            max_tokens=1024,
-                            thinking={"type": "disabled"},
-                            system="당신은 최고 수준의 국제정치, 기술 트렌드, 글로벌 금융 분석가입니다.",
-                            messages=[{"role": "user", "content": prompt}]
-                        )
-
-                        # 응답이 max_tokens로 잘리면 닫는 '}'가 빠져 조용한 score=0이 됨.
-                        # 무증상으로 넘기지 않도록 경고+errors 집계 (1024로도 또 잘리면 상향 신호).
-                        truncated = (response.stop_reason == 'max_tokens')
-                        if truncated:
-                            logger.warning(
-                                f"[AESA] {source_name}: 응답이 max_tokens로 잘림 "
-                                f"(stop_reason=max_tokens) — JSON 보정 파싱 시도: {title[:50]}"
-                            )
-                            source_stats['errors'] += 1
-
-                        response_text = response.content[0].text
-                        result = None
-                        if "{" in response_text:
-                            start = response_text.find("{")
-                            # 1차: 정상(닫는 '}'까지) 파싱
-                            if "}" in response_text:
-                                try:
-                                    result = json.loads(response_text[start:response_text.rfind("}") + 1])
-                                except json.JSONDecodeError:
-                                    result = None
-                            # 2차(잘림 대응): 마지막 완성 필드까지 잘라 '}'로 닫고 재시도.
-                            # score 등 핵심 필드는 JSON 앞쪽에 있어 reason이 잘려도 복구 가능.
-                            if result is None:
-                                frag = response_text[start:]
-                                cut = frag.rfind(",")
-                                if cut != -1:
-                                    try:
-                                        result = json.loads(frag[:cut] + "}")
-                                        logger.info(f"[AESA] {source_name}: 잘린 JSON 보정 파싱 성공")
-                                    except json.JSONDecodeError:
-                                        result = None
-
-                        if result is not None:
-                            score = min(int(result.get("score", 0)), 10)
-                            summary = result.get("korean_summary", "")
-                            lenses = result.get("lenses", [])
-                            korea_link = bool(result.get("korea_investment_link", False))
-                            korea_insight = result.get("korea_insight")
-                            logger.info(f"[AESA] korea_insight 추출 완료: {korea_insight}")
-                        else:
-                            # 응답은 왔으나 보정으로도 JSON 추출 실패 → 그때만 에러로 집계
-                            # (truncated면 위에서 이미 +1 했으므로 중복 카운트 방지)
-                            if not truncated:
-                                source_stats['errors'] += 1
-                            summary = "분석 실패"
-                            logger.error(
-                                f"[AESA] {source_name}: JSON 파싱 실패(보정 후에도) — score=0 처리: {title[:50]}"
-                            )
-                    except anthropic.BadRequestError as e:
-                        # 크레딧 고갈이면 score=0 쓰레기 행을 더 쌓지 않도록 사이클 즉시 중단
-                        if _is_credit_exhausted_error(e):
-                            logger.error(f"[AESA] {source_name}: Anthropic 크레딧 고갈 감지 — 폴링 사이클 중단")
-                            _send_credit_exhausted_alert()
-                            db.session.rollback()
-                            stats[source_name] = source_stats
-                            logger.info("[AESA] ========== 크레딧 고갈로 사이클 조기 종료 ==========")
-                            return
-                        logger.error(f"[AESA] {source_name}: BadRequestError: {e}")
-                        summary = "분석 실패"
-                        source_stats['errors'] += 1
-                    except Exception as e:
-                        logger.error(f"[AESA] {source_name}: Claude API 또는 JSON 파싱 에러: {e}")
-                        summary = "분석 실패"
-                        source_stats['errors'] += 1
-
-                    lens_tag = ''.join(f'[{l}]' for l in lenses) if lenses else '[?]'
-                    source_stats['scored'] += 1
-                    logger.info(f"[AESA] {source_name}: score={score} lens={lens_tag} kr_link={korea_link} kr_insight={bool(korea_insight)} | {title[:50]}")
-
-                    now_kst = datetime.now(KST)
-                    is_night = dtime(2, 0) <= now_kst.time() < dtime(6, 0)
-
-                    # 9점 이상: 즉시 발송 (긴급 속보) + Threads 초안 동시 발송
-                    # 7~8점: 배치 대기열에 적재
-                    # 6점 이하: 일간 요약 대기
-                    # 중복 방지: status는 DB 저장 전에 먼저 결정하고,
-                    # 긴급 발송(score>=9) 케이스는 DB insert/commit이 성공한 "다음"에만 텔레그램을 쏜다.
-                    if score >= 9:
-                        status = 'queued_for_morning' if is_night else 'sent_urgent'
-                    elif score >= 7:
-                        status = 'queued_batch' if not is_night else 'queued_for_morning'
-                        source_stats['queued'] += 1
-                    else:
-                        status = 'queued_for_summary'
-                        source_stats['low_score'] += 1
-
-                    article_kwargs = dict(
-                        url=url,
-                        title=title,
-                        source=source_name,
-                        score=score,
-                        summary=summary,
-                        status=status
-                    )
-                    # lenses/korea_investment_link 컬럼이 아직 없을 수 있음 (마이그레이션 미적용)
-                    try:
-                        article_kwargs['lenses'] = ','.join(lenses) if lenses else ''
-                        article_kwargs['korea_investment_link'] = korea_link
-                        article_kwargs['korea_insight'] = korea_insight
-                    except Exception:
-                        pass
-
-                    article = AesaArticle(**article_kwargs)
-                    persisted = False
-                    try:
-                        db.session.add(article)
-                        db.session.commit()
-                        persisted = True
-                    except Exception as db_err:
-                        db.session.rollback()
-                        # lenses/korea_investment_link 없이 재시도
-                        logger.warning(f"[AESA] DB 저장 실패, 기본 컬럼만 재시도: {db_err}")
-                        article = AesaArticle(
-                            url=url, title=title, source=source_name,
-                            score=score, summary=summary, status=status
-                        )
-                        try:
-                            db.session.add(article)
-                            db.session.commit()
-                            persisted = True
-                        except Exception as retry_err:
-                            db.session.rollback()
-                            logger.error(f"[AESA] DB 저장 최종 실패 — 텔레그램 발송도 건너뜀(중복방지): {retry_err}")
-                            source_stats['errors'] += 1
-
-                    # 긴급 발송은 DB persist 성공 이후에만 실행.
-                    # DB 실패 시 텔레그램 발송도 건너뛰어, 다음 폴링 사이클에서 재시도 가능한 대신
-                    # "같은 URL이 DB에 없어 또 발송되는 중복" 시나리오를 막는다.
-                    if persisted and score >= 9 and not is_night:
-                        try:
-                            send_telegram_alert(
-                                source_name, title, url, score, summary,
-                                lenses=lenses, korea_link=korea_link,
-                                is_urgent=True, korea_insight=korea_insight
-                            )
-                            # Threads 초안 생성 및 발송 (SOB Scrap 채널 전용)
-                            threads_draft = generate_threads_draft(title, summary, lenses, url)
-                            if threads_draft:
-                                threads_msg = f"✍️ *Threads 초안 (복사용)*\n"
-                                threads_msg += "━" * 20 + "\n\n"
-                                threads_msg += threads_draft
-                                _send_threads_draft(threads_msg)
-                            source_stats['urgent_sent'] += 1
-                        except Exception as tg_err:
-                            logger.error(f"[AESA] 긴급 텔레그램 발송 실패 (id={article.id}): {tg_err}")
+        candidates = dedupe_entries(entries_found, stats)
+        for cand in candidates:
+            cand['hash'] = scoring_cache_key(cand['title'], cand['summary_text'])
 
+        # 3단계: 일괄 채점 (캐시 + 동시 호출)
+        results, totals, credit_exhausted = score_candidates(client, candidates)
+        logger.info(
+            f"[AESA] 채점: 후보 {totals['candidates']} (고유 {totals['unique']}) "
+            f"캐시 {totals['cache_hits']} 호출 {totals['calls']} | "
+            f"tokens in={totals['input_tokens']} out={totals['output_tokens']} | "
+            f"모델 {totals['model_seconds']:.1f}s 경과 {totals['wall_seconds']:.1f}s"
+        )
+        if credit_exhausted:
+            # 크레딧 고갈이면 score=0 쓰레기 행을 쌓지 않도록 사이클 즉시 중단
+            # (이미 채점된 결과는 캐시에 남아 다음 사이클에서 재사용)
+            logger.error("[AESA] Anthropic 크레딧 고갈 감지 — 폴링 사이클 중단")
+            _send_credit_exhausted_alert()
+            db.session.rollback()
+            logger.info("[AESA] ========== 크레딧 고갈로 사이클 조기 종료 ==========")
+            return
+
+        # 4단계: 저장 + 발송 (수집 순서대로)
+        for cand in candidates:
+            source_stats = stats[cand['source']]
+            result, meta = results.get(cand['hash'], (None, {'errors': 1}))
+            source_stats['errors'] += meta.get('errors', 0)
+            try:
+                _persist_and_alert(cand, result, source_stats)
             except Exception as e:
-                logger.error(f"[AESA] {source_name}: 폴링 중 에러 발생: {e}", exc_info=True)
+                db.session.rollback()
+                logger.error(f"[AESA] {cand['source']}: 저장 중 에러 발생: {e}", exc_info=True)
                 source_stats['errors'] += 1
 
-            stats[source_name] = source_stats
+        # 끝까지 처리한 피드만 ETag/Last-Modified 저장 (중단된 피드는 다음 주기에 다시 받음)
+        for fetched in parsed_feeds:
+            fetcher.remember(fetched)
 
         logger.info("[AESA] ========== 폴링 사이클 완료 ==========")
         for src, s in stats.items():
-            logger.info(f"[AESA] {src}: fetched={s['fetched']} dup={s['skipped_dup']} scored={s['scored']} urgent={s['urgent_sent']} queued={s['queued']} low={s['low_score']} err={s['errors']}")
+            logger.info(f"[AESA] {src}: http={s['http']} {s['fetch_ms']}ms {s['bytes']}B fetched={s['fetched']} dup={s['skipped_dup']} scored={s['scored']} urgent={s['urgent_sent']} queued={s['queued']} low={s['low_score']} err={s['errors']}")
 
 
 def send_batch_alerts():
@@ -511,14 +693,9 @@ def _send_telegram_raw(text):
     chat_id = os.environ.get('AESA_TELEGRAM_CHANNEL_ID', os.environ.get('TELEGRAM_CHAT_ID'))
     if not bot_token or not chat_id:
         return
-    try:
-        requests.post(
-            f"https://api.telegram.org/bot{bot_token}/sendMessage",
-            json={'chat_id': chat_id, 'text': text, 'parse_mode': 'Markdown'},
-            timeout=10
-        )
-    except Exception as e:
-        logger.error(f"Telegram raw send error: {e}")
+    result = send_message(bot_token, chat_id, text, parse_mode='Markdown', disable_preview=False)
+    if not result.ok:
+        logger.error(f"Telegram raw send error: {result.error}")
 
 
 def _send_threads_draft(text):
@@ -530,14 +707,9 @@ def _send_threads_draft(text):
     if not bot_token:
         logger.warning("[Threads] SCRAP_BOT_TOKEN 미설정 — 초안 발송 건너뜀")
         return
-    try:
-        requests.post(
-            f"https://api.telegram.org/bot{bot_token}/sendMessage",
-            json={'chat_id': chat_id, 'text': text, 'parse_mode': 'Markdown'},
-            timeout=10
-        )
-    except Exception as e:
-        logger.error(f"[Threads] SOB Scrap 발송 오류: {e}")
+    result = send_message(bot_token, chat_id, text, parse_mode='Markdown', disable_preview=False)
+    if not result.ok:
+        logger.error(f"[Threads] SOB Scrap 발송 오류: {result.error}")
 
 
 def send_telegram_alert(source, title, url, score, summary,
@@ -564,19 +736,9 @@ def send_telegram_alert(source, title, url, score, summary,
         
     text += f"🔍 렌즈: {lens_tag}{kr_flag}"
     
-    try:
-        api_url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-        payload = {
-            'chat_id': chat_id,
-            'text': text,
-            'parse_mode': 'Markdown',
-            'disable_web_page_preview': False
-        }
-        response = requests.post(api_url, json=payload, timeout=10)
-        if not response.ok:
-            logger.error(f"Telegram API Error: {response.text}")
-    except Exception as e:
-        logger.error(f"Telegram send error: {e}")
+    result = send_message(bot_token, chat_id, text, parse_mode='Markdown', disable_preview=False)
+    if not result.ok:
+        logger.error(f"Telegram send error: {result.error}")
 
 def flush_nighttime_queue():
     """야간(02~06 KST)에 대기시킨 queued_for_morning 기사를 아침 06시에 일괄 발송.
@@ -734,13 +896,9 @@ JSON 배열로만 응답. 다른 텍스트 없음.
                 messages=[{"role": "user", "content": prompt}]
             )
 
-            response_text = response.content[0].text.strip()
-            # JSON 배열 추출
-            if "[" in response_text and "]" in response_text:
-                start = response_text.find("[")
-                end = response_text.rfind("]") + 1
-                top3 = json.loads(response_text[start:end])
-            else:
+            # JSON 배열 추출 (잘린 응답은 완성된 후보까지만)
+            top3, _ = parse_json_response(response.content[0].text, expect='array')
+            if not top3:
                 logger.error("[AESA 콘텐츠] Claude 응답에서 JSON 배열 파싱 실패")
                 return
 
@@ -9,13 +9,16 @@ Claude Haiku API로 4개 분야 요약 후 텔레그램 전송.
 """
 
 import os
+import time
 import logging
-import feedparser
 import requests
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 from email.utils import parsedate_to_datetime
 
+from app.utils.feed_collector import get_feed_collector
+from app.utils.telegram_delivery import send_message
+
 try:
     import anthropic
 except ImportError:
@@ -34,7 +37,6 @@ HAIKU_MODEL = "claude-haiku-4-5-20251001"
 MAX_ARTICLES_PER_CATEGORY = 15
 BRIEFING_MIN_CHARS = 1000
 BRIEFING_MAX_CHARS = 1500
-TELEGRAM_MAX_LENGTH = 4096
 
 # ── 암호화폐 시세 (Upbit, 무인증) ─────────────────
 UPBIT_TICKER_URL = "https://api.upbit.com/v1/ticker"
@@ -42,6 +44,9 @@ CRYPTO_MARKETS = ["KRW-BTC", "KRW-ETH"]
 CRYPTO_NAMES = {"KRW-BTC": "비트코인", "KRW-ETH": "이더리움"}
 
 # ── RSS 피드 설정 (카테고리별) ────────────────────
+RSS_FETCH_WORKERS = 8
+RSS_READ_TIMEOUT = 8     # 피드별 읽기 타임아웃 (초)
+RSS_FEED_BUDGET = 12     # 피드별 전체 다운로드 시간 예산 (초) — 느린 피드가 브리핑을 붙잡지 않도록
 RSS_FEEDS = {
     "정치/시사": [
         "https://news.google.com/rss/headlines/section/topic/NATION?hl=ko&gl=KR&ceid=KR:ko",
@@ -117,54 +122,72 @@ def _parse_pub_date(entry) -> datetime | None:
     return None
 
 
+def _feed_key(category: str, index: int) -> str:
+    return f"{category} #{index + 1}"
+
+
 def fetch_news_by_category(
     start_time: datetime,
     end_time: datetime,
 ) -> dict[str, list[dict]]:
-    """카테고리별 RSS 뉴스를 수집하고 시간 필터링."""
-    categorized: dict[str, list[dict]] = {}
+    """카테고리별 RSS 뉴스를 수집하고 시간 필터링.
 
+    전체 피드를 병렬로 받고 (피드별 타임아웃), 바뀌지 않은 피드는 직전 파싱 결과를 재사용한다.
+    """
+    started = time.monotonic()
+    feeds = {
+        _feed_key(category, i): url
+        for category, feed_urls in RSS_FEEDS.items()
+        for i, url in enumerate(feed_urls)
+    }
+    collected = get_feed_collector(
+        "ai_briefing", max_workers=RSS_FETCH_WORKERS, read_timeout=RSS_READ_TIMEOUT, budget=RSS_FEED_BUDGET,
+    ).collect(feeds)
+
+    categorized: dict[str, list[dict]] = {}
     for category, feed_urls in RSS_FEEDS.items():
         articles: list[dict] = []
-
-        for url in feed_urls:
-            try:
-                feed = feedparser.parse(url)
-                if feed.bozo and not feed.entries:
-                    logger.warning(f"RSS 파싱 경고 [{category}]: {url}")
+        seen_titles: set[str] = set()
+
+        for i, url in enumerate(feed_urls):
+            feed = collected[_feed_key(category, i)]
+            logger.info(
+                f"  RSS [{feed.name}] {feed.status} {len(feed.entries)}건 "
+                f"(다운로드 {feed.fetch_seconds:.2f}s, 파싱 {feed.parse_seconds:.3f}s)"
+            )
+            if feed.error:
+                logger.warning(f"RSS 수집 실패 [{category}] {url}: {feed.error}")
+
+            for entry in feed.entries:
+                pub = _parse_pub_date(entry)
+
+                # 발행일 없는 기사는 무조건 제외 (구식 기사 혼입 방지)
+                if pub is None:
                     continue
 
-                for entry in feed.entries:
-                    pub = _parse_pub_date(entry)
-
-                    # 발행일 없는 기사는 무조건 제외 (구식 기사 혼입 방지)
-                    if pub is None:
-                        continue
-
-                    # 시간 필터: 커버리지 윈도우 밖이면 제외
-                    if pub < start_time or pub > end_time:
-                        continue
-
-                    title = (entry.get("title") or "").strip()
-                    if not title:
-                        continue
+                # 시간 필터: 커버리지 윈도우 밖이면 제외
+                if pub < start_time or pub > end_time:
+                    continue
 
-                    # 중복 제거 (같은 제목)
-                    if any(a["title"] == title for a in articles):
-                        continue
+                title = (entry.get("title") or "").strip()
+                if not title:
+                    continue
 
-                    articles.append({
-                        "title": title,
-                        "link": entry.get("link", ""),
-                        "published": pub.isoformat() if pub else None,
-                    })
+                # 중복 제거 (같은 제목)
+                if title in seen_titles:
+                    continue
+                seen_titles.add(title)
 
-            except Exception as e:
-                logger.warning(f"RSS 수집 실패 [{category}] {url}: {e}")
+                articles.append({
+                    "title": title,
+                    "link": entry.get("link", ""),
+                    "published": pub.isoformat() if pub else None,
+                })
 
         categorized[category] = articles[:MAX_ARTICLES_PER_CATEGORY]
         logger.info(f"  [{category}] {len(categorized[category])}건 수집")
 
+    logger.info(f"RSS {len(feeds)}개 피드 병렬 수집 ({time.monotonic() - started:.2f}s)")
     return categorized
 
 
@@ -301,24 +324,6 @@ def generate_briefing_with_ai(
 # ══════════════════════════════════════════════════
 #  4. 텔레그램 전송
 # ══════════════════════════════════════════════════
-def _split_text(text: str, limit: int = TELEGRAM_MAX_LENGTH) -> list[str]:
-    """텍스트를 limit 이하 청크로 분할. 줄바꿈 기준으로 자른다."""
-    if len(text) <= limit:
-        return [text]
-    chunks: list[str] = []
-    while text:
-        if len(text) <= limit:
-            chunks.append(text)
-            break
-        # 줄바꿈 기준으로 자를 위치 탐색
-        cut = text.rfind("\n", 0, limit)
-        if cut <= 0:
-            cut = limit
-        chunks.append(text[:cut])
-        text = text[cut:].lstrip("\n")
-    return chunks
-
-
 def send_to_telegram(text: str) -> dict:
     """텔레그램 채널/그룹으로 브리핑 전송. 4096자 초과 시 분할 전송."""
     bot_token = _env("NUREONGI_NEWS_BOT_TOKEN")
@@ -329,24 +334,11 @@ def send_to_telegram(text: str) -> dict:
             "NUREONGI_NEWS_BOT_TOKEN 또는 TELEGRAM_CHAT_ID가 설정되지 않았습니다."
         )
 
-    url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-    chunks = _split_text(text)
-    result = None
-
-    for i, chunk in enumerate(chunks, 1):
-        payload = {
-            "chat_id": chat_id,
-            "text": chunk,
-            "parse_mode": "HTML",
-            "disable_web_page_preview": True,
-        }
-        resp = requests.post(url, json=payload, timeout=30)
-        resp.raise_for_status()
-        result = resp.json()
-        msg_id = result.get('result', {}).get('message_id')
-        logger.info(f"텔레그램 전송 성공 ({i}/{len(chunks)}, message_id: {msg_id})")
-
-    return result
+    result = send_message(bot_token, chat_id, text, parse_mode="HTML", disable_preview=True)
+    if not result.ok:
+        raise RuntimeError(f"텔레그램 전송 실패: {result.error}")
+    logger.info(f"텔레그램 전송 성공 ({result.parts}개 메시지, message_id: {result.message_ids})")
+    return result.response
 
 
 # ══════════════════════════════════════════════════
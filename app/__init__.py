@@ -162,418 +162,41 @@ def create_app(config_name='default'):
     # Import models for Flask-Migrate
     from app import models
 
+    # 요청별 SQL 쿼리 수 집계 (디버그/테스트: X-Query-Count 헤더)
+    from app.utils.query_counter import init_query_counter
+    init_query_counter(app)
+
     # 방문자 추적
     from app.tracking import init_tracking
     init_tracking(app)
 
-    # DB 테이블 자동 생성 + 마이그레이션 보완
-    with app.app_context():
-        db.create_all()
+    # 게시글 조회수 write-behind 카운터
+    from app.utils.view_counter import init_view_counter
+    init_view_counter(app)
 
-        # 뱃지 기본 데이터 시딩
-        try:
-            from app.models.badge import Badge
-            seed_badges = [
-                # 출석 뱃지
-                {'code': 'ATTEND_7', 'name': '7일 출석', 'description': '7일 연속 로그인 달성', 'icon': '🚶', 'badge_type': 'attendance', 'condition_value': 7},
-                {'code': 'ATTEND_30', 'name': '30일 출석', 'description': '30일 연속 로그인 달성', 'icon': '🏃', 'badge_type': 'attendance', 'condition_value': 30},
-                {'code': 'ATTEND_100', 'name': '100일 출석', 'description': '100일 연속 로그인 달성', 'icon': '🔥', 'badge_type': 'attendance', 'condition_value': 100},
-                # 글쓰기 뱃지
-                {'code': 'POST_10', 'name': '게시판 꿈나무', 'description': '게시글 10개 작성', 'icon': '🌱', 'badge_type': 'post', 'condition_value': 10},
-                {'code': 'POST_50', 'name': '게시판 인싸', 'description': '게시글 50개 작성', 'icon': '🎤', 'badge_type': 'post', 'condition_value': 50},
-                {'code': 'POST_100', 'name': '게시판 고인물', 'description': '게시글 100개 작성', 'icon': '👑', 'badge_type': 'post', 'condition_value': 100},
-                # 댓글 뱃지
-                {'code': 'COMMENT_50', 'name': '소통의 시작', 'description': '댓글 50개 작성', 'icon': '💬', 'badge_type': 'comment', 'condition_value': 50},
-                {'code': 'COMMENT_200', 'name': '프로 소통러', 'description': '댓글 200개 작성', 'icon': '🗣️', 'badge_type': 'comment', 'condition_value': 200},
-                # NP 뱃지
-                {'code': 'NP_1000', 'name': '천만 다행', 'description': 'NP 1,000점 달성', 'icon': '💰', 'badge_type': 'np', 'condition_value': 1000},
-                {'code': 'NP_5000', 'name': '오천만 원', 'description': 'NP 5,000점 달성', 'icon': '💸', 'badge_type': 'np', 'condition_value': 5000},
-                {'code': 'NP_10000', 'name': '만수르', 'description': 'NP 10,000점 달성', 'icon': '💎', 'badge_type': 'np', 'condition_value': 10000},
-                # 직군 뱃지
-                {'code': 'JOB_AI', 'name': 'AI 엔지니어', 'description': 'AI 관련 직군 인증', 'icon': '🤖', 'badge_type': 'job', 'condition_value': 0},
-                {'code': 'JOB_DEV', 'name': '개발자', 'description': '개발 관련 직군 인증', 'icon': '💻', 'badge_type': 'job', 'condition_value': 0},
-                {'code': 'JOB_MARKETER', 'name': '마케터', 'description': '마케팅 관련 직군 인증', 'icon': '📈', 'badge_type': 'job', 'condition_value': 0},
-            ]
-            
-            for b_data in seed_badges:
-                if not Badge.query.filter_by(code=b_data['code']).first():
-                    b = Badge(**b_data)
-                    db.session.add(b)
-            db.session.commit()
-            app.logger.info('[Badge] 기본 뱃지 시딩 완료')
-        except Exception as e:
-            db.session.rollback()
-            app.logger.error(f'[Badge] 기본 뱃지 시딩 실패: {e}')
-        # youtube_video_id 컬럼이 없으면 추가 (db.create_all은 기존 테이블에 컬럼 추가 불가)
-        try:
-            db.session.execute(db.text(
-                "ALTER TABLE posts ADD COLUMN youtube_video_id VARCHAR(20)"
-            ))
-            db.session.commit()
-            app.logger.info('posts.youtube_video_id 컬럼 추가 완료')
-        except Exception:
-            db.session.rollback()
-
-        # 부방장 권한 시스템 컬럼 추가
-        for col_sql in [
-            "ALTER TABLE users ADD COLUMN is_vice_admin BOOLEAN DEFAULT FALSE",
-            "ALTER TABLE users ADD COLUMN warning_count INTEGER DEFAULT 0",
-            "ALTER TABLE users ADD COLUMN suspended_until TIMESTAMP",
-        ]:
-            try:
-                db.session.execute(db.text(col_sql))
-                db.session.commit()
-            except Exception:
-                db.session.rollback()
-
-        # 비밀번호 재설정 토큰 컬럼 추가
-        for col_sql in [
-            "ALTER TABLE users ADD COLUMN reset_token VARCHAR(100)",
-            "ALTER TABLE users ADD COLUMN reset_token_expires TIMESTAMP",
-        ]:
-            try:
-                db.session.execute(db.text(col_sql))
-                db.session.commit()
-            except Exception:
-                db.session.rollback()
+    # 단축 URL 클릭 write-behind 기록
+    from app.utils.short_link_clicks import init_short_link_clicks
+    init_short_link_clicks(app)
 
-        # Google 소셜 로그인 컬럼 추가
-        try:
-            db.session.execute(db.text(
-                "ALTER TABLE users ADD COLUMN google_id VARCHAR(100) UNIQUE"
-            ))
-            db.session.commit()
-        except Exception:
-            db.session.rollback()
-
-        # 이메일 인증 컬럼 추가 (기존 유저는 TRUE)
-        for col_sql in [
-            "ALTER TABLE users ADD COLUMN email_verified BOOLEAN DEFAULT TRUE",
-            "ALTER TABLE users ADD COLUMN email_verify_token VARCHAR(100)",
-        ]:
-            try:
-                db.session.execute(db.text(col_sql))
-                db.session.commit()
-            except Exception:
-                db.session.rollback()
+    # 페이지 캐시 (메인 페이지 등)
+    from app.utils.page_cache import init_page_cache
+    init_page_cache(app)
 
-        # 미인증 회원 전원 인증 처리
-        try:
-            db.session.execute(db.text(
-                "UPDATE users SET email_verified = TRUE WHERE email_verified = FALSE OR email_verified IS NULL"
-            ))
-            db.session.commit()
-        except Exception:
-            db.session.rollback()
-
-        # 댓글 대댓글(parent_id) 컬럼 추가
-        try:
-            db.session.execute(db.text(
-                "ALTER TABLE comments ADD COLUMN parent_id INTEGER REFERENCES comments(id)"
-            ))
-            db.session.commit()
-        except Exception:
-            db.session.rollback()
-
-        # news_articles 테이블에 scraped_content 컬럼 추가
-        try:
-            db.session.execute(db.text(
-                "ALTER TABLE news_articles ADD COLUMN scraped_content TEXT"
-            ))
-            db.session.commit()
-        except Exception:
-            db.session.rollback()
-
-        # news_articles 테이블에 is_archived 컬럼 추가
-        try:
-            db.session.execute(db.text(
-                "ALTER TABLE news_articles ADD COLUMN is_archived BOOLEAN DEFAULT FALSE"
-            ))
-            db.session.commit()
-        except Exception:
-            db.session.rollback()
-
-        # [1회성] 기존 기사 전부 아카이브 처리 (24시간 이전 기사)
-        try:
-            db.session.execute(db.text(
-                "UPDATE news_articles SET is_archived = TRUE WHERE is_archived = FALSE AND created_at < NOW() - INTERVAL '24 hours'"
-            ))
-            db.session.commit()
-        except Exception:
-            db.session.rollback()
-
-        # news_articles 테이블에 is_visible 컬럼 추가
-        try:
-            db.session.execute(db.text(
-                "ALTER TABLE news_articles ADD COLUMN is_visible BOOLEAN DEFAULT TRUE"
-            ))
-            db.session.commit()
-        except Exception:
-            db.session.rollback()
-
-        # 오늘자 시사·정치·AI·경제 기사 중 최신 10개 자동 노출
-        try:
-            db.session.execute(db.text("""
-                UPDATE news_articles SET is_visible = TRUE
-                WHERE id IN (
-                    SELECT id FROM news_articles
-                    WHERE created_at >= NOW() - INTERVAL '48 hours'
-                      AND is_archived = FALSE
-                      AND (
-                        title ILIKE '%정치%' OR title ILIKE '%대통령%' OR title ILIKE '%국회%'
-                        OR title ILIKE '%여야%' OR title ILIKE '%민주당%' OR title ILIKE '%국민의힘%'
-                        OR title ILIKE '%AI%' OR title ILIKE '%인공지능%' OR title ILIKE '%ChatGPT%'
-                        OR title ILIKE '%경제%' OR title ILIKE '%금리%' OR title ILIKE '%환율%'
-                        OR title ILIKE '%삼성%' OR title ILIKE '%반도체%' OR title ILIKE '%테슬라%'
-                        OR title ILIKE '%시사%' OR title ILIKE '%검찰%' OR title ILIKE '%외교%'
-                        OR title ILIKE '%트럼프%' OR title ILIKE '%북한%' OR title ILIKE '%안보%'
-                      )
-                    ORDER BY created_at DESC
-                    LIMIT 10
-                )
-            """))
-            db.session.commit()
-        except Exception:
-            db.session.rollback()
-
-        # posts 테이블에 external_url, og_image 컬럼 추가 (누렁이 픽)
-        for col_sql in [
-            "ALTER TABLE posts ADD COLUMN external_url VARCHAR(500)",
-            "ALTER TABLE posts ADD COLUMN og_image VARCHAR(500)",
-        ]:
-            try:
-                db.session.execute(db.text(col_sql))
-                db.session.commit()
-            except Exception:
-                db.session.rollback()
+    # 텔레그램 공용 발송 계층 (실패 메시지 대기열 저장용 앱 등록)
+    from app.utils.telegram_delivery import init_telegram_delivery
+    init_telegram_delivery(app)
 
-        # users 테이블에 job_category 컬럼 추가
-        try:
-            db.session.execute(db.text(
-                "ALTER TABLE users ADD COLUMN job_category VARCHAR(20) DEFAULT 'public'"
-            ))
-            db.session.commit()
-        except Exception:
-            db.session.rollback()
-
-        # users 테이블에 NP 관련 컬럼 추가
-        try:
-            db.session.execute(db.text(
-                "ALTER TABLE users ADD COLUMN total_np INTEGER DEFAULT 0"
-            ))
-            db.session.commit()
-        except Exception:
-            db.session.rollback()
-        try:
-            db.session.execute(db.text(
-                "ALTER TABLE users ADD COLUMN last_login_date DATE"
-            ))
-            db.session.commit()
-        except Exception:
-            db.session.rollback()
-        try:
-            db.session.execute(db.text(
-                "ALTER TABLE users ADD COLUMN login_streak INTEGER DEFAULT 0"
-            ))
-            db.session.commit()
-        except Exception:
-            db.session.rollback()
-
-        # 온보딩 완료 여부 컬럼 추가
-        try:
-            db.session.execute(db.text(
-                "ALTER TABLE users ADD COLUMN onboarding_completed BOOLEAN DEFAULT FALSE"
-            ))
-            db.session.commit()
-        except Exception:
-            db.session.rollback()
-
-        # 첫 댓글 보상 여부 컬럼 추가
-        try:
-            db.session.execute(db.text(
-                "ALTER TABLE users ADD COLUMN first_comment_rewarded BOOLEAN DEFAULT FALSE"
-            ))
-            db.session.commit()
-        except Exception:
-            db.session.rollback()
-
-        # point_history 테이블 생성
-        try:
-            db.session.execute(db.text("""
-                CREATE TABLE IF NOT EXISTS point_history (
-                    id SERIAL PRIMARY KEY,
-                    user_id INTEGER NOT NULL REFERENCES users(id),
-                    action_type VARCHAR(50) NOT NULL,
-                    points INTEGER NOT NULL,
-                    description VARCHAR(200) NOT NULL,
-                    created_at TIMESTAMP DEFAULT NOW()
-                )
-            """))
-            db.session.commit()
-        except Exception:
-            db.session.rollback()
-
-        # [1회성] 기존 가입자 NP 소급 지급
-        try:
-            from app.models.np_point import PointHistory
-            already_done = PointHistory.query.filter_by(action_type='retroactive_bulk').first()
-            if not already_done:
-                from app.models import User, Post, Comment
-                users = User.query.all()
-                for u in users:
-                    np = 100  # 가입 보너스
-                    post_count = Post.query.filter_by(user_id=u.id).count()
-                    comment_count = Comment.query.filter_by(user_id=u.id).count()
-                    np += post_count * 10
-                    np += comment_count * 5
-                    u.total_np = np
-                    db.session.add(PointHistory(
-                        user_id=u.id, action_type='retroactive_bulk',
-                        points=np, description=f'소급지급: 가입100+글{post_count}x10+댓글{comment_count}x5'
-                    ))
-                db.session.commit()
-                app.logger.info('[NP] 기존 가입자 NP 소급 지급 완료')
-        except Exception as e:
-            db.session.rollback()
-            app.logger.error(f'[NP] 소급 지급 오류: {e}')
+    # 기사 본문 추출 서비스 (URL 캐시 저장용 앱 등록)
+    from app.utils.article_extract import init_article_extract
+    init_article_extract(app)
 
-        # [1회성] AESA 게시판 이준석 관련 자동 게시글 삭제
-        try:
-            from app.models import Post
-            lee_posts = Post.query.filter(
-                Post.board_type == 'aesa',
-                db.or_(
-                    Post.title.ilike('%이준석%'),
-                    Post.content.ilike('%이준석%')
-                )
-            ).all()
-            if lee_posts:
-                for p in lee_posts:
-                    db.session.delete(p)
-                db.session.commit()
-                app.logger.info(f'[AESA 정리] 이준석 관련 {len(lee_posts)}건 삭제 완료')
-        except Exception as e:
-            db.session.rollback()
-            app.logger.error(f'[AESA 정리] 삭제 실패: {e}')
+    # DB 테이블 생성 + 스키마 보완/1회성 데이터 정리 (이미 적용된 작업은 건너뜀)
+    from app.startup_tasks import run_startup_tasks
+    run_startup_tasks(app)
 
-    # === 아티클 자동 시딩 (누렁이 픽) ===
-    with app.app_context():
-        try:
-            from app.models.post import Post
-            from app.models import User
-            musk_title = '"돈의 시대가 끝난다?" 일론 머스크가 말하는 \'폭발적 풍요\'의 미래와 5가지 충격적 통찰'
-            if not Post.query.filter_by(title=musk_title, board_type='pick').first():
-                bot_user = User.query.filter_by(nickname='누렁이봇').first()
-                if not bot_user:
-                    bot_user = User.query.filter_by(is_admin=True).first()
-                if bot_user:
-                    # 콘텐츠 파일 직접 읽기 (순환 import 방지)
-                    content_path = os.path.join(
-                        os.path.dirname(__file__), '..', 'scripts', 'seed_musk_article_content.html'
-                    )
-                    with open(content_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    post = Post(
-                        title=musk_title,
-                        content=content,
-                        board_type='pick',
-                        user_id=bot_user.id,
-                    )
-                    db.session.add(post)
-                    db.session.commit()
-                    app.logger.info(f'[아티클 시딩] 머스크 아티클 게시 완료 (post_id={post.id})')
-                    # 텔레그램 알림
-                    try:
-                        from app.utils.telegram_notify import notify_new_post
-                        notify_new_post(post)
-                    except Exception:
-                        pass
-        except Exception as e:
-            db.session.rollback()
-            app.logger.error(f'[아티클 시딩] 실패: {e}')
-
-    # === AESA 브리핑 아티클 시딩 ===
-    with app.app_context():
-        try:
-            from app.models.post import Post
-            from app.models import User
-            aesa_title = '2026 경제·산업 전망 및 글로벌 AI 기술 혁신 브리핑'
-            if not Post.query.filter_by(title=aesa_title, board_type='aesa').first():
-                bot_user = User.query.filter_by(nickname='누렁이봇').first()
-                if not bot_user:
-                    bot_user = User.query.filter_by(is_admin=True).first()
-                if bot_user:
-                    content_path = os.path.join(
-                        os.path.dirname(__file__), '..', 'scripts', 'seed_aesa_briefing_content.html'
-                    )
-                    with open(content_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    post = Post(
-                        title=aesa_title,
-                        content=content,
-                        board_type='aesa',
-                        user_id=bot_user.id,
-                    )
-                    db.session.add(post)
-                    db.session.commit()
-                    app.logger.info(f'[AESA 시딩] 경제·AI 브리핑 게시 완료 (post_id={post.id})')
-        except Exception as e:
-            db.session.rollback()
-            app.logger.error(f'[AESA 시딩] 실패: {e}')
-
-    # === AESA articles 테이블 컬럼 추가 (db.create_all은 기존 테이블에 컬럼 추가 불가) ===
-    with app.app_context():
-        for col_sql in [
-            "ALTER TABLE aesa_articles ADD COLUMN lenses VARCHAR(50)",
-            "ALTER TABLE aesa_articles ADD COLUMN korea_investment_link BOOLEAN DEFAULT FALSE",
-        ]:
-            try:
-                db.session.execute(db.text(col_sql))
-                db.session.commit()
-            except Exception:
-                db.session.rollback()
-
-        # status 컬럼 길이 확장 (기존 VARCHAR(20) → VARCHAR(30))
-        try:
-            db.session.execute(db.text(
-                "ALTER TABLE aesa_articles ALTER COLUMN status TYPE VARCHAR(30)"
-            ))
-            db.session.commit()
-        except Exception:
-            db.session.rollback()
-
-    # === 자유게시판 정리: None 글 + 잘못 배치된 크로스포스팅 글 삭제 ===
-    with app.app_context():
-        try:
-            from app.models.post import Post
-
-            # 1) title이 None/NULL인 글 삭제
-            null_posts = Post.query.filter(
-                db.or_(Post.title == 'None', Post.title == 'none', Post.title.is_(None))
-            ).all()
-            null_count = len(null_posts)
-            for p in null_posts:
-                db.session.delete(p)
-
-            # 2) 자유게시판(free)에 잘못 올라간 크로스포스팅 글 삭제
-            #    (user_id=1이고 external_url이 있는 뉴스성 글)
-            misplaced = Post.query.filter(
-                Post.board_type == 'free',
-                Post.user_id == 1,
-                Post.external_url.isnot(None),
-            ).all()
-            misplaced_count = len(misplaced)
-            for p in misplaced:
-                db.session.delete(p)
-
-            if null_count or misplaced_count:
-                db.session.commit()
-                app.logger.info(
-                    f'[정리] None 글 {null_count}개, 자유게시판 잘못 배치 글 {misplaced_count}개 삭제'
-                )
-        except Exception as e:
-            db.session.rollback()
-            app.logger.error(f'[정리] 자유게시판 정리 실패: {e}')
+    # 게시판 검색 색인 (pg_trgm 인덱스 유무 확인 + 색인 갱신 훅)
+    from app.utils.search import init_search
+    init_search(app)
 
     # Security headers
     @app.after_request
@@ -682,6 +305,50 @@ def create_app(config_name='default'):
         db.session.commit()
         print(f'[시딩] 완료 — {seeded}개 라운지에 첫 글 게시')
 
+    # === Flask CLI: 방문 롤업 백필 ===
+    @app.cli.command('rollup-visits')
+    def rollup_visits_command():
+        """page_visits → visit_rollups 미처리분 전체 집계 (초기 백필용)"""
+        from app.utils.visit_rollup import compact_page_visits
+        total = 0
+        while True:
+            n = compact_page_visits()
+            total += n
+            if not n:
+                break
+        print(f'[롤업] page_visits {total}건 집계 완료')
+
+    # === Flask CLI: 기사 클러스터링 백필 ===
+    @app.cli.command('cluster-articles')
+    def cluster_articles_command():
+        """news_articles 워터마크 이후 미처리분 전체 클러스터링"""
+        from app.utils.clustering import cluster_new_articles
+        total = 0
+        while True:
+            n = cluster_new_articles()
+            total += n
+            if not n:
+                break
+        print(f'[클러스터] 기사 {total}건 처리 완료')
+
+    # === Flask CLI: 시작 작업 상태 ===
+    @app.cli.command('startup-tasks')
+    def startup_tasks_command():
+        """시작 작업 적용 현황 (미적용 작업은 다음 시작 때 실행)"""
+        from app.startup_tasks import TASKS, pending_tasks
+        pending = {name for name, _ in pending_tasks()}
+        for name, _ in TASKS:
+            print(f"  {'⏳' if name in pending else '✅'} {name}")
+        print(f'[시작 작업] 전체 {len(TASKS)}건, 미적용 {len(pending)}건')
+
+    # === Flask CLI: 검색 색인 재구축 ===
+    @app.cli.command('rebuild-search')
+    def rebuild_search_command():
+        """게시글/댓글 전체를 search_documents 에 다시 색인 (복구용 — 평소 누락분은 스케줄러가 채움)"""
+        from app.utils.search import rebuild_index, get_backend
+        total = rebuild_index()
+        print(f'[검색] {total}건 색인 완료 (backend={get_backend()})')
+
     from apscheduler.schedulers.background import BackgroundScheduler
     from apscheduler.triggers.cron import CronTrigger
     from apscheduler.triggers.interval import IntervalTrigger
@@ -697,6 +364,66 @@ def create_app(config_name='default'):
         with app.app_context():
             scoop_job(app.app_context())
 
+    def scheduled_visit_rollup():
+        from app.utils.visit_rollup import compact_page_visits
+        with app.app_context():
+            try:
+                compact_page_visits()
+            except Exception as e:
+                db.session.rollback()
+                app.logger.error(f'[Rollup] 방문 집계 실패: {e}')
+
+    def scheduled_clustering():
+        from app.utils.clustering import cluster_new_articles
+        with app.app_context():
+            try:
+                cluster_new_articles()
+            except Exception as e:
+                db.session.rollback()
+                app.logger.error(f'[Cluster] 기사 클러스터링 실패: {e}')
+
+    def scheduled_vote_reconcile():
+        from app.utils.bias_tally import reconcile_tallies
+        with app.app_context():
+            try:
+                reconcile_tallies()
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                app.logger.error(f'[BiasTally] 투표 집계 보정 실패: {e}')
+
+    def scheduled_analysis_sweep():
+        from app.utils.analysis_jobs import sweep_jobs
+        with app.app_context():
+            try:
+                sweep_jobs(app)
+            except Exception as e:
+                db.session.rollback()
+                app.logger.error(f'[AnalysisJob] 작업 재시도 실패: {e}')
+
+    def scheduled_recurring_cleanups():
+        from app.startup_tasks import run_recurring_cleanups
+        with app.app_context():
+            run_recurring_cleanups(app)
+
+    def scheduled_search_catchup():
+        from app.utils.search import index_new_documents
+        with app.app_context():
+            try:
+                index_new_documents()
+            except Exception as e:
+                db.session.rollback()
+                app.logger.error(f'[Search] 누락 문서 색인 실패: {e}')
+
+    def scheduled_article_cache_prune():
+        from app.utils.article_extract import prune_article_cache
+        with app.app_context():
+            try:
+                prune_article_cache()
+            except Exception as e:
+                db.session.rollback()
+                app.logger.error(f'[ArticleCache] 만료 캐시 정리 실패: {e}')
+
     if not app.debug:
         import fcntl
         lock_file_path = os.path.join(app.root_path, '..', 'scheduler.lock')
@@ -716,6 +443,62 @@ def create_app(config_name='default'):
                 id='scheduled_scoop',
                 replace_existing=True
             )
+            scheduler.add_job(
+                scheduled_visit_rollup,
+                IntervalTrigger(minutes=5, timezone=pytz.utc),
+                id='scheduled_visit_rollup',
+                replace_existing=True,
+                max_instances=1,
+                coalesce=True
+            )
+            scheduler.add_job(
+                scheduled_clustering,
+                IntervalTrigger(minutes=10, timezone=pytz.utc),
+                id='scheduled_clustering',
+                replace_existing=True,
+                max_instances=1,
+                coalesce=True
+            )
+            scheduler.add_job(
+                scheduled_vote_reconcile,
+                IntervalTrigger(hours=1, timezone=pytz.utc),
+                id='scheduled_vote_reconcile',
+                replace_existing=True,
+                max_instances=1,
+                coalesce=True
+            )
+            scheduler.add_job(
+                scheduled_analysis_sweep,
+                IntervalTrigger(minutes=1, timezone=pytz.utc),
+                id='scheduled_analysis_sweep',
+                replace_existing=True,
+                max_instances=1,
+                coalesce=True
+            )
+            scheduler.add_job(
+                scheduled_recurring_cleanups,
+                IntervalTrigger(hours=1, timezone=pytz.utc),
+                id='scheduled_recurring_cleanups',
+                replace_existing=True,
+                max_instances=1,
+                coalesce=True
+            )
+            scheduler.add_job(
+                scheduled_search_catchup,
+                IntervalTrigger(minutes=2, timezone=pytz.utc),
+                id='scheduled_search_catchup',
+                replace_existing=True,
+                max_instances=1,
+                coalesce=True
+            )
+            scheduler.add_job(
+                scheduled_article_cache_prune,
+                IntervalTrigger(hours=1, timezone=pytz.utc),
+                id='scheduled_article_cache_prune',
+                replace_existing=True,
+                max_instances=1,
+                coalesce=True
+            )
             scheduler.start()
             app.logger.info("APScheduler 시작됨 (락 획득 성공)")
         except (BlockingIOError, IOError):
@@ -15,8 +15,16 @@ from app.models.user_bias_log import UserBiasLog
 from app.models.np_point import PointHistory
 from app.models.badge import Badge, UserBadge
 from app.models.scoop_alert import ScoopAlert
-from app.models.aesa_article import AesaArticle
+from app.models.aesa_article import AesaArticle, AesaScoreCache
 from app.models.url_shortener import URLShortener, URLClickLog
+from app.models.visit_rollup import VisitRollup, RollupWatermark
+from app.models.search import SearchDocument, SearchPosting
+from app.models.startup_task import StartupTask
+from app.models.neardup import NearDupBand
+from app.models.analysis_job import AnalysisJob
+from app.models.telegram_outbox import TelegramOutbox
+from app.models.worker_job_stat import WorkerJobStat
+from app.models.article_cache import ArticleCache
 
 __all__ = [
     'User',
@@ -41,6 +49,17 @@ __all__ = [
     'UserBadge',
     'ScoopAlert',
     'AesaArticle',
+    'AesaScoreCache',
     'URLShortener',
     'URLClickLog',
+    'VisitRollup',
+    'RollupWatermark',
+    'SearchDocument',
+    'SearchPosting',
+    'StartupTask',
+    'NearDupBand',
+    'AnalysisJob',
+    'TelegramOutbox',
+    'WorkerJobStat',
+    'ArticleCache',
 ]
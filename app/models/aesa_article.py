@@ -20,3 +20,17 @@ class AesaArticle(db.Model):
 
     def __repr__(self):
         return f'<AesaArticle {self.source} - Score: {self.score}>'
+
+
+class AesaScoreCache(db.Model):
+    """Claude 채점 결과 캐시 — 정규화한 (제목, 요약) 해시 기준 (신디케이션 중복·재시도 시 재채점 방지)"""
+    __tablename__ = 'aesa_score_cache'
+
+    content_hash = db.Column(db.String(64), primary_key=True)
+    result = db.Column(db.Text, nullable=False)          # 파싱된 JSON 결과
+    input_tokens = db.Column(db.Integer, default=0)
+    output_tokens = db.Column(db.Integer, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.now, index=True)
+
+    def __repr__(self):
+        return f'<AesaScoreCache {self.content_hash[:12]}>'
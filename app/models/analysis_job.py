@@ -0,0 +1,40 @@
+from datetime import datetime
+from app import db
+
+
+class AnalysisJob(db.Model):
+    """YouCheck 기사 스크래핑/AI 분석 백그라운드 작업 (app/utils/analysis_jobs.py)"""
+    __tablename__ = 'analysis_jobs'
+
+    id = db.Column(db.Integer, primary_key=True)
+    article_id = db.Column(db.Integer, db.ForeignKey('news_articles.id', ondelete='CASCADE'), nullable=False)
+    kind = db.Column(db.String(20), nullable=False)                 # 'scrape' | 'analyze'
+    status = db.Column(db.String(20), default='queued', nullable=False)  # queued | running | done | error
+    # 진행 중인 작업에만 'kind:article_id' — 같은 기사 중복 작업을 UNIQUE 로 막고 끝나면 NULL
+    active_key = db.Column(db.String(50), unique=True, nullable=True)
+    error = db.Column(db.String(300), nullable=True)
+    attempts = db.Column(db.Integer, default=0)
+    requested_by = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.now)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        db.Index('ix_analysis_jobs_status', 'status', 'created_at'),
+    )
+
+    @property
+    def is_active(self):
+        return self.status in ('queued', 'running')
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'article_id': self.article_id,
+            'kind': self.kind,
+            'status': self.status,
+            'error': self.error,
+        }
+
+    def __repr__(self):
+        return f'<AnalysisJob {self.kind}:{self.article_id} {self.status}>'
@@ -0,0 +1,21 @@
+from datetime import datetime
+from app import db
+
+
+class ArticleCache(db.Model):
+    """기사 본문 추출 캐시 (app/utils/article_extract.py) — 정규화 URL 기준, 본문은 zlib 압축.
+    status='error' 행은 짧은 TTL 의 실패 캐시 (같은 URL 을 곧바로 다시 두드리지 않기 위함)"""
+    __tablename__ = 'article_cache'
+
+    id = db.Column(db.Integer, primary_key=True)
+    url_hash = db.Column(db.String(40), unique=True, nullable=False)   # sha1(정규화 URL)
+    url = db.Column(db.Text, nullable=False)
+    title = db.Column(db.String(500), nullable=True)
+    body = db.Column(db.LargeBinary, nullable=True)
+    method = db.Column(db.String(10), nullable=True)      # static | browser
+    status = db.Column(db.String(10), default='ok', nullable=False)  # ok | error
+    fetched_at = db.Column(db.DateTime, default=datetime.now)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+
+    def __repr__(self):
+        return f'<ArticleCache {self.url[:60]} {self.status}>'
@@ -39,17 +39,35 @@ class ArticleCluster(db.Model):
     title = db.Column(db.String(300), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.now)
 
+    # 비정규화 통계 — app/utils/clustering.refresh_cluster_stats 가 갱신
+    stat_articles = db.Column(db.Integer, nullable=True)          # 기사 수
+    stat_sources = db.Column(db.Text, nullable=True)              # 고유 언론사 JSON 배열
+    stat_political_min = db.Column(db.Float, nullable=True)       # 언론사 정치축 최소
+    stat_political_max = db.Column(db.Float, nullable=True)       # 언론사 정치축 최대
+    stat_updated_at = db.Column(db.DateTime, nullable=True)
+
     articles = db.relationship('NewsArticle', backref='cluster', lazy='dynamic')
 
     @property
     def article_count(self):
+        if self.stat_articles is not None:
+            return self.stat_articles
         return self.articles.count()
 
     @property
     def sources(self):
         """클러스터 내 고유 언론사 목록"""
+        if self.stat_sources is not None:
+            return json.loads(self.stat_sources)
         return list(set(a.source for a in self.articles if a.source))
 
+    @property
+    def political_spread(self):
+        """언론사 정치축 최대-최소 편차 (점수가 없으면 None)"""
+        if self.stat_political_min is None or self.stat_political_max is None:
+            return None
+        return self.stat_political_max - self.stat_political_min
+
 
 class NewsArticle(db.Model):
     __tablename__ = 'news_articles'
@@ -86,6 +104,13 @@ class NewsArticle(db.Model):
     vote_total = db.Column(db.Integer, default=0)
     confidence = db.Column(db.Float, default=0.0)
 
+    # 증분 집계 원본 (가중 합계는 반올림 전 값) — app/utils/bias_tally.py
+    weight_left = db.Column(db.Float, default=0.0)
+    weight_center = db.Column(db.Float, default=0.0)
+    weight_right = db.Column(db.Float, default=0.0)
+    vote_count = db.Column(db.Integer, default=0)
+    expert_votes = db.Column(db.Integer, default=0)
+
     created_at = db.Column(db.DateTime, default=datetime.now)
     submitted_by = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
 
@@ -116,24 +141,20 @@ class NewsArticle(db.Model):
             return 'right'
         return 'center'
 
-    def recalculate(self):
-        votes = self.votes.all()
-        left = center = right = 0
-        for v in votes:
-            w = v.voter.vote_weight
-            if v.bias == 'left':
-                left += w
-            elif v.bias == 'center':
-                center += w
-            else:
-                right += w
-        total = left + center + right
+    def set_tallies(self, left, center, right, count, experts):
+        """가중 합계·투표 수로 표시용 집계와 신뢰도 갱신"""
+        self.weight_left, self.weight_center, self.weight_right = left, center, right
+        self.vote_count, self.expert_votes = count, experts
         self.vote_left = round(left)
         self.vote_center = round(center)
         self.vote_right = round(right)
-        self.vote_total = round(total)
-        expert_count = sum(1 for v in votes if v.voter.verify_tier in ('gold', 'diamond'))
-        self.confidence = min(5.0, (expert_count / max(len(votes), 1)) * 5 + (len(votes) / 50) * 2)
+        self.vote_total = round(left + center + right)
+        self.confidence = min(5.0, (experts / max(count, 1)) * 5 + (count / 50) * 2)
+
+    def recalculate(self):
+        """투표 전체 재집계 (GROUP BY 1회) — 평소에는 app/utils/bias_tally.apply_vote 증분 반영"""
+        from app.utils.bias_tally import reconcile_tallies
+        reconcile_tallies([self.id])
 
 
 class BiasVote(db.Model):
@@ -141,6 +162,8 @@ class BiasVote(db.Model):
 
     id = db.Column(db.Integer, primary_key=True)
     bias = db.Column(db.String(10), nullable=False)
+    weight = db.Column(db.Float, nullable=True)      # 집계에 반영한 가중치 (투표 당시 등급)
+    is_expert = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.now)
 
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
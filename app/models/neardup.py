@@ -0,0 +1,21 @@
+from datetime import datetime
+from app import db
+
+
+class NearDupBand(db.Model):
+    """유사 제목 LSH 밴드 키 (app/utils/neardup.py SQLNearDupIndex 가 관리)"""
+    __tablename__ = 'neardup_bands'
+
+    id = db.Column(db.Integer, primary_key=True)
+    namespace = db.Column(db.String(30), nullable=False)   # 'news_articles' 등
+    band_key = db.Column(db.BigInteger, nullable=False)
+    item_id = db.Column(db.Integer, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.now)  # 원본 행 작성 시각
+
+    __table_args__ = (
+        db.Index('ix_neardup_lookup', 'namespace', 'band_key'),
+        db.Index('ix_neardup_created', 'namespace', 'created_at'),
+    )
+
+    def __repr__(self):
+        return f'<NearDupBand {self.namespace}:{self.item_id}>'
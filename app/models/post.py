@@ -13,6 +13,9 @@ class Post(db.Model):
     external_url = db.Column(db.String(500), nullable=True)   # 누렁이 픽: 외부 링크
     og_image = db.Column(db.String(500), nullable=True)       # 누렁이 픽: OG 이미지 URL
     views = db.Column(db.Integer, default=0)
+    # 비정규화 카운터 — 좋아요/댓글 작성·삭제와 같은 트랜잭션에서 갱신
+    like_count = db.Column(db.Integer, default=0, server_default='0')
+    comment_count = db.Column(db.Integer, default=0, server_default='0')
     created_at = db.Column(db.DateTime, default=datetime.now)
     updated_at = db.Column(db.DateTime, default=datetime.now, onupdate=datetime.now)
 
@@ -28,13 +31,37 @@ class Post(db.Model):
     @property
     def likes_count(self):
         """좋아요 개수"""
+        if self.like_count is not None:
+            return self.like_count
         return self.likes.count()
 
     @property
     def comments_count(self):
         """댓글 개수 (대댓글 포함)"""
+        if self.comment_count is not None:
+            return self.comment_count
         return self.comments.count()
 
+    @staticmethod
+    def bump_counter(post_id, column, delta):
+        """카운터 컬럼을 SQL에서 원자적으로 증감 (commit은 호출자)"""
+        col = getattr(Post, column)
+        Post.query.filter_by(id=post_id).update(
+            {col: db.func.coalesce(col, 0) + delta}, synchronize_session=False
+        )
+
+    @staticmethod
+    def recount_counters(post_ids=None):
+        """like_count/comment_count를 원본 테이블 기준으로 재계산"""
+        from app.models.comment import Comment
+        from app.models.like import Like
+        likes = db.select(db.func.count(Like.id)).where(Like.post_id == Post.id).scalar_subquery()
+        comments = db.select(db.func.count(Comment.id)).where(Comment.post_id == Post.id).scalar_subquery()
+        query = Post.query
+        if post_ids is not None:
+            query = query.filter(Post.id.in_(post_ids))
+        query.update({Post.like_count: likes, Post.comment_count: comments}, synchronize_session=False)
+
     @property
     def shorts_video_id(self):
         """유튜브 쇼츠/일반 URL에서 VIDEO_ID 추출"""
@@ -66,10 +93,10 @@ class Post(db.Model):
         except Exception:
             return ''
 
-    def increment_views(self):
-        """조회수 증가"""
-        self.views = (self.views or 0) + 1
-        db.session.commit()
+    def increment_views(self, viewer=None):
+        """조회수 증가 — write-behind 버퍼에 적재만 하고 DB 쓰기는 플러셔가 일괄 처리"""
+        from app.utils.view_counter import record_view
+        return record_view(self.id, viewer)
 
     def __repr__(self):
         return f'<Post {self.title}>'
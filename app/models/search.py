@@ -0,0 +1,38 @@
+from datetime import datetime
+from app import db
+
+
+class SearchDocument(db.Model):
+    """검색 문서 — 게시글/댓글의 HTML 제거 텍스트 (app/utils/search.py가 관리)"""
+    __tablename__ = 'search_documents'
+
+    id = db.Column(db.Integer, primary_key=True)
+    doc_type = db.Column(db.String(10), nullable=False)   # 'post' | 'comment'
+    doc_id = db.Column(db.Integer, nullable=False)
+    post_id = db.Column(db.Integer, nullable=False, index=True)
+    board_type = db.Column(db.String(20), nullable=True, index=True)
+    title = db.Column(db.String(200), nullable=True)
+    body = db.Column(db.Text, nullable=True)
+    author = db.Column(db.String(50), nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.now)
+
+    __table_args__ = (
+        db.UniqueConstraint('doc_type', 'doc_id', name='uq_search_document'),
+    )
+
+    def __repr__(self):
+        return f'<SearchDocument {self.doc_type}:{self.doc_id}>'
+
+
+class SearchPosting(db.Model):
+    """바이그램 역색인 (pg_trgm을 쓸 수 없는 DB용)"""
+    __tablename__ = 'search_postings'
+
+    term = db.Column(db.String(8), primary_key=True)
+    document_id = db.Column(db.Integer, db.ForeignKey('search_documents.id', ondelete='CASCADE'),
+                            primary_key=True, index=True)
+    field = db.Column(db.String(1), primary_key=True)     # t=제목, b=본문, a=작성자
+    weight = db.Column(db.Integer, default=1)
+
+    def __repr__(self):
+        return f'<SearchPosting {self.term} doc={self.document_id}>'
@@ -0,0 +1,13 @@
+from datetime import datetime
+from app import db
+
+
+class StartupTask(db.Model):
+    """실행 완료된 시작 작업 기록 (app/startup_tasks.py 가 관리)"""
+    __tablename__ = 'startup_tasks'
+
+    name = db.Column(db.String(100), primary_key=True)
+    applied_at = db.Column(db.DateTime, default=datetime.now)
+
+    def __repr__(self):
+        return f'<StartupTask {self.name}>'
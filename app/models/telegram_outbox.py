@@ -0,0 +1,29 @@
+from datetime import datetime
+from app import db
+
+
+class TelegramOutbox(db.Model):
+    """텔레그램 발송 대기열 (app/utils/telegram_delivery.py) — 실패분 재시도로 최소 1회 전달.
+    봇 토큰은 저장하지 않고 봇 id(토큰 ':' 앞부분)로 환경변수에서 다시 찾는다."""
+    __tablename__ = 'telegram_outbox'
+
+    id = db.Column(db.Integer, primary_key=True)
+    bot_id = db.Column(db.String(20), nullable=False)
+    chat_id = db.Column(db.String(64), nullable=False)
+    text = db.Column(db.Text, nullable=False)
+    parse_mode = db.Column(db.String(20), nullable=True)
+    disable_preview = db.Column(db.Boolean, default=True)
+    status = db.Column(db.String(10), default='pending', nullable=False)  # pending | sending | sent | failed
+    attempts = db.Column(db.Integer, default=0)
+    last_error = db.Column(db.String(300), nullable=True)
+    next_attempt_at = db.Column(db.DateTime, default=datetime.now)
+    claimed_at = db.Column(db.DateTime, nullable=True)   # 'sending' 으로 선점한 시각
+    created_at = db.Column(db.DateTime, default=datetime.now)
+    sent_at = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        db.Index('ix_telegram_outbox_due', 'status', 'next_attempt_at'),
+    )
+
+    def __repr__(self):
+        return f'<TelegramOutbox #{self.id} {self.chat_id} {self.status}>'
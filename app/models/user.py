@@ -3,6 +3,10 @@ from flask_login import UserMixin
 from werkzeug.security import generate_password_hash, check_password_hash
 from app import db
 
+# YouCheck 편향 투표 가중치 (인증 등급별) — app/utils/bias_tally.py 재집계 SQL 도 사용
+VOTE_WEIGHTS = {'bronze': 0, 'silver': 1.0, 'gold': 1.5, 'diamond': 2.0}
+EXPERT_TIERS = ('gold', 'diamond')
+
 class User(UserMixin, db.Model):
     __tablename__ = 'users'
 
@@ -70,9 +74,28 @@ class User(UserMixin, db.Model):
 
     @property
     def primary_badge(self):
+        if '_primary_badge' in self.__dict__:
+            return self.__dict__['_primary_badge']
         pb = self.user_badges.filter_by(is_primary=True).first()
         return pb.badge if pb else None
 
+    @staticmethod
+    def preload_primary_badges(users):
+        """여러 유저의 대표 뱃지를 쿼리 1회로 미리 채움 (목록/댓글 렌더링용)"""
+        from app.models.badge import Badge, UserBadge
+        users = [u for u in users if u is not None]
+        if not users:
+            return
+        rows = db.session.query(UserBadge.user_id, Badge).join(
+            Badge, Badge.id == UserBadge.badge_id
+        ).filter(
+            UserBadge.user_id.in_({u.id for u in users}),
+            UserBadge.is_primary == True
+        ).all()
+        badges = {uid: badge for uid, badge in rows}
+        for u in users:
+            u.__dict__['_primary_badge'] = badges.get(u.id)
+
     @property
     def np_grade(self):
         from app.models.np_point import get_grade
@@ -84,8 +107,7 @@ class User(UserMixin, db.Model):
 
     @property
     def vote_weight(self):
-        weights = {'bronze': 0, 'silver': 1.0, 'gold': 1.5, 'diamond': 2.0}
-        return weights.get(self.verify_tier, 0)
+        return VOTE_WEIGHTS.get(self.verify_tier, 0)
 
     @property
     def accuracy_rate(self):
@@ -0,0 +1,38 @@
+from datetime import datetime
+from app import db
+
+
+class VisitRollup(db.Model):
+    """page_visits 시간/일 단위 사전 집계 — 관리자 대시보드 DAU/MAU용"""
+    __tablename__ = 'visit_rollups'
+
+    id = db.Column(db.Integer, primary_key=True)
+    granularity = db.Column(db.String(5), nullable=False)    # 'hour' | 'day'
+    bucket = db.Column(db.DateTime, nullable=False)          # 구간 시작 시각
+    path_prefix = db.Column(db.String(100), nullable=False)  # '*' = 전체
+    pageviews = db.Column(db.Integer, default=0)
+    user_pageviews = db.Column(db.Integer, default=0)        # 로그인 회원
+    anon_pageviews = db.Column(db.Integer, default=0)        # 비로그인
+    ip_sketch = db.Column(db.LargeBinary, nullable=True)     # 고유 IP HyperLogLog
+    user_sketch = db.Column(db.LargeBinary, nullable=True)   # 고유 회원 HyperLogLog
+    updated_at = db.Column(db.DateTime, default=datetime.now, onupdate=datetime.now)
+
+    __table_args__ = (
+        db.UniqueConstraint('granularity', 'bucket', 'path_prefix', name='uq_visit_rollup_bucket'),
+        db.Index('ix_visit_rollup_lookup', 'granularity', 'path_prefix', 'bucket'),
+    )
+
+    def __repr__(self):
+        return f'<VisitRollup {self.granularity} {self.bucket} {self.path_prefix}>'
+
+
+class RollupWatermark(db.Model):
+    """증분 집계 워터마크 — 마지막으로 처리한 원본 행 id"""
+    __tablename__ = 'rollup_watermarks'
+
+    name = db.Column(db.String(50), primary_key=True)
+    last_id = db.Column(db.Integer, default=0, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.now, onupdate=datetime.now)
+
+    def __repr__(self):
+        return f'<RollupWatermark {self.name}={self.last_id}>'
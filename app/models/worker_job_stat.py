@@ -0,0 +1,37 @@
+from datetime import datetime
+from app import db
+
+
+class WorkerJobStat(db.Model):
+    """스케줄러 워커 잡별 실행 지표 스냅샷 (app/utils/job_runtime.py → 하트비트마다 갱신)"""
+    __tablename__ = 'worker_job_stats'
+
+    job_id = db.Column(db.String(100), primary_key=True)
+    runs = db.Column(db.Integer, default=0)
+    errors = db.Column(db.Integer, default=0)
+    avg_seconds = db.Column(db.Float, default=0.0)
+    max_seconds = db.Column(db.Float, default=0.0)
+    last_seconds = db.Column(db.Float, default=0.0)
+    last_thread_delta = db.Column(db.Integer, default=0)
+    total_thread_delta = db.Column(db.Integer, default=0)   # 워커 시작 이후 누적 (0 근처 유지가 정상)
+    threads = db.Column(db.Integer, default=0)              # 스냅샷 시점 워커 전체 스레드 수
+    last_run_at = db.Column(db.DateTime, nullable=True)
+    updated_at = db.Column(db.DateTime, default=datetime.now, onupdate=datetime.now)
+
+    def to_dict(self):
+        return {
+            'job_id': self.job_id,
+            'runs': self.runs,
+            'errors': self.errors,
+            'avg_seconds': self.avg_seconds,
+            'max_seconds': self.max_seconds,
+            'last_seconds': self.last_seconds,
+            'last_thread_delta': self.last_thread_delta,
+            'total_thread_delta': self.total_thread_delta,
+            'threads': self.threads,
+            'last_run_at': self.last_run_at.isoformat() if self.last_run_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+    def __repr__(self):
+        return f'<WorkerJobStat {self.job_id} runs={self.runs}>'
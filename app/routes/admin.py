@@ -2,16 +2,26 @@ from flask import Blueprint, render_template, redirect, url_for, flash, request,
 from flask_login import login_required, current_user
 from functools import wraps
 from datetime import datetime, timedelta
-from sqlalchemy import func, desc, distinct
+from sqlalchemy import func, desc
 from app import db
 from app.models import User, Post, Comment, Like, Vote, VoteResponse, Event, BreakingNews
 from app.models.briefing import Briefing
 from app.models.bias import NewsArticle, BiasVote
-from app.models.page_visit import PageVisit
+
+from app.utils.visit_rollup import daily_series, distinct_visitors, top_prefixes, hourly_series
+from app.utils.search import search_posts, search_comments
+from app.utils.keyset import paginate_keyset
 
 bp = Blueprint('admin', __name__, url_prefix='/admin')
 
 
+def _daily_counts(column, since):
+    """since 이후 일자별 행 수 {'YYYY-MM-DD': count} — GROUP BY 1회"""
+    day = func.date(column)
+    rows = db.session.query(day, func.count()).filter(column >= since).group_by(day).all()
+    return {str(d)[:10]: c for d, c in rows}
+
+
 def admin_required(f):
     """관리자 권한 확인 데코레이터"""
     @wraps(f)
@@ -44,31 +54,22 @@ def dashboard():
     today_briefings = Briefing.query.filter(Briefing.created_at >= today_start).count()
     total_bias_articles = NewsArticle.query.count()
     total_bias_votes = BiasVote.query.count()
-    thirty_days_ago = datetime.now() - timedelta(days=30)
-    if hasattr(User, 'last_login'):
-        mau = User.query.filter(User.last_login >= thirty_days_ago).count()
-    else:
-        mau = 0
+    # 최근 30일 로그인 상태로 방문한 회원 수 (visit_rollups 스케치 병합)
+    _, mau = distinct_visitors(today - timedelta(days=29), today)
 
     today_users = User.query.filter(User.created_at >= today_start).count()
     today_posts = Post.query.filter(Post.created_at >= today_start).count()
     today_comments = Comment.query.filter(Comment.created_at >= today_start).count()
 
-    # 최근 7일 통계 (차트용)
+    # 최근 7일 통계 (차트용) — 일자별 GROUP BY 1회
+    week_start = today - timedelta(days=6)
+    posts_by_day = _daily_counts(Post.created_at, datetime.combine(week_start, datetime.min.time()))
     chart_data = []
     for i in range(6, -1, -1):
         date = today - timedelta(days=i)
-        date_start = datetime.combine(date, datetime.min.time())
-        date_end = datetime.combine(date, datetime.max.time())
-
-        posts_count = Post.query.filter(
-            Post.created_at >= date_start,
-            Post.created_at <= date_end
-        ).count()
-
         chart_data.append({
             'date': date.strftime('%m/%d'),
-            'posts': posts_count
+            'posts': posts_by_day.get(date.isoformat(), 0)
         })
 
     # 인기 게시글 (조회수 기준)
@@ -121,9 +122,14 @@ def users():
             (User.nickname.like(f'%{search}%'))
         )
 
-    pagination = query.order_by(desc(User.created_at)).paginate(
-        page=page, per_page=per_page, error_out=False
-    )
+    if 'page' in request.args:
+        pagination = query.order_by(desc(User.created_at)).paginate(
+            page=page, per_page=per_page, error_out=False
+        )
+    else:
+        pagination = paginate_keyset(query, User.created_at, User.id,
+                                     cursor=request.args.get('cursor'), per_page=per_page,
+                                     count_key=None if search else 'admin:users')
 
     return render_template('admin/users.html',
                           users=pagination.items,
@@ -162,7 +168,13 @@ def delete_user(user_id):
         return redirect(url_for('admin.users'))
 
     nickname = user.nickname
+    # 다른 회원 글에 남긴 댓글·좋아요도 함께 삭제되므로 해당 글의 카운터를 다시 계산
+    affected = {pid for (pid,) in db.session.query(Comment.post_id).filter(Comment.user_id == user.id)}
+    affected |= {pid for (pid,) in db.session.query(Like.post_id).filter(Like.user_id == user.id)}
     db.session.delete(user)
+    db.session.flush()
+    if affected:
+        Post.recount_counters(list(affected))
     db.session.commit()
 
     flash(f'{nickname}님의 계정이 삭제되었습니다.', 'success')
@@ -178,22 +190,23 @@ def posts():
     search = request.args.get('search', '')
     per_page = 20
 
-    query = Post.query
-
-    # 게시판 필터
-    if board_type:
-        query = query.filter_by(board_type=board_type)
-
-    # 검색
+    # 검색 (색인 기반, 관련도순)
     if search:
-        query = query.filter(
-            (Post.title.like(f'%{search}%')) |
-            (Post.content.like(f'%{search}%'))
-        )
-
-    pagination = query.order_by(desc(Post.created_at)).paginate(
-        page=page, per_page=per_page, error_out=False
-    )
+        pagination = search_posts(search, board_type=board_type or None, fields=('t', 'b'),
+                                  include_comments=False, page=page, per_page=per_page)
+    else:
+        query = Post.query
+        # 게시판 필터
+        if board_type:
+            query = query.filter_by(board_type=board_type)
+        if 'page' in request.args:
+            pagination = query.order_by(desc(Post.created_at)).paginate(
+                page=page, per_page=per_page, error_out=False
+            )
+        else:
+            pagination = paginate_keyset(query, Post.created_at, Post.id,
+                                         cursor=request.args.get('cursor'), per_page=per_page,
+                                         count_key=f'admin:posts:{board_type}')
 
     return render_template('admin/posts.html',
                           posts=pagination.items,
@@ -224,15 +237,17 @@ def comments():
     search = request.args.get('search', '')
     per_page = 20
 
-    query = Comment.query
-
-    # 검색
+    # 검색 (색인 기반, 관련도순)
     if search:
-        query = query.filter(Comment.content.like(f'%{search}%'))
-
-    pagination = query.order_by(desc(Comment.created_at)).paginate(
-        page=page, per_page=per_page, error_out=False
-    )
+        pagination = search_comments(search, page=page, per_page=per_page)
+    elif 'page' in request.args:
+        pagination = Comment.query.order_by(desc(Comment.created_at)).paginate(
+            page=page, per_page=per_page, error_out=False
+        )
+    else:
+        pagination = paginate_keyset(Comment.query, Comment.created_at, Comment.id,
+                                     cursor=request.args.get('cursor'), per_page=per_page,
+                                     count_key='admin:comments')
 
     return render_template('admin/comments.html',
                           comments=pagination.items,
@@ -246,7 +261,10 @@ def delete_comment(comment_id):
     """댓글 삭제"""
     comment = Comment.query.get_or_404(comment_id)
 
+    from app.routes.boards import count_comment_subtree
+    removed = count_comment_subtree(comment)
     db.session.delete(comment)
+    Post.bump_counter(comment.post_id, 'comment_count', -removed)
     db.session.commit()
 
     flash('댓글이 삭제되었습니다.', 'success')
@@ -375,65 +393,43 @@ def analytics():
 def api_analytics():
     days = int(request.args.get('days', 30))
     today = datetime.now().date()
+    first_day = today - timedelta(days=days - 1)
+    since = datetime.combine(first_day, datetime.min.time())
+    dates = [first_day + timedelta(days=i) for i in range(days)]
 
-    dau_data = []
-    for i in range(days - 1, -1, -1):
-        date = today - timedelta(days=i)
-        date_start = datetime.combine(date, datetime.min.time())
-        date_end = datetime.combine(date, datetime.max.time())
-        unique_visitors = db.session.query(func.count(distinct(PageVisit.ip_address))).filter(
-            PageVisit.created_at >= date_start, PageVisit.created_at <= date_end).scalar() or 0
-        logged_in = db.session.query(func.count(distinct(PageVisit.user_id))).filter(
-            PageVisit.created_at >= date_start, PageVisit.created_at <= date_end,
-            PageVisit.user_id.isnot(None)).scalar() or 0
-        pageviews = PageVisit.query.filter(
-            PageVisit.created_at >= date_start, PageVisit.created_at <= date_end).count()
-        dau_data.append({'date': date.strftime('%m/%d'), 'visitors': unique_visitors,
-                         'logged_in': logged_in, 'pageviews': pageviews})
-
-    thirty_days_ago = datetime.now() - timedelta(days=30)
-    mau_visitors = db.session.query(func.count(distinct(PageVisit.ip_address))).filter(
-        PageVisit.created_at >= thirty_days_ago).scalar() or 0
-    mau_users = db.session.query(func.count(distinct(PageVisit.user_id))).filter(
-        PageVisit.created_at >= thirty_days_ago, PageVisit.user_id.isnot(None)).scalar() or 0
+    # 방문 통계는 visit_rollups(사전 집계)에서만 읽는다
+    dau_data = daily_series(first_day, today)
+    mau_visitors, mau_users = distinct_visitors(today - timedelta(days=29), today)
 
+    new_users_by_day = _daily_counts(User.created_at, since)
     growth_data = []
-    cumulative = User.query.filter(
-        User.created_at < datetime.combine(today - timedelta(days=days-1), datetime.min.time())).count()
-    for i in range(days - 1, -1, -1):
-        date = today - timedelta(days=i)
-        date_start = datetime.combine(date, datetime.min.time())
-        date_end = datetime.combine(date, datetime.max.time())
-        new_users = User.query.filter(User.created_at >= date_start, User.created_at <= date_end).count()
+    cumulative = User.query.filter(User.created_at < since).count()
+    for date in dates:
+        new_users = new_users_by_day.get(date.isoformat(), 0)
         cumulative += new_users
         growth_data.append({'date': date.strftime('%m/%d'), 'new_users': new_users, 'total_users': cumulative})
 
-    activity_data = []
-    for i in range(days - 1, -1, -1):
-        date = today - timedelta(days=i)
-        date_start = datetime.combine(date, datetime.min.time())
-        date_end = datetime.combine(date, datetime.max.time())
-        posts = Post.query.filter(Post.created_at >= date_start, Post.created_at <= date_end).count()
-        comments = Comment.query.filter(Comment.created_at >= date_start, Comment.created_at <= date_end).count()
-        likes = Like.query.filter(Like.created_at >= date_start, Like.created_at <= date_end).count()
-        activity_data.append({'date': date.strftime('%m/%d'), 'posts': posts,
-                              'comments': comments, 'likes': likes})
-
-    bias_data = []
-    for i in range(days - 1, -1, -1):
-        date = today - timedelta(days=i)
-        date_start = datetime.combine(date, datetime.min.time())
-        date_end = datetime.combine(date, datetime.max.time())
-        articles = NewsArticle.query.filter(
-            NewsArticle.created_at >= date_start, NewsArticle.created_at <= date_end).count()
-        votes = BiasVote.query.filter(
-            BiasVote.created_at >= date_start, BiasVote.created_at <= date_end).count()
-        bias_data.append({'date': date.strftime('%m/%d'), 'articles': articles, 'votes': votes})
+    posts_by_day = _daily_counts(Post.created_at, since)
+    comments_by_day = _daily_counts(Comment.created_at, since)
+    likes_by_day = _daily_counts(Like.created_at, since)
+    activity_data = [{
+        'date': date.strftime('%m/%d'),
+        'posts': posts_by_day.get(date.isoformat(), 0),
+        'comments': comments_by_day.get(date.isoformat(), 0),
+        'likes': likes_by_day.get(date.isoformat(), 0),
+    } for date in dates]
+
+    articles_by_day = _daily_counts(NewsArticle.created_at, since)
+    votes_by_day = _daily_counts(BiasVote.created_at, since)
+    bias_data = [{
+        'date': date.strftime('%m/%d'),
+        'articles': articles_by_day.get(date.isoformat(), 0),
+        'votes': votes_by_day.get(date.isoformat(), 0),
+    } for date in dates]
 
-    today_start = datetime.combine(today, datetime.min.time())
     summary = {
         'total_users': User.query.count(),
-        'today_new_users': User.query.filter(User.created_at >= today_start).count(),
+        'today_new_users': new_users_by_day.get(today.isoformat(), 0),
         'mau_visitors': mau_visitors, 'mau_users': mau_users,
         'today_dau': dau_data[-1]['visitors'] if dau_data else 0,
         'total_posts': Post.query.count(), 'total_comments': Comment.query.count(),
@@ -442,17 +438,62 @@ def api_analytics():
         'total_bias_votes': BiasVote.query.count(),
     }
 
-    top_pages = db.session.query(PageVisit.path, func.count(PageVisit.id).label('hits')).filter(
-        PageVisit.created_at >= thirty_days_ago
-    ).group_by(PageVisit.path).order_by(desc('hits')).limit(10).all()
+    # 롤업은 경로 prefix 단위로만 집계하므로 개별 경로가 아닌 섹션 순위
+    top_sections = top_prefixes(today - timedelta(days=29), today)
 
     return jsonify({
         'summary': summary, 'dau': dau_data, 'growth': growth_data,
         'activity': activity_data, 'bias': bias_data,
-        'top_pages': [{'path': p, 'hits': h} for p, h in top_pages]
+        'top_sections': [{'prefix': p, 'hits': int(h or 0)} for p, h in top_sections],
+        'hourly': hourly_series(datetime.now() - timedelta(hours=24)),
+    })
+
+
+@bp.route('/api/tracking-stats')
+@admin_required
+def api_tracking_stats():
+    """방문/조회수/단축 URL 클릭 버퍼 카운터 (현재 워커 기준)"""
+    from app.tracking import get_visit_buffer_stats
+    from app.utils.view_counter import get_view_counter_stats
+    from app.utils.short_link_clicks import get_short_link_click_stats
+    from scripts.url_shortener import get_link_cache_stats
+    return jsonify({
+        'visits': get_visit_buffer_stats(),
+        'views': get_view_counter_stats(),
+        'short_link_clicks': dict(get_short_link_click_stats(), link_cache=get_link_cache_stats()),
     })
 
 
+@bp.route('/api/cache-stats')
+@admin_required
+def api_cache_stats():
+    """페이지 캐시 hit/miss 카운터 (현재 워커 기준)"""
+    from app.utils.page_cache import get_page_cache
+    return jsonify(get_page_cache().stats())
+
+
+@bp.route('/api/telegram-stats')
+@admin_required
+def api_telegram_stats():
+    """텔레그램 봇별 발송 지표 (현재 프로세스 기준) + 대기열 상태별 건수"""
+    from app.utils.telegram_delivery import get_delivery_stats
+    from app.models.telegram_outbox import TelegramOutbox
+    outbox = dict(
+        db.session.query(TelegramOutbox.status, db.func.count(TelegramOutbox.id))
+        .group_by(TelegramOutbox.status).all()
+    )
+    return jsonify({'bots': get_delivery_stats(), 'outbox': outbox})
+
+
+@bp.route('/api/worker-stats')
+@admin_required
+def api_worker_stats():
+    """스케줄러 워커 잡별 실행 시간·스레드 증감 (워커 하트비트가 5분마다 기록)"""
+    from app.models.worker_job_stat import WorkerJobStat
+    rows = WorkerJobStat.query.order_by(WorkerJobStat.job_id).all()
+    return jsonify([row.to_dict() for row in rows])
+
+
 @bp.route('/fix-double-escape', methods=['POST'])
 @admin_required
 def fix_double_escape():
@@ -1,18 +1,20 @@
 """뉴스 편향 투표 시스템 라우트"""
-import os
-import json
 import traceback
-import difflib
-import requests as http_requests
-from bs4 import BeautifulSoup
 from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify, current_app
 from flask_login import login_required, current_user
 from app import db, csrf
 from app.models.bias import NewsArticle, BiasVote, BoneTransaction, ArticleCluster, get_media_bias
+from app.models.analysis_job import AnalysisJob
+from app.utils.keyset import paginate_keyset
+from app.utils.clustering import cluster_article, refresh_cluster_stats
+from app.utils.bias_tally import apply_vote
+from app.utils.analysis_jobs import enqueue, active_job, recent_failure
 from datetime import datetime, timedelta
 
 bp = Blueprint('bias', __name__, url_prefix='/bias')
 
+CLUSTER_PAGE_SIZE = 100  # 클러스터 비교 화면 최대 기사 수
+
 
 @bp.route('/debug')
 def debug():
@@ -130,16 +132,21 @@ def index():
                 )
             )
 
-        # 오늘의 TOP 10만 표시 (아카이브 모드에서는 200건)
-        display_limit = 200 if show_archive else 10
-        top_ids = [r.id for r in query.order_by(
-            NewsArticle.created_at.desc()
-        ).with_entities(NewsArticle.id).limit(display_limit).all()]
-        articles = NewsArticle.query.filter(
-            NewsArticle.id.in_(top_ids)
-        ).order_by(
-            NewsArticle.created_at.desc()
-        ).paginate(page=page, per_page=10 if not show_archive else 20, error_out=False)
+        if show_archive:
+            # 아카이브: 커서 페이지네이션 (깊은 페이지도 같은 비용)
+            articles = paginate_keyset(query, NewsArticle.created_at, NewsArticle.id,
+                                       cursor=request.args.get('cursor'), per_page=20,
+                                       count_key=f'bias:archive:{tab}')
+        else:
+            # 오늘의 TOP 10만 표시
+            top_ids = [r.id for r in query.order_by(
+                NewsArticle.created_at.desc()
+            ).with_entities(NewsArticle.id).limit(10).all()]
+            articles = NewsArticle.query.filter(
+                NewsArticle.id.in_(top_ids)
+            ).order_by(
+                NewsArticle.created_at.desc()
+            ).paginate(page=page, per_page=10, error_out=False)
         return render_template('bias/index.html', articles=articles, current_tab=tab, show_archive=show_archive)
     except Exception as e:
         current_app.logger.error(f'[BIAS INDEX ERROR] {traceback.format_exc()}')
@@ -179,7 +186,7 @@ def submit():
         )
         db.session.add(article)
         db.session.flush()  # article.id 확보
-        _auto_cluster(article)
+        cluster_article(article)
         current_user.add_bones(2, 'article_submit')
         db.session.commit()
 
@@ -189,42 +196,11 @@ def submit():
     return render_template('bias/submit.html')
 
 
-def _auto_cluster(article):
-    """새 기사를 기존 클러스터에 매칭하거나 새 클러스터 생성"""
-    # 최근 3일 내 기사와 비교
-    cutoff = datetime.now() - timedelta(days=3)
-    recent = NewsArticle.query.filter(
-        NewsArticle.id != article.id,
-        NewsArticle.created_at >= cutoff,
-    ).all()
-
-    best_match = None
-    best_ratio = 0.0
-
-    for other in recent:
-        ratio = difflib.SequenceMatcher(None, article.title, other.title).ratio()
-        if ratio > best_ratio:
-            best_ratio = ratio
-            best_match = other
-
-    if best_ratio >= 0.70 and best_match:
-        if best_match.cluster_id:
-            # 기존 클러스터에 합류
-            article.cluster_id = best_match.cluster_id
-        else:
-            # 새 클러스터 생성, 두 기사 모두 묶기
-            cluster = ArticleCluster(title=best_match.title)
-            db.session.add(cluster)
-            db.session.flush()
-            best_match.cluster_id = cluster.id
-            article.cluster_id = cluster.id
-
-
 @bp.route('/cluster/<int:cluster_id>')
 def cluster_detail(cluster_id):
     """같은 사건 다른 언론사 비교"""
     cluster = ArticleCluster.query.get_or_404(cluster_id)
-    articles = cluster.articles.order_by(NewsArticle.created_at.desc()).all()
+    articles = cluster.articles.order_by(NewsArticle.created_at.desc()).limit(CLUSTER_PAGE_SIZE).all()
     return render_template('bias/cluster.html', cluster=cluster, articles=articles)
 
 
@@ -237,7 +213,9 @@ def detail(article_id):
         user_vote = BiasVote.query.filter_by(
             user_id=current_user.id, article_id=article_id
         ).first()
-    return render_template('bias/detail.html', article=article, user_vote=user_vote)
+    analysis_job = active_job(article.id, 'analyze')
+    return render_template('bias/detail.html', article=article, user_vote=user_vote,
+                           analysis_job=analysis_job)
 
 
 @bp.route('/<int:article_id>/vote', methods=['POST'])
@@ -260,7 +238,9 @@ def vote(article_id):
     ).first()
 
     if existing:
+        old_bias = existing.bias
         existing.bias = bias
+        apply_vote(article, existing, current_user, old_bias)
         flash('투표가 변경되었습니다.', 'success')
     else:
         new_vote = BiasVote(
@@ -269,6 +249,7 @@ def vote(article_id):
             bias=bias
         )
         db.session.add(new_vote)
+        apply_vote(article, new_vote, current_user)
         current_user.add_bones(1, 'bias_vote')
         current_user.total_bias_votes += 1
         # NP 적립
@@ -276,7 +257,6 @@ def vote(article_id):
         np_earned = award_np(current_user, 'youcheck_vote')
         flash(f'투표 완료! +1 🦴 +{np_earned} NP', 'success')
 
-    article.recalculate()
     db.session.commit()
 
     return redirect(url_for('bias.detail', article_id=article_id))
@@ -291,175 +271,39 @@ def delete_article(article_id):
         return redirect(url_for('bias.detail', article_id=article_id))
 
     article = NewsArticle.query.get_or_404(article_id)
+    cluster_id = article.cluster_id
     db.session.delete(article)
+    db.session.flush()
+    # 클러스터 기사 수·언론사 목록에서 삭제된 기사를 빼도록 통계 재계산
+    refresh_cluster_stats([cluster_id])
     db.session.commit()
     flash('기사가 삭제되었습니다.', 'success')
     return redirect(url_for('bias.index'))
 
 
-# --- AI 편향 분석 ---
-
-def _scrape_article(url):
-    """기사 URL에서 본문 텍스트 추출 (urllib 사용)"""
-    import urllib.request
-    req = urllib.request.Request(
-        url,
-        headers={'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)'},
-    )
-    with urllib.request.urlopen(req, timeout=15) as resp:
-        raw = resp.read()
-        charset = resp.headers.get_content_charset() or 'utf-8'
-        html = raw.decode(charset, errors='replace')
-    soup = BeautifulSoup(html, 'lxml')
-
-    # 네이버 뉴스
-    body = soup.select_one('#dic_area, #newsct_article, .newsct_body, article#dic_area')
-    if not body:
-        # 일반 기사 사이트
-        body = soup.select_one('article, .article-body, .article_body, .story-body, #article-body, .news_end')
-    if not body:
-        # 최후 수단: 가장 긴 <p> 그룹
-        paragraphs = soup.find_all('p')
-        text = '\n'.join(p.get_text(strip=True) for p in paragraphs if len(p.get_text(strip=True)) > 30)
-        return text[:5000] if text else ''
-
-    # 불필요 요소 제거
-    for tag in body.select('script, style, .ad, .adsbygoogle, .journalist_area, .byline'):
-        tag.decompose()
-
-    text = body.get_text('\n', strip=True)
-    return text[:5000].encode('utf-8', errors='ignore').decode('utf-8')
-
-
-def _sanitize_text(text):
-    """JSON 직렬화가 불가능한 문자(서로게이트 등) 제거"""
-    if not text:
-        return ''
-    import re
-    # 1) 서로게이트 쌍 제거 (surrogatepass로 인코딩 후 무효 바이트 무시)
-    try:
-        text = text.encode('utf-8', errors='surrogatepass').decode('utf-8', errors='ignore')
-    except Exception:
-        text = text.encode('ascii', errors='ignore').decode('ascii')
-    # 2) 남은 서로게이트 코드포인트 제거 (U+D800~U+DFFF)
-    text = re.sub(r'[\ud800-\udfff]', '', text)
-    # 3) 널 바이트 및 제어 문자 제거 (탭/줄바꿈 제외)
-    text = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f]', '', text)
-    return text
-
-
-def _analyze_with_ai(title, body_text, source=''):
-    """Claude Haiku로 3축 편향 분석 (urllib 사용 — 인코딩 안전)"""
-    import urllib.request
-
-    api_key = os.environ.get('ANTHROPIC_API_KEY', '').strip()
-    if not api_key:
-        raise ValueError('ANTHROPIC_API_KEY 환경변수가 설정되지 않았습니다')
-
-    # 깨진 유니코드 문자 제거
-    title = _sanitize_text(title)
-    body_text = _sanitize_text(body_text)
-    source = _sanitize_text(source)
-
-    prompt = (
-        "다음 한국 뉴스 기사의 편향을 3개 축으로 분석해주세요.\n\n"
-        f"기사 제목: {title}\n"
-        f"언론사: {source}\n"
-        f"기사 본문:\n{body_text}\n\n"
-        "각 축에 대해 -100 ~ +100 점수와 근거를 제시하세요:\n"
-        "1. 정치축 (political): 진보(-100) ↔ 보수(+100)\n"
-        "2. 지정학축 (geopolitical): 친중(-100) ↔ 친미(+100)\n"
-        "3. 경제축 (economic): 노동친화(-100) ↔ 대기업친화(+100)\n\n"
-        '반드시 아래 JSON 형식으로만 응답하세요. 다른 텍스트 없이 JSON만 출력하세요:\n'
-        '{"political": 점수, "geopolitical": 점수, "economic": 점수, "summary": "2~3문장 요약"}'
-    )
-
-    payload = {
-        "model": "claude-haiku-4-5-20251001",
-        "max_tokens": 500,
-        "messages": [{"role": "user", "content": prompt}],
-    }
-    # ensure_ascii=False → 한글을 그대로 UTF-8 출력 (서로게이트 이미 제거됨)
-    data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
-
-    req = urllib.request.Request(
-        "https://api.anthropic.com/v1/messages",
-        data=data,
-        headers={
-            "X-Api-Key": api_key,
-            "Anthropic-Version": "2023-06-01",
-            "Content-Type": "application/json",
-        },
-        method="POST",
-    )
-    with urllib.request.urlopen(req, timeout=30) as resp:
-        message = json.loads(resp.read().decode('utf-8'))
-
-    raw = message['content'][0]['text'].strip()
-    # JSON 블록 추출
-    if '```' in raw:
-        raw = raw.split('```')[1]
-        if raw.startswith('json'):
-            raw = raw[4:]
-        raw = raw.strip()
-
-    result = json.loads(raw)
-
-    # 범위 클램핑
-    for key in ('political', 'geopolitical', 'economic'):
-        val = result.get(key, 0)
-        result[key] = max(-100, min(100, int(val)))
-
-    return result
-
+# --- AI 편향 분석 (백그라운드 작업) ---
 
 @bp.route('/<int:article_id>/analyze', methods=['POST'])
 @login_required
 def analyze(article_id):
-    """AI 편향 분석 실행"""
+    """AI 편향 분석 작업 등록 — 스크래핑·AI 호출은 백그라운드에서 실행"""
     if not current_user.is_admin:
         flash('관리자만 AI 분석을 실행할 수 있습니다.', 'error')
         return redirect(url_for('bias.detail', article_id=article_id))
 
     article = NewsArticle.query.get_or_404(article_id)
+    job = enqueue(current_app._get_current_object(), article.id, 'analyze', current_user.id)
+    if request.accept_mimetypes.best == 'application/json':
+        return jsonify({'ok': True, 'job': job.to_dict()})
+    flash('AI 편향 분석을 시작했습니다. 완료되면 자동으로 반영됩니다.', 'success')
+    return redirect(url_for('bias.detail', article_id=article_id))
 
-    # 1단계: 기사 스크래핑
-    try:
-        body_text = _scrape_article(article.url)
-    except Exception as e:
-        current_app.logger.error(f'[SCRAPE ERROR] {traceback.format_exc()}')
-        flash(f'기사 수집 실패: {type(e).__name__}', 'error')
-        return redirect(url_for('bias.detail', article_id=article_id))
-
-    if not body_text or len(body_text) < 50:
-        flash('기사 본문을 추출할 수 없습니다.', 'error')
-        return redirect(url_for('bias.detail', article_id=article_id))
-
-    # 2단계: AI 분석
-    try:
-        result = _analyze_with_ai(article.title, body_text, article.source or '')
-    except json.JSONDecodeError:
-        flash('AI 응답 파싱 실패. 다시 시도해주세요.', 'error')
-        return redirect(url_for('bias.detail', article_id=article_id))
-    except Exception as e:
-        current_app.logger.error(f'[AI API ERROR] {traceback.format_exc()}')
-        flash(f'AI 분석 실패: {type(e).__name__}', 'error')
-        return redirect(url_for('bias.detail', article_id=article_id))
-
-    # 3단계: DB 저장 (스크래핑 본문도 함께 저장)
-    try:
-        article.article_political = result['political']
-        article.article_geopolitical = result['geopolitical']
-        article.article_economic = result['economic']
-        article.ai_summary = result.get('summary', '')
-        article.scraped_content = body_text[:3000] if body_text else None
-        db.session.commit()
-        flash('AI 편향 분석이 완료되었습니다.', 'success')
-    except Exception as e:
-        current_app.logger.error(f'[DB SAVE ERROR] {traceback.format_exc()}')
-        flash(f'결과 저장 실패: {type(e).__name__}', 'error')
 
-    return redirect(url_for('bias.detail', article_id=article_id))
+@bp.route('/jobs/<int:job_id>')
+def job_status(job_id):
+    """분석 작업 상태 (화면 폴링용)"""
+    job = AnalysisJob.query.get_or_404(job_id)
+    return jsonify({'ok': True, 'job': job.to_dict()})
 
 
 # --- 주간 편향 리포트 ---
@@ -472,8 +316,20 @@ def weekly_report():
         flash('관리자만 접근할 수 있습니다.', 'error')
         return redirect(url_for('bias.index'))
 
-    from app.utils.bias_report import generate_weekly_report
-    report = generate_weekly_report()
+    from app.utils.bias_report import get_report
+    # ?start=2026-01-01&end=2026-01-15 로 임의 기간 조회 (end 날짜 포함)
+    start = end = None
+    try:
+        if request.args.get('start'):
+            start = datetime.strptime(request.args['start'], '%Y-%m-%d')
+        if request.args.get('end'):
+            end = datetime.strptime(request.args['end'], '%Y-%m-%d') + timedelta(days=1)
+    except ValueError:
+        flash('날짜 형식은 YYYY-MM-DD 입니다.', 'error')
+        start = end = None
+    if start and end and start >= end:
+        start = None
+    report = get_report(start, end)
     return render_template('bias/report.html', report=report)
 
 
@@ -501,25 +357,21 @@ def send_report():
 
 @bp.route('/<int:article_id>/preview')
 def article_preview(article_id):
-    """기사 본문 스크래핑 후 미리보기 반환 (캐시됨)"""
+    """기사 본문 미리보기 (캐시된 본문, 없으면 스크래핑 작업 등록)"""
     article = NewsArticle.query.get_or_404(article_id)
 
     # 이미 캐시된 본문이 있으면 바로 반환
     if article.scraped_content:
         return jsonify({'ok': True, 'content': article.scraped_content[:3000]})
 
-    # 없으면 스크래핑 시도
-    try:
-        body_text = _scrape_article(article.url)
-        if body_text and len(body_text) >= 30:
-            article.scraped_content = body_text[:3000]
-            db.session.commit()
-            return jsonify({'ok': True, 'content': body_text[:3000]})
-        else:
-            return jsonify({'ok': False, 'error': '본문을 추출할 수 없습니다.'})
-    except Exception as e:
-        current_app.logger.error(f'[PREVIEW SCRAPE ERROR] {traceback.format_exc()}')
-        return jsonify({'ok': False, 'error': f'스크래핑 실패: {type(e).__name__}'})
+    # 방금 실패한 스크래핑이 있으면 재시도 대기 시간 동안 그 오류를 돌려준다 (폴링마다 재등록 방지)
+    failed = recent_failure(article.id, 'scrape')
+    if failed:
+        return jsonify({'ok': False, 'error': failed.error, 'job': failed.to_dict()})
+
+    # 없으면 백그라운드 스크래핑 등록 — 화면은 pending 동안 다시 요청
+    job = enqueue(current_app._get_current_object(), article.id, 'scrape')
+    return jsonify({'ok': False, 'pending': True, 'job': job.to_dict()})
 
 
 # --- 클릭 트래킹 & 나의 편향 리포트 ---
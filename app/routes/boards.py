@@ -2,7 +2,7 @@ import os
 import re
 import bleach
 from werkzeug.utils import secure_filename
-from flask import Blueprint, render_template, redirect, url_for, flash, request, current_app, jsonify
+from flask import Blueprint, render_template, redirect, url_for, flash, request, current_app, jsonify, abort
 from flask_login import login_required, current_user
 from app import db, csrf
 
@@ -35,9 +35,19 @@ def sanitize_html(html_content):
     )
 from app.utils.telegram_notify import notify_new_post
 from app.models import Post, PostImage, Comment, Like, PostVote, User
+from app.utils.search import search_posts
+from app.utils.keyset import paginate_keyset
 
 bp = Blueprint('boards', __name__, url_prefix='/boards')
 
+# 검색 유형 → 색인 필드 (t=제목, b=본문, a=작성자)
+SEARCH_FIELDS = {
+    'all': ('t', 'b', 'a'),
+    'title': ('t',),
+    'content': ('b',),
+    'author': ('a',),
+}
+
 
 # ── 관리자 API: 게시물 생성 (CSRF 불필요, API 키 인증) ──
 @bp.route('/api/create-post', methods=['POST'])
@@ -219,37 +229,24 @@ def board(board_type):
     search_query = request.args.get('q', '').strip()
     search_type = request.args.get('type', 'all')  # all, title, content, author
 
-    # 기본 쿼리
-    query = Post.query.filter_by(board_type=board_type)
-
     # 검색 적용 (라운지에서는 작성자 검색 비활성화 — 익명)
     if search_query:
-        if search_type == 'title':
-            query = query.filter(Post.title.contains(search_query))
-        elif search_type == 'content':
-            query = query.filter(Post.content.contains(search_query))
-        elif search_type == 'author' and not is_lounge:
-            query = query.join(User).filter(User.nickname.contains(search_query))
-        else:  # all
-            if is_lounge:
-                query = query.filter(
-                    db.or_(
-                        Post.title.contains(search_query),
-                        Post.content.contains(search_query),
-                    )
-                )
-            else:
-                query = query.join(User).filter(
-                    db.or_(
-                        Post.title.contains(search_query),
-                        Post.content.contains(search_query),
-                        User.nickname.contains(search_query)
-                    )
-                )
-
-    # 정렬 및 페이지네이션
-    pagination = query.order_by(Post.created_at.desc())\
-                      .paginate(page=page, per_page=per_page, error_out=False)
+        fields = SEARCH_FIELDS.get(search_type, SEARCH_FIELDS['all'])
+        if is_lounge:
+            fields = tuple(f for f in fields if f != 'a') or SEARCH_FIELDS['all'][:2]
+        pagination = search_posts(search_query, board_type=board_type, fields=fields,
+                                  include_comments=False, page=page, per_page=per_page)
+    elif 'page' in request.args:
+        # 기존 페이지 번호 링크 호환 (OFFSET)
+        pagination = Post.query.filter_by(board_type=board_type)\
+                          .order_by(Post.created_at.desc())\
+                          .paginate(page=page, per_page=per_page, error_out=False)
+    else:
+        # 커서 페이지네이션 — ix_posts_board_created 인덱스 범위 스캔
+        pagination = paginate_keyset(Post.query.filter_by(board_type=board_type),
+                                     Post.created_at, Post.id,
+                                     cursor=request.args.get('cursor'), per_page=per_page,
+                                     count_key=f'posts:{board_type}')
 
     posts = pagination.items
 
@@ -416,31 +413,70 @@ def write(board_type):
                          board_name=BOARD_NAMES[board_type])
 
 
+def load_post_detail(post_id, user_id=None):
+    """게시글 상세 데이터를 고정된 쿼리 수(4회)로 로드
+
+    1) 게시글 + 작성자 + 추천/비추천 집계 + 현재 유저 투표
+    2) 이미지 (순서대로)
+    3) 댓글 전체 + 작성자
+    4) 작성자·댓글 작성자 대표 뱃지
+    """
+    from sqlalchemy.orm import joinedload, contains_eager
+
+    up = db.select(db.func.count(PostVote.id)).where(
+        PostVote.post_id == Post.id, PostVote.vote_type == 'up').scalar_subquery()
+    down = db.select(db.func.count(PostVote.id)).where(
+        PostVote.post_id == Post.id, PostVote.vote_type == 'down').scalar_subquery()
+    if user_id:
+        mine = db.select(PostVote.vote_type).where(
+            PostVote.post_id == Post.id, PostVote.user_id == user_id).limit(1).scalar_subquery()
+    else:
+        mine = db.literal(None)
+
+    row = db.session.query(Post, up, down, mine).outerjoin(Post.author)\
+        .options(contains_eager(Post.author))\
+        .filter(Post.id == post_id).first()
+    if row is None:
+        return None
+    post, up_count, down_count, user_vote = row
+
+    images = PostImage.query.filter_by(post_id=post.id).order_by(PostImage.order).all()
+
+    comments = Comment.query.options(joinedload(Comment.author))\
+        .filter_by(post_id=post.id).order_by(Comment.created_at).all()
+    root_comments = [c for c in comments if c.parent_id is None]
+    replies = {}
+    for c in comments:
+        if c.parent_id is not None:
+            replies.setdefault(c.parent_id, []).append(c)
+
+    User.preload_primary_badges([post.author] + [c.author for c in comments])
+
+    return {
+        'post': post,
+        'images': images,
+        'root_comments': root_comments,
+        'replies': replies,
+        'up_count': up_count or 0,
+        'down_count': down_count or 0,
+        'user_vote': user_vote,
+    }
+
+
 @bp.route('/<board_type>/<int:post_id>')
 def view(board_type, post_id):
     """게시글 조회"""
-    post = Post.query.get_or_404(post_id)
+    detail = load_post_detail(
+        post_id, current_user.id if current_user.is_authenticated else None
+    )
+    if detail is None:
+        abort(404)
+    post = detail['post']
 
     # 게시판 타입 확인
     if post.board_type != board_type:
         return redirect(url_for('boards.view', board_type=post.board_type, post_id=post_id))
 
-    # 조회수 증가
-    post.increment_views()
-
-    youtube_embed_url = None
-    youtube_id = extract_youtube_id(post.youtube_url)
-    if youtube_id:
-        youtube_embed_url = f'https://www.youtube.com/embed/{youtube_id}'
-
-    # 추천/비추천 데이터
-    up_count = PostVote.query.filter_by(post_id=post.id, vote_type='up').count()
-    down_count = PostVote.query.filter_by(post_id=post.id, vote_type='down').count()
-    user_vote = None
-    if current_user.is_authenticated:
-        vote = PostVote.query.filter_by(post_id=post.id, user_id=current_user.id).first()
-        user_vote = vote.vote_type if vote else None
-
     is_lounge = _is_lounge_board(board_type)
 
     # 라운지 비로그인 접근 시 로그인 유도
@@ -453,8 +489,24 @@ def view(board_type, post_id):
         flash('해당 직군 인증 회원만 접근 가능합니다.', 'warning')
         return redirect(url_for('boards.lounge_hub'))
 
+    # 조회수 증가 (요청 경로에서는 DB 쓰기 없음, 같은 조회자는 일정 시간 1회)
+    from app.utils.view_counter import viewer_key
+    post.increment_views(viewer_key(
+        current_user.id if current_user.is_authenticated else None,
+        request.remote_addr, request.user_agent.string,
+    ))
+
+    youtube_embed_url = None
+    youtube_id = extract_youtube_id(post.youtube_url)
+    if youtube_id:
+        youtube_embed_url = f'https://www.youtube.com/embed/{youtube_id}'
+
     return render_template('boards/view.html', post=post, youtube_embed_url=youtube_embed_url,
-                           up_count=up_count, down_count=down_count, user_vote=user_vote,
+                           images=detail['images'],
+                           root_comments=detail['root_comments'],
+                           replies_by_parent=detail['replies'],
+                           up_count=detail['up_count'], down_count=detail['down_count'],
+                           user_vote=detail['user_vote'],
                            board_name=BOARD_NAMES.get(board_type, board_type),
                            is_lounge=is_lounge,
                            lounge_badge=LOUNGE_BADGES.get(board_type, ''),
@@ -586,6 +638,20 @@ def delete_post(board_type, post_id):
 
 # ===== 댓글 관련 라우트 =====
 
+def count_comment_subtree(comment):
+    """삭제 시 cascade로 함께 지워질 댓글 수 (본인 + 모든 하위 대댓글)"""
+    rows = db.session.query(Comment.id, Comment.parent_id).filter_by(post_id=comment.post_id).all()
+    children = {}
+    for cid, pid in rows:
+        children.setdefault(pid, []).append(cid)
+    count, stack = 0, [comment.id]
+    while stack:
+        cid = stack.pop()
+        count += 1
+        stack.extend(children.get(cid, ()))
+    return count
+
+
 @bp.route('/<board_type>/<int:post_id>/comment', methods=['POST'])
 @login_required
 def add_comment(board_type, post_id):
@@ -615,6 +681,7 @@ def add_comment(board_type, post_id):
         parent_id=parent_id
     )
     db.session.add(comment)
+    Post.bump_counter(post_id, 'comment_count', 1)
 
     # NP 적립
     from app.models.np_point import award_np
@@ -678,7 +745,9 @@ def delete_comment(board_type, post_id, comment_id):
 
     # 댓글 삭제 (cascade로 대댓글도 자동 삭제)
     try:
+        removed = count_comment_subtree(comment)
         db.session.delete(comment)
+        Post.bump_counter(comment.post_id, 'comment_count', -removed)
         db.session.commit()
     except Exception as e:
         db.session.rollback()
@@ -707,6 +776,7 @@ def toggle_like(board_type, post_id):
     if existing_like:
         # 좋아요 취소
         db.session.delete(existing_like)
+        Post.bump_counter(post_id, 'like_count', -1)
         db.session.commit()
         liked = False
     else:
@@ -716,6 +786,7 @@ def toggle_like(board_type, post_id):
             post_id=post_id
         )
         db.session.add(new_like)
+        Post.bump_counter(post_id, 'like_count', 1)
         db.session.commit()
         liked = True
 
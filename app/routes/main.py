@@ -1,4 +1,5 @@
-from flask import Blueprint, render_template, send_file, send_from_directory, make_response, request
+from flask import Blueprint, render_template, send_file, send_from_directory, make_response, request, session
+from flask_login import current_user
 from app.models.bias import NewsArticle
 from app.models.briefing import Briefing
 from app.models.post import Post
@@ -8,39 +9,54 @@ from app.models.comment import Comment
 from app import db
 from datetime import datetime, timedelta
 from sqlalchemy import func, or_
-import time
+from app.utils.page_cache import get_page_cache
 
 bp = Blueprint('main', __name__)
 
-# ── 메인 페이지 캐시 (60초 TTL) ──
-_index_cache = {'data': None, 'expires': 0}
+# ── 메인 페이지 캐시 (60초 TTL + 5분 stale, 글/브리핑 작성 시 태그 무효화) ──
 INDEX_CACHE_TTL = 60
+INDEX_CACHE_STALE = 300
+
+
+def _heat_score_expr(now):
+    """Heat Score SQL 식 (PostgreSQL 전용, 그 외 DB는 None)"""
+    if db.engine.dialect.name != 'postgresql':
+        return None
+    hours = func.extract('epoch', db.literal(now) - Post.created_at) / 3600.0
+    numerator = (func.coalesce(Post.like_count, 0) * 5
+                 + func.coalesce(Post.comment_count, 0) * 3
+                 + func.coalesce(Post.views, 0) * 0.1)
+    return numerator / func.power(hours + 2, 1.2)
 
 
 def get_hot_posts(limit=10):
     """🔥 실시간 베스트 - Heat Score 알고리즘
 
     Heat = (likes×5 + comments×3 + views×0.1) / (hours+2)^1.2
-    """
-    cutoff = datetime.now() - timedelta(hours=48)
 
-    posts = Post.query.filter(
+    posts.like_count/comment_count 비정규화 카운터로 계산하므로
+    PostgreSQL에서는 점수 계산·정렬·LIMIT까지 쿼리 1회로 끝난다.
+    """
+    now = datetime.now()
+    cutoff = now - timedelta(hours=48)
+    base = Post.query.filter(
         Post.created_at >= cutoff,
-        Post.board_type != 'notice'
-    ).all()
+        Post.board_type != 'notice',
+        (func.coalesce(Post.like_count, 0) + func.coalesce(Post.comment_count, 0)
+         + func.coalesce(Post.views, 0)) > 0
+    )
+
+    score = _heat_score_expr(now)
+    if score is not None:
+        return base.order_by(score.desc()).limit(limit).all()
 
+    # SQLite 등 power() 미지원 DB: 같은 쿼리 1회 결과를 파이썬에서 정렬
     scored = []
-    now = datetime.now()
-    for post in posts:
+    for post in base.all():
         hours = (now - post.created_at).total_seconds() / 3600
-        likes = post.likes_count
-        comments = post.comments_count
-        views = post.views or 0
-
-        score = (likes * 5 + comments * 3 + views * 0.1) / ((hours + 2) ** 1.2)
-
-        if score > 0:
-            scored.append((post, score))
+        heat = ((post.like_count or 0) * 5 + (post.comment_count or 0) * 3
+                + (post.views or 0) * 0.1) / ((hours + 2) ** 1.2)
+        scored.append((post, heat))
 
     scored.sort(key=lambda x: x[1], reverse=True)
     return [item[0] for item in scored[:limit]]
@@ -154,22 +170,35 @@ def _build_index_data():
 
 @bp.route('/')
 def index():
-    """메인 페이지 (60초 풀 HTML 캐시)"""
-    global _index_cache
-    now = time.time()
-
-    if _index_cache['data'] is None or now > _index_cache['expires']:
-        t0 = time.time()
-        data = _build_index_data()
-        html = render_template('main/index.html', **data)
-        elapsed = time.time() - t0
-        print(f'[PERF] 메인 페이지 빌드: {elapsed:.2f}초 (DB+렌더링)')
-        _index_cache = {'data': html, 'expires': now + INDEX_CACHE_TTL}
+    """메인 페이지 (공유 풀 HTML 캐시)"""
+    # 플래시 메시지가 대기 중이면 캐시에 섞이지 않도록 직접 렌더링
+    if session.get('_flashes'):
+        return render_template('main/index.html', **_build_index_data())
+
+    # 로그인 상태에 따라 헤더가 달라지므로 비로그인은 공용 키, 회원은 개인 키
+    if current_user.is_authenticated:
+        key = f'index:user:{current_user.id}'
     else:
-        html = _index_cache['data']
-        print('[PERF] 메인 페이지 캐시 HIT')
+        key = 'index:anon'
+
+    html, etag = get_page_cache().get_or_build(
+        key,
+        lambda: render_template('main/index.html', **_build_index_data()),
+        ttl=INDEX_CACHE_TTL,
+        stale_ttl=INDEX_CACHE_STALE,
+        tags=('posts', 'briefings'),
+    )
 
-    return html
+    if etag in request.if_none_match:
+        get_page_cache().count_not_modified()
+        resp = make_response('', 304)
+    else:
+        resp = make_response(html)
+    resp.set_etag(etag)
+    # 회원별 HTML이 공유 캐시(프록시)에 저장되지 않도록
+    resp.headers['Cache-Control'] = 'private, no-cache'
+    resp.headers['Vary'] = 'Cookie'
+    return resp
 
 
 @bp.route('/methodology')
@@ -0,0 +1,543 @@
+"""버전 관리되는 시작 작업 (스키마 보완 + 1회성 데이터 정리)
+
+create_app() 에서 매번 돌던 ALTER TABLE / 데이터 정리 / 시딩을 이름 붙은 작업으로
+등록하고, 실행이 끝난 작업은 startup_tasks 테이블에 기록해 다시 돌리지 않는다.
+
+- 빠른 경로: 기록된 작업 목록(SELECT 1회)이 등록된 작업 + 현재 모델 스키마
+  지문(create_all:<hash>)을 모두 포함하면 아무 것도 하지 않는다.
+- 느린 경로: 프로세스 간 락(PostgreSQL advisory lock / 파일 락)을 잡고
+  다시 확인한 뒤 밀린 작업만 순서대로 1번씩 실행한다.
+
+새 작업은 목록 맨 아래에 새 이름으로 추가한다 (기존 작업 이름/순서 변경 금지).
+예외를 던진 작업은 기록되지 않으므로 다음 시작 때 다시 시도된다.
+
+예전처럼 계속 걸러야 하는 데이터 정리(@recurring_cleanup)는 시작 작업으로 한 번 돌고,
+이후로는 스케줄러가 run_recurring_cleanups() 로 주기적으로 다시 실행한다.
+"""
+import os
+import hashlib
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from app import db
+
+ADVISORY_LOCK_KEY = 4242_0009
+
+TASKS = []
+RECURRING_CLEANUPS = []
+
+
+def startup_task(name):
+    def decorator(fn):
+        TASKS.append((name, fn))
+        return fn
+    return decorator
+
+
+def recurring_cleanup(fn):
+    """시작 작업 중 새로 들어온 행에도 계속 적용해야 하는 정리 작업 표시"""
+    RECURRING_CLEANUPS.append(fn)
+    return fn
+
+
+def run_recurring_cleanups(app):
+    """주기 정리 작업 실행 (스케줄러, app context 안에서 호출). 실패한 작업 수 반환"""
+    failed = 0
+    for fn in RECURRING_CLEANUPS:
+        try:
+            fn(app)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            failed += 1
+            app.logger.error(f'[Cleanup] {fn.__name__} 실패: {e}')
+    return failed
+
+
+def schema_fingerprint():
+    """모델 메타데이터(테이블·컬럼) 지문 — 모델이 바뀌면 create_all 을 다시 돈다"""
+    parts = []
+    for table in sorted(db.metadata.tables.values(), key=lambda t: t.name):
+        parts.append(table.name + ':' + ','.join(sorted(c.name for c in table.columns)))
+    return hashlib.sha1('|'.join(parts).encode()).hexdigest()[:12]
+
+
+def _applied_names():
+    try:
+        with db.engine.connect() as conn:
+            return {row[0] for row in conn.execute(db.text('SELECT name FROM startup_tasks'))}
+    except Exception:
+        return set()    # 첫 실행 (테이블 없음)
+
+
+@contextmanager
+def _startup_lock(app):
+    """여러 워커/봇이 동시에 시작해도 작업은 한 프로세스만 실행"""
+    if db.engine.dialect.name == 'postgresql':
+        with db.engine.connect() as conn:
+            conn.execute(db.text('SELECT pg_advisory_lock(:k)'), {'k': ADVISORY_LOCK_KEY})
+            try:
+                yield
+            finally:
+                conn.execute(db.text('SELECT pg_advisory_unlock(:k)'), {'k': ADVISORY_LOCK_KEY})
+                conn.commit()
+    else:
+        import fcntl
+        lock_path = os.path.join(app.root_path, '..', 'startup.lock')
+        with open(lock_path, 'w') as lock_file:
+            fcntl.lockf(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.lockf(lock_file, fcntl.LOCK_UN)
+
+
+def pending_tasks(applied=None):
+    applied = _applied_names() if applied is None else applied
+    pending = []
+    create_all_name = f'create_all:{schema_fingerprint()}'
+    if create_all_name not in applied:
+        pending.append((create_all_name, lambda app: db.create_all()))
+    pending += [(name, fn) for name, fn in TASKS if name not in applied]
+    return pending
+
+
+def run_startup_tasks(app):
+    """밀린 시작 작업 실행. 실행한 작업 수 반환 (빠른 경로는 0)"""
+    with app.app_context():
+        if not pending_tasks():
+            return 0
+
+        with _startup_lock(app):
+            # 락 대기 중 다른 프로세스가 끝냈을 수 있으므로 다시 확인
+            pending = pending_tasks()
+            done = 0
+            for name, fn in pending:
+                try:
+                    fn(app)
+                    db.session.commit()
+                    db.session.execute(
+                        db.text('INSERT INTO startup_tasks (name, applied_at) VALUES (:n, :t)'),
+                        {'n': name, 't': datetime.now()},
+                    )
+                    db.session.commit()
+                    done += 1
+                except Exception as e:
+                    db.session.rollback()
+                    app.logger.error(f'[Startup] {name} 실패 (다음 시작 때 재시도): {e}')
+            if done:
+                app.logger.info(f'[Startup] 시작 작업 {done}/{len(pending)}건 실행')
+            return done
+
+
+def _try_sql(*statements):
+    """이미 적용된 경우(컬럼 존재 등) 실패를 무시하는 DDL/DML"""
+    for sql in statements:
+        try:
+            db.session.execute(db.text(sql))
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+
+
+def _bot_user():
+    from app.models import User
+    return User.query.filter_by(nickname='누렁이봇').first() or User.query.filter_by(is_admin=True).first()
+
+
+# ── 작업 목록 (추가는 맨 아래에만) ──
+
+@startup_task('0001_seed_badges')
+def seed_badges(app):
+    from app.models.badge import Badge
+    seed_badges = [
+        # 출석 뱃지
+        {'code': 'ATTEND_7', 'name': '7일 출석', 'description': '7일 연속 로그인 달성', 'icon': '🚶', 'badge_type': 'attendance', 'condition_value': 7},
+        {'code': 'ATTEND_30', 'name': '30일 출석', 'description': '30일 연속 로그인 달성', 'icon': '🏃', 'badge_type': 'attendance', 'condition_value': 30},
+        {'code': 'ATTEND_100', 'name': '100일 출석', 'description': '100일 연속 로그인 달성', 'icon': '🔥', 'badge_type': 'attendance', 'condition_value': 100},
+        # 글쓰기 뱃지
+        {'code': 'POST_10', 'name': '게시판 꿈나무', 'description': '게시글 10개 작성', 'icon': '🌱', 'badge_type': 'post', 'condition_value': 10},
+        {'code': 'POST_50', 'name': '게시판 인싸', 'description': '게시글 50개 작성', 'icon': '🎤', 'badge_type': 'post', 'condition_value': 50},
+        {'code': 'POST_100', 'name': '게시판 고인물', 'description': '게시글 100개 작성', 'icon': '👑', 'badge_type': 'post', 'condition_value': 100},
+        # 댓글 뱃지
+        {'code': 'COMMENT_50', 'name': '소통의 시작', 'description': '댓글 50개 작성', 'icon': '💬', 'badge_type': 'comment', 'condition_value': 50},
+        {'code': 'COMMENT_200', 'name': '프로 소통러', 'description': '댓글 200개 작성', 'icon': '🗣️', 'badge_type': 'comment', 'condition_value': 200},
+        # NP 뱃지
+        {'code': 'NP_1000', 'name': '천만 다행', 'description': 'NP 1,000점 달성', 'icon': '💰', 'badge_type': 'np', 'condition_value': 1000},
+        {'code': 'NP_5000', 'name': '오천만 원', 'description': 'NP 5,000점 달성', 'icon': '💸', 'badge_type': 'np', 'condition_value': 5000},
+        {'code': 'NP_10000', 'name': '만수르', 'description': 'NP 10,000점 달성', 'icon': '💎', 'badge_type': 'np', 'condition_value': 10000},
+        # 직군 뱃지
+        {'code': 'JOB_AI', 'name': 'AI 엔지니어', 'description': 'AI 관련 직군 인증', 'icon': '🤖', 'badge_type': 'job', 'condition_value': 0},
+        {'code': 'JOB_DEV', 'name': '개발자', 'description': '개발 관련 직군 인증', 'icon': '💻', 'badge_type': 'job', 'condition_value': 0},
+        {'code': 'JOB_MARKETER', 'name': '마케터', 'description': '마케팅 관련 직군 인증', 'icon': '📈', 'badge_type': 'job', 'condition_value': 0},
+    ]
+    existing = {code for (code,) in db.session.query(Badge.code).all()}
+    for b_data in seed_badges:
+        if b_data['code'] not in existing:
+            db.session.add(Badge(**b_data))
+    db.session.commit()
+    app.logger.info('[Badge] 기본 뱃지 시딩 완료')
+
+
+@startup_task('0002_posts_youtube_video_id')
+def add_posts_youtube_video_id(app):
+    _try_sql("ALTER TABLE posts ADD COLUMN youtube_video_id VARCHAR(20)")
+
+
+@startup_task('0003_users_vice_admin_columns')
+def add_users_vice_admin_columns(app):
+    # 부방장 권한 시스템
+    _try_sql(
+        "ALTER TABLE users ADD COLUMN is_vice_admin BOOLEAN DEFAULT FALSE",
+        "ALTER TABLE users ADD COLUMN warning_count INTEGER DEFAULT 0",
+        "ALTER TABLE users ADD COLUMN suspended_until TIMESTAMP",
+    )
+
+
+@startup_task('0004_users_reset_token_columns')
+def add_users_reset_token_columns(app):
+    # 비밀번호 재설정 토큰
+    _try_sql(
+        "ALTER TABLE users ADD COLUMN reset_token VARCHAR(100)",
+        "ALTER TABLE users ADD COLUMN reset_token_expires TIMESTAMP",
+    )
+
+
+@startup_task('0005_users_google_id')
+def add_users_google_id(app):
+    # Google 소셜 로그인
+    _try_sql("ALTER TABLE users ADD COLUMN google_id VARCHAR(100) UNIQUE")
+
+
+@startup_task('0006_users_email_verify_columns')
+def add_users_email_verify_columns(app):
+    # 이메일 인증 (기존 유저는 TRUE)
+    _try_sql(
+        "ALTER TABLE users ADD COLUMN email_verified BOOLEAN DEFAULT TRUE",
+        "ALTER TABLE users ADD COLUMN email_verify_token VARCHAR(100)",
+    )
+
+
+@startup_task('0007_verify_existing_users')
+def verify_existing_users(app):
+    # [1회성] 미인증 회원 전원 인증 처리
+    _try_sql("UPDATE users SET email_verified = TRUE WHERE email_verified = FALSE OR email_verified IS NULL")
+
+
+@startup_task('0008_comments_parent_id')
+def add_comments_parent_id(app):
+    # 댓글 대댓글
+    _try_sql("ALTER TABLE comments ADD COLUMN parent_id INTEGER REFERENCES comments(id)")
+
+
+@startup_task('0009_news_articles_columns')
+def add_news_articles_columns(app):
+    _try_sql(
+        "ALTER TABLE news_articles ADD COLUMN scraped_content TEXT",
+        "ALTER TABLE news_articles ADD COLUMN is_archived BOOLEAN DEFAULT FALSE",
+        "ALTER TABLE news_articles ADD COLUMN is_visible BOOLEAN DEFAULT TRUE",
+    )
+
+
+@startup_task('0010_archive_old_articles')
+@recurring_cleanup
+def archive_old_articles(app):
+    # 24시간 지난 기사 아카이브 처리
+    _try_sql("UPDATE news_articles SET is_archived = TRUE WHERE is_archived = FALSE AND created_at < NOW() - INTERVAL '24 hours'")
+
+
+@startup_task('0011_show_recent_articles')
+def show_recent_articles(app):
+    # [1회성] 오늘자 시사·정치·AI·경제 기사 중 최신 10개 노출
+    _try_sql("""
+        UPDATE news_articles SET is_visible = TRUE
+        WHERE id IN (
+            SELECT id FROM news_articles
+            WHERE created_at >= NOW() - INTERVAL '48 hours'
+              AND is_archived = FALSE
+              AND (
+                title ILIKE '%정치%' OR title ILIKE '%대통령%' OR title ILIKE '%국회%'
+                OR title ILIKE '%여야%' OR title ILIKE '%민주당%' OR title ILIKE '%국민의힘%'
+                OR title ILIKE '%AI%' OR title ILIKE '%인공지능%' OR title ILIKE '%ChatGPT%'
+                OR title ILIKE '%경제%' OR title ILIKE '%금리%' OR title ILIKE '%환율%'
+                OR title ILIKE '%삼성%' OR title ILIKE '%반도체%' OR title ILIKE '%테슬라%'
+                OR title ILIKE '%시사%' OR title ILIKE '%검찰%' OR title ILIKE '%외교%'
+                OR title ILIKE '%트럼프%' OR title ILIKE '%북한%' OR title ILIKE '%안보%'
+              )
+            ORDER BY created_at DESC
+            LIMIT 10
+        )
+    """)
+
+
+@startup_task('0012_posts_pick_columns')
+def add_posts_pick_columns(app):
+    # 누렁이 픽
+    _try_sql(
+        "ALTER TABLE posts ADD COLUMN external_url VARCHAR(500)",
+        "ALTER TABLE posts ADD COLUMN og_image VARCHAR(500)",
+    )
+
+
+@startup_task('0013_posts_counters')
+def add_posts_counters(app):
+    # 좋아요/댓글 비정규화 카운터 (컬럼을 새로 추가한 경우에만 백필)
+    try:
+        db.session.execute(db.text("ALTER TABLE posts ADD COLUMN like_count INTEGER DEFAULT 0"))
+        db.session.execute(db.text("ALTER TABLE posts ADD COLUMN comment_count INTEGER DEFAULT 0"))
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        return
+    from app.models.post import Post
+    Post.recount_counters()
+    db.session.commit()
+    app.logger.info('posts.like_count/comment_count 컬럼 추가 및 백필 완료')
+
+
+@startup_task('0014_listing_indexes')
+def add_listing_indexes(app):
+    # 목록 정렬/키셋 페이지네이션용
+    _try_sql(
+        "CREATE INDEX IF NOT EXISTS ix_posts_created_at ON posts (created_at)",
+        "CREATE INDEX IF NOT EXISTS ix_posts_board_created ON posts (board_type, created_at DESC, id)",
+        "CREATE INDEX IF NOT EXISTS ix_comments_created_id ON comments (created_at, id)",
+        "CREATE INDEX IF NOT EXISTS ix_users_created_id ON users (created_at, id)",
+        "CREATE INDEX IF NOT EXISTS ix_news_articles_created_id ON news_articles (created_at, id)",
+    )
+
+
+@startup_task('0015_users_job_category')
+def add_users_job_category(app):
+    _try_sql("ALTER TABLE users ADD COLUMN job_category VARCHAR(20) DEFAULT 'public'")
+
+
+@startup_task('0016_users_np_columns')
+def add_users_np_columns(app):
+    _try_sql(
+        "ALTER TABLE users ADD COLUMN total_np INTEGER DEFAULT 0",
+        "ALTER TABLE users ADD COLUMN last_login_date DATE",
+        "ALTER TABLE users ADD COLUMN login_streak INTEGER DEFAULT 0",
+    )
+
+
+@startup_task('0017_users_onboarding_columns')
+def add_users_onboarding_columns(app):
+    # 온보딩 완료 / 첫 댓글 보상 여부
+    _try_sql(
+        "ALTER TABLE users ADD COLUMN onboarding_completed BOOLEAN DEFAULT FALSE",
+        "ALTER TABLE users ADD COLUMN first_comment_rewarded BOOLEAN DEFAULT FALSE",
+    )
+
+
+@startup_task('0018_point_history_table')
+def create_point_history_table(app):
+    _try_sql("""
+        CREATE TABLE IF NOT EXISTS point_history (
+            id SERIAL PRIMARY KEY,
+            user_id INTEGER NOT NULL REFERENCES users(id),
+            action_type VARCHAR(50) NOT NULL,
+            points INTEGER NOT NULL,
+            description VARCHAR(200) NOT NULL,
+            created_at TIMESTAMP DEFAULT NOW()
+        )
+    """)
+
+
+@startup_task('0019_retroactive_np')
+def grant_retroactive_np(app):
+    # [1회성] 기존 가입자 NP 소급 지급 (회원별 COUNT 대신 GROUP BY 2회)
+    from app.models import User, Post, Comment
+    from app.models.np_point import PointHistory
+    if PointHistory.query.filter_by(action_type='retroactive_bulk').first():
+        return
+    post_counts = dict(db.session.query(Post.user_id, db.func.count(Post.id)).group_by(Post.user_id).all())
+    comment_counts = dict(db.session.query(Comment.user_id, db.func.count(Comment.id)).group_by(Comment.user_id).all())
+    for u in User.query.all():
+        post_count = post_counts.get(u.id, 0)
+        comment_count = comment_counts.get(u.id, 0)
+        np = 100 + post_count * 10 + comment_count * 5  # 가입 보너스 + 글 + 댓글
+        u.total_np = np
+        db.session.add(PointHistory(
+            user_id=u.id, action_type='retroactive_bulk',
+            points=np, description=f'소급지급: 가입100+글{post_count}x10+댓글{comment_count}x5'
+        ))
+    db.session.commit()
+    app.logger.info('[NP] 기존 가입자 NP 소급 지급 완료')
+
+
+@startup_task('0020_remove_aesa_lee_posts')
+@recurring_cleanup
+def remove_aesa_lee_posts(app):
+    # AESA 게시판 이준석 관련 자동 게시글 삭제
+    from app.models import Post
+    lee_posts = Post.query.filter(
+        Post.board_type == 'aesa',
+        db.or_(
+            Post.title.ilike('%이준석%'),
+            Post.content.ilike('%이준석%')
+        )
+    ).all()
+    if lee_posts:
+        for p in lee_posts:
+            db.session.delete(p)
+        db.session.commit()
+        app.logger.info(f'[AESA 정리] 이준석 관련 {len(lee_posts)}건 삭제 완료')
+
+
+def _seed_article(app, title, board_type, content_file, notify=False):
+    from app.models.post import Post
+    if Post.query.filter_by(title=title, board_type=board_type).first():
+        return None
+    bot_user = _bot_user()
+    if not bot_user:
+        # 작성자 계정이 생기기 전 — 예외로 끝내야 기록되지 않고 다음 시작 때 다시 시도된다
+        raise RuntimeError('게시할 봇/관리자 계정이 아직 없습니다')
+    # 콘텐츠 파일 직접 읽기 (순환 import 방지)
+    content_path = os.path.join(os.path.dirname(__file__), '..', 'scripts', content_file)
+    with open(content_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    post = Post(title=title, content=content, board_type=board_type, user_id=bot_user.id)
+    db.session.add(post)
+    db.session.commit()
+    if notify:
+        try:
+            from app.utils.telegram_notify import notify_new_post
+            notify_new_post(post)
+        except Exception:
+            pass
+    return post
+
+
+@startup_task('0021_seed_musk_article')
+def seed_musk_article(app):
+    # 누렁이 픽 아티클
+    post = _seed_article(
+        app, '"돈의 시대가 끝난다?" 일론 머스크가 말하는 \'폭발적 풍요\'의 미래와 5가지 충격적 통찰',
+        'pick', 'seed_musk_article_content.html', notify=True,
+    )
+    if post:
+        app.logger.info(f'[아티클 시딩] 머스크 아티클 게시 완료 (post_id={post.id})')
+
+
+@startup_task('0022_seed_aesa_briefing')
+def seed_aesa_briefing(app):
+    post = _seed_article(app, '2026 경제·산업 전망 및 글로벌 AI 기술 혁신 브리핑', 'aesa', 'seed_aesa_briefing_content.html')
+    if post:
+        app.logger.info(f'[AESA 시딩] 경제·AI 브리핑 게시 완료 (post_id={post.id})')
+
+
+@startup_task('0023_aesa_articles_columns')
+def add_aesa_articles_columns(app):
+    _try_sql(
+        "ALTER TABLE aesa_articles ADD COLUMN lenses VARCHAR(50)",
+        "ALTER TABLE aesa_articles ADD COLUMN korea_investment_link BOOLEAN DEFAULT FALSE",
+        # status 컬럼 길이 확장 (기존 VARCHAR(20) → VARCHAR(30))
+        "ALTER TABLE aesa_articles ALTER COLUMN status TYPE VARCHAR(30)",
+    )
+
+
+@startup_task('0024_cleanup_free_board')
+@recurring_cleanup
+def cleanup_free_board(app):
+    # 자유게시판 정리: None 글 + 잘못 배치된 크로스포스팅 글 삭제
+    from app.models.post import Post
+
+    # 1) title이 None/NULL인 글
+    null_posts = Post.query.filter(
+        db.or_(Post.title == 'None', Post.title == 'none', Post.title.is_(None))
+    ).all()
+    # 2) 자유게시판(free)에 잘못 올라간 크로스포스팅 글 (user_id=1이고 external_url이 있는 뉴스성 글)
+    misplaced = Post.query.filter(
+        Post.board_type == 'free',
+        Post.user_id == 1,
+        Post.external_url.isnot(None),
+    ).all()
+    for p in null_posts + misplaced:
+        db.session.delete(p)
+    if null_posts or misplaced:
+        db.session.commit()
+        app.logger.info(f'[정리] None 글 {len(null_posts)}개, 자유게시판 잘못 배치 글 {len(misplaced)}개 삭제')
+
+
+@startup_task('0025_search_trgm_indexes')
+def add_search_trgm_indexes(app):
+    # 게시판 검색: PostgreSQL 이면 pg_trgm GIN 인덱스 (없으면 바이그램 색인 사용)
+    if db.engine.dialect.name != 'postgresql':
+        return
+    try:
+        db.session.execute(db.text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+        for col in ('title', 'body', 'author'):
+            db.session.execute(db.text(
+                f'CREATE INDEX IF NOT EXISTS ix_search_documents_{col}_trgm '
+                f'ON search_documents USING gin ({col} gin_trgm_ops)'
+            ))
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        app.logger.warning(f'[Search] pg_trgm 사용 불가, 바이그램 색인으로 대체: {e}')
+
+
+@startup_task('0026_aesa_title_source_index')
+def add_aesa_title_source_index(app):
+    # AESA 수집 중복 제거: (title, source) IN 조회용
+    _try_sql("CREATE INDEX IF NOT EXISTS ix_aesa_articles_title_source ON aesa_articles (title, source)")
+
+
+@startup_task('0027_article_cluster_stats')
+def add_article_cluster_stats(app):
+    # 클러스터 비정규화 통계 컬럼 + 기존 클러스터 백필
+    _try_sql(
+        "ALTER TABLE article_clusters ADD COLUMN stat_articles INTEGER",
+        "ALTER TABLE article_clusters ADD COLUMN stat_sources TEXT",
+        "ALTER TABLE article_clusters ADD COLUMN stat_political_min FLOAT",
+        "ALTER TABLE article_clusters ADD COLUMN stat_political_max FLOAT",
+        "ALTER TABLE article_clusters ADD COLUMN stat_updated_at TIMESTAMP",
+    )
+    from app.models.bias import ArticleCluster
+    from app.utils.clustering import refresh_cluster_stats
+    ids = [cid for (cid,) in db.session.query(ArticleCluster.id)]
+    for i in range(0, len(ids), 500):
+        refresh_cluster_stats(ids[i:i + 500])
+    db.session.commit()
+
+
+@startup_task('0028_bias_vote_tallies')
+def add_bias_vote_tallies(app):
+    # 증분 투표 집계 컬럼 + 기존 투표로 초기값 계산
+    _try_sql(
+        "ALTER TABLE news_articles ADD COLUMN weight_left FLOAT DEFAULT 0",
+        "ALTER TABLE news_articles ADD COLUMN weight_center FLOAT DEFAULT 0",
+        "ALTER TABLE news_articles ADD COLUMN weight_right FLOAT DEFAULT 0",
+        "ALTER TABLE news_articles ADD COLUMN vote_count INTEGER DEFAULT 0",
+        "ALTER TABLE news_articles ADD COLUMN expert_votes INTEGER DEFAULT 0",
+        "ALTER TABLE bias_votes ADD COLUMN weight FLOAT",
+        "ALTER TABLE bias_votes ADD COLUMN is_expert BOOLEAN DEFAULT FALSE",
+    )
+    from app.utils.bias_tally import reconcile_tallies
+    reconcile_tallies()
+    db.session.commit()
+
+
+@startup_task('0029_posts_board_created_id_desc')
+def fix_posts_board_created_index(app):
+    # 키셋 정렬(created_at DESC, id DESC)과 동점 처리 방향까지 맞춤 — 0014 로 이미 만든 인덱스 교체
+    _try_sql(
+        "DROP INDEX IF EXISTS ix_posts_board_created",
+        "CREATE INDEX IF NOT EXISTS ix_posts_board_created ON posts (board_type, created_at DESC, id DESC)",
+    )
+
+
+@startup_task('0030_telegram_outbox_claimed_at')
+def add_telegram_outbox_claimed_at(app):
+    # 발송 도중 워커가 죽어 'sending' 에 남은 행을 되돌리기 위한 선점 시각
+    _try_sql("ALTER TABLE telegram_outbox ADD COLUMN claimed_at TIMESTAMP")
+
+
+@startup_task('0031_prune_aesa_score_cache')
+@recurring_cleanup
+def prune_aesa_score_cache(app):
+    # AESA 채점 캐시는 같은 기사가 다시 들어오는 며칠만 쓸모 있음 — 7일 지난 행 삭제
+    from app.models.aesa_article import AesaScoreCache
+    AesaScoreCache.query.filter(
+        AesaScoreCache.created_at < datetime.now() - timedelta(days=7)
+    ).delete(synchronize_session=False)
@@ -1,15 +1,37 @@
 """
 방문자 추적 미들웨어
 app/__init__.py의 create_app()에서 init_tracking(app)을 호출하세요.
+
+요청마다 INSERT+COMMIT 하지 않고 WriteBuffer에 쌓았다가
+백그라운드 스레드가 N초/M건 단위로 한 번의 executemany로 기록한다.
 """
-from flask import request, g
+from datetime import datetime
+from flask import request
 from flask_login import current_user
 from app import db
 from app.models.page_visit import PageVisit
+from app.utils.write_buffer import WriteBuffer
+
+_visit_buffer = None
+
+
+def get_visit_buffer_stats():
+    """방문 버퍼 카운터 (enqueued/flushed/dropped/failed/pending, 워커 단위)"""
+    if _visit_buffer is None:
+        return {}
+    return _visit_buffer.stats()
+
+
+def flush_visits():
+    """버퍼에 남은 방문 기록을 즉시 기록 (테스트/종료용)"""
+    if _visit_buffer is None:
+        return 0
+    return _visit_buffer.flush()
 
 
 def init_tracking(app):
     """Flask 앱에 방문 추적 미들웨어 등록"""
+    global _visit_buffer
 
     # 추적 제외 경로
     EXCLUDE_PREFIXES = (
@@ -17,6 +39,24 @@ def init_tracking(app):
         '/sitemap.xml', '/favicon.ico', '/admin/api/'
     )
 
+    def _write_visits(rows):
+        with app.app_context():
+            try:
+                db.session.execute(PageVisit.__table__.insert(), rows)
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+            finally:
+                db.session.remove()
+
+    _visit_buffer = WriteBuffer(
+        'visit-buffer', _write_visits,
+        max_size=app.config.get('VISIT_BUFFER_SIZE', 10000),
+        batch_size=app.config.get('VISIT_FLUSH_BATCH', 500),
+        flush_interval=app.config.get('VISIT_FLUSH_INTERVAL_MS', 2000) / 1000,
+    )
+
     @app.before_request
     def track_visit():
         # 정적 파일, 봇 경로 제외
@@ -28,14 +68,13 @@ def init_tracking(app):
             return
 
         try:
-            visit = PageVisit(
-                ip_address=request.remote_addr or '0.0.0.0',
-                path=request.path[:500],
-                user_id=current_user.id if current_user.is_authenticated else None,
-                user_agent=(request.user_agent.string or '')[:500],
-                referrer=(request.referrer or '')[:500]
-            )
-            db.session.add(visit)
-            db.session.commit()
+            _visit_buffer.enqueue({
+                'ip_address': request.remote_addr or '0.0.0.0',
+                'path': request.path[:500],
+                'user_id': current_user.id if current_user.is_authenticated else None,
+                'user_agent': (request.user_agent.string or '')[:500],
+                'referrer': (request.referrer or '')[:500],
+                'created_at': datetime.now(),
+            })
         except Exception:
-            db.session.rollback()
+            app.logger.exception('[Tracking] 방문 기록 적재 실패')
@@ -0,0 +1,256 @@
+"""YouCheck 기사 스크래핑·AI 편향 분석 작업 큐
+
+외부 I/O(언론사 페이지, Anthropic API)를 웹 요청 밖에서 처리한다.
+- analysis_jobs 테이블이 큐 (active_key UNIQUE 로 같은 기사 진행 중 작업 1건만)
+- enqueue() 는 행을 만들고 이 프로세스의 스레드 풀에 넘긴 뒤 바로 반환
+- 스레드는 UPDATE ... WHERE status='queued' 로 작업을 선점하므로 여러 워커가 나눠 가져도 한 번만 실행
+- 스케줄러의 sweep_jobs() 가 프로세스 재시작 등으로 남은 작업을 다시 넘긴다
+화면은 /bias/jobs/<id> 를 폴링한다.
+"""
+import os
+import re
+import json
+import logging
+import urllib.request
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy.exc import IntegrityError
+from app import db
+from app.models.analysis_job import AnalysisJob
+from app.models.bias import NewsArticle
+from app.utils.article_extract import extract_article
+from app.utils.llm_json import parse_json_response
+
+logger = logging.getLogger(__name__)
+
+JOB_WORKERS = int(os.environ.get('ANALYSIS_JOB_WORKERS', '4'))
+JOB_MAX_ATTEMPTS = 3
+JOB_STALE_AFTER = timedelta(minutes=10)   # running 인 채 이보다 오래되면 죽은 작업으로 보고 재시도
+JOB_RETRY_COOLDOWN = timedelta(minutes=5)  # 실패한 작업은 이 시간 동안 폴링으로 다시 등록하지 않음
+MIN_BODY_LENGTH = {'scrape': 30, 'analyze': 50}
+
+_executor = None
+
+
+def scrape_article(url):
+    """기사 URL에서 본문 텍스트 추출 (공용 추출 서비스 + URL 캐시). 실패 시 RuntimeError"""
+    article = extract_article(url, timeout=15)
+    if not article.ok:
+        raise RuntimeError(article.error)
+    return article.text[:5000]
+
+
+def sanitize_text(text):
+    """JSON 직렬화가 불가능한 문자(서로게이트 등) 제거"""
+    if not text:
+        return ''
+    # 1) 서로게이트 쌍 제거 (surrogatepass로 인코딩 후 무효 바이트 무시)
+    try:
+        text = text.encode('utf-8', errors='surrogatepass').decode('utf-8', errors='ignore')
+    except Exception:
+        text = text.encode('ascii', errors='ignore').decode('ascii')
+    # 2) 남은 서로게이트 코드포인트 제거 (U+D800~U+DFFF)
+    text = re.sub(r'[\ud800-\udfff]', '', text)
+    # 3) 널 바이트 및 제어 문자 제거 (탭/줄바꿈 제외)
+    text = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f]', '', text)
+    return text
+
+
+def analyze_with_ai(title, body_text, source=''):
+    """Claude Haiku로 3축 편향 분석 (urllib 사용 — 인코딩 안전)"""
+    api_key = os.environ.get('ANTHROPIC_API_KEY', '').strip()
+    if not api_key:
+        raise ValueError('ANTHROPIC_API_KEY 환경변수가 설정되지 않았습니다')
+
+    # 깨진 유니코드 문자 제거
+    title = sanitize_text(title)
+    body_text = sanitize_text(body_text)
+    source = sanitize_text(source)
+
+    prompt = (
+        "다음 한국 뉴스 기사의 편향을 3개 축으로 분석해주세요.\n\n"
+        f"기사 제목: {title}\n"
+        f"언론사: {source}\n"
+        f"기사 본문:\n{body_text}\n\n"
+        "각 축에 대해 -100 ~ +100 점수와 근거를 제시하세요:\n"
+        "1. 정치축 (political): 진보(-100) ↔ 보수(+100)\n"
+        "2. 지정학축 (geopolitical): 친중(-100) ↔ 친미(+100)\n"
+        "3. 경제축 (economic): 노동친화(-100) ↔ 대기업친화(+100)\n\n"
+        '반드시 아래 JSON 형식으로만 응답하세요. 다른 텍스트 없이 JSON만 출력하세요:\n'
+        '{"political": 점수, "geopolitical": 점수, "economic": 점수, "summary": "2~3문장 요약"}'
+    )
+
+    payload = {
+        "model": "claude-haiku-4-5-20251001",
+        "max_tokens": 500,
+        "messages": [{"role": "user", "content": prompt}],
+    }
+    # ensure_ascii=False → 한글을 그대로 UTF-8 출력 (서로게이트 이미 제거됨)
+    data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+    req = urllib.request.Request(
+        "https://api.anthropic.com/v1/messages",
+        data=data,
+        headers={
+            "X-Api-Key": api_key,
+            "Anthropic-Version": "2023-06-01",
+            "Content-Type": "application/json",
+        },
+        method="POST",
+    )
+    with urllib.request.urlopen(req, timeout=30) as resp:
+        message = json.loads(resp.read().decode('utf-8'))
+
+    result, _ = parse_json_response(message['content'][0]['text'])
+    if result is None:
+        raise ValueError('AI 응답에서 JSON 을 찾지 못했습니다')
+
+    # 범위 클램핑
+    for key in ('political', 'geopolitical', 'economic'):
+        val = result.get(key, 0)
+        result[key] = max(-100, min(100, int(val)))
+
+    return result
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix='analysis-job')
+    return _executor
+
+
+def _active_key(kind, article_id):
+    return f'{kind}:{article_id}'
+
+
+def active_job(article_id, kind):
+    return AnalysisJob.query.filter_by(active_key=_active_key(kind, article_id)).first()
+
+
+def recent_failure(article_id, kind):
+    """JOB_RETRY_COOLDOWN 안에 실패로 끝난 가장 최근 작업 (없거나 그 뒤에 성공했으면 None)"""
+    job = AnalysisJob.query.filter(
+        AnalysisJob.article_id == article_id, AnalysisJob.kind == kind,
+        AnalysisJob.status.in_(('done', 'error')),
+        AnalysisJob.finished_at >= datetime.now() - JOB_RETRY_COOLDOWN,
+    ).order_by(AnalysisJob.finished_at.desc(), AnalysisJob.id.desc()).first()
+    return job if job and job.status == 'error' else None
+
+
+def enqueue(app, article_id, kind, user_id=None):
+    """작업 등록 (같은 기사·종류가 진행 중이면 그 작업 반환) 후 백그라운드 실행. 커밋 포함"""
+    job = active_job(article_id, kind)
+    if job:
+        return job
+    job = AnalysisJob(article_id=article_id, kind=kind, requested_by=user_id,
+                      active_key=_active_key(kind, article_id))
+    db.session.add(job)
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # 다른 요청이 먼저 등록
+        db.session.rollback()
+        return active_job(article_id, kind)
+    _get_executor().submit(_run_in_app, app, job.id)
+    return job
+
+
+def _run_in_app(app, job_id):
+    with app.app_context():
+        try:
+            run_job(job_id)
+        except Exception:
+            logger.exception(f'[AnalysisJob] #{job_id} 실행 중 예외')
+            db.session.rollback()
+
+
+def _claim(job_id):
+    claimed = db.session.query(AnalysisJob).filter(
+        AnalysisJob.id == job_id, AnalysisJob.status == 'queued'
+    ).update({
+        AnalysisJob.status: 'running',
+        AnalysisJob.started_at: datetime.now(),
+        AnalysisJob.attempts: AnalysisJob.attempts + 1,
+    }, synchronize_session=False)
+    db.session.commit()
+    return claimed == 1
+
+
+def _finish(job, error=None):
+    job.status = 'error' if error else 'done'
+    job.error = error[:300] if error else None
+    job.active_key = None
+    job.finished_at = datetime.now()
+    db.session.commit()
+
+
+def run_job(job_id):
+    """작업 1건 실행 (선점 실패 시 아무것도 안 함)"""
+    if not _claim(job_id):
+        return
+    job = db.session.get(AnalysisJob, job_id)
+    article = db.session.get(NewsArticle, job.article_id)
+    if article is None:
+        _finish(job, '기사가 삭제되었습니다.')
+        return
+
+    # 1단계: 본문. 미리보기는 저장된 3000자 본문으로 충분하고, AI 분석은 5000자까지 넘기도록
+    # 추출 서비스(URL 캐시)에서 다시 받는다 — 실패하거나 더 짧으면 저장된 본문을 쓴다
+    stored = article.scraped_content or ''
+    body_text = stored
+    if job.kind == 'analyze' or len(stored) < MIN_BODY_LENGTH[job.kind]:
+        try:
+            fetched = scrape_article(article.url)
+        except Exception as e:
+            logger.warning(f'[AnalysisJob] #{job_id} 스크래핑 실패: {e}')
+            if len(stored) < MIN_BODY_LENGTH[job.kind]:
+                _finish(job, f'기사 수집 실패: {type(e).__name__}')
+                return
+            fetched = ''
+        if len(fetched) > len(stored):
+            body_text = fetched
+            article.scraped_content = fetched[:3000]
+            db.session.commit()
+    if len(body_text) < MIN_BODY_LENGTH[job.kind]:
+        _finish(job, '기사 본문을 추출할 수 없습니다.')
+        return
+
+    if job.kind == 'scrape':
+        _finish(job)
+        return
+
+    # 2단계: AI 분석
+    try:
+        result = analyze_with_ai(article.title, body_text, article.source or '')
+    except Exception as e:
+        logger.warning(f'[AnalysisJob] #{job_id} AI 분석 실패: {e}')
+        _finish(job, f'AI 분석 실패: {type(e).__name__}')
+        return
+
+    article.article_political = result['political']
+    article.article_geopolitical = result['geopolitical']
+    article.article_economic = result['economic']
+    article.ai_summary = result.get('summary', '')
+    _finish(job)
+
+
+def sweep_jobs(app):
+    """멈춘 작업 재시도: 오래된 running → queued (시도 횟수 초과 시 error), 남은 queued 재실행"""
+    now = datetime.now()
+    stale = AnalysisJob.query.filter(
+        AnalysisJob.status == 'running', AnalysisJob.started_at < now - JOB_STALE_AFTER
+    ).all()
+    for job in stale:
+        if (job.attempts or 0) >= JOB_MAX_ATTEMPTS:
+            job.status, job.error, job.active_key, job.finished_at = 'error', '시간 초과', None, now
+        else:
+            job.status = 'queued'
+    db.session.commit()
+
+    queued = [job_id for (job_id,) in db.session.query(AnalysisJob.id).filter(
+        AnalysisJob.status == 'queued', AnalysisJob.created_at < now - timedelta(seconds=30)
+    )]
+    for job_id in queued:
+        _get_executor().submit(_run_in_app, app, job_id)
+    return len(queued)
@@ -0,0 +1,285 @@
+"""기사 본문 추출 서비스 (봇·웹 공용) + URL 기준 영구 캐시
+
+같은 네이버 기사를 YouCheck 분석, 여론조사/후보 트래커, URL 단축기가 각자 내려받던 것을
+한 곳으로 모은다.
+- 정규화 URL(추적 파라미터·fragment 제거, 네이버 기사 주소 통일) 기준으로 article_cache 에 저장
+  (본문 zlib 압축, 성공 ARTICLE_TTL / 실패 ERROR_TTL)
+- 정적 경로: 공유 requests.Session 으로 HTML 을 받아 lxml 로 파싱, 사이트별 본문 선택자 우선
+- 정적 추출 본문이 너무 짧을 때만 공유 브라우저 풀(app/utils/browser_pool.py)로 렌더링 (비동기 경로)
+
+    article = extract_article(url)                    # 동기, 정적 경로만 (웹 요청·스크립트)
+    article = await extract_article_async(url)        # 워커 공유 루프, 필요 시 브라우저 fallback
+    if article.ok:
+        article.text, article.title
+"""
+import re
+import zlib
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+import requests
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup
+
+logger = logging.getLogger(__name__)
+
+ARTICLE_TTL = timedelta(days=1)
+ERROR_TTL = timedelta(minutes=30)
+MAX_TEXT = 20000              # 캐시에 저장하는 본문 최대 길이
+MAX_HTML_BYTES = 3 * 1024 * 1024
+BROWSER_MIN_TEXT = 200        # 정적 본문이 이보다 짧으면 브라우저로 다시 시도
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)'
+
+_TRACKING_PARAMS = re.compile(r'^(utm_\w+|fbclid|gclid|igshid)$', re.I)
+_NAVER_ARTICLE = re.compile(r'/(?:mnews/)?article/(\d{3})/(\d{10})')
+
+# 사이트별 본문 선택자 (host 접미사 → CSS 선택자)
+SITE_SELECTORS = {
+    'news.naver.com': '#dic_area, #newsct_article, .newsct_body, #articleBodyContents',
+    'sports.naver.com': '#newsEndContents, ._article_content',
+    'entertain.naver.com': '#articeBody, ._article_content',
+    'news.daum.net': '.article_view, #harmonyContainer',
+    'v.daum.net': '.article_view, #harmonyContainer',
+}
+GENERIC_SELECTORS = 'article, .article-body, .article_body, .story-body, #article-body, .news_end, #articleBody'
+STRIP_SELECTORS = 'script, style, .ad, .adsbygoogle, .journalist_area, .byline'
+
+
+class ExtractedArticle:
+    """추출 결과. source: 이번 응답 출처 (cache | static | browser), method: 본문을 실제로 얻은 방법"""
+
+    __slots__ = ('url', 'canonical', 'title', 'text', 'source', 'method', 'error')
+
+    def __init__(self, url, canonical, title=None, text='', source='static', method=None, error=None):
+        self.url = url
+        self.canonical = canonical
+        self.title = title
+        self.text = text or ''
+        self.source = source
+        self.method = method or source
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        return f'<ExtractedArticle {self.canonical[:60]} {self.source} {len(self.text)}자>'
+
+
+def canonical_url(url):
+    """캐시 키용 정규화 URL"""
+    parts = urlsplit((url or '').strip())
+    host = parts.netloc.lower()
+    if host.startswith('m.') and host.endswith('news.naver.com'):
+        host = host[2:]
+    if host.endswith('naver.com') and 'news' in host:
+        query = dict(parse_qsl(parts.query))
+        match = _NAVER_ARTICLE.search(parts.path)
+        if match:
+            return f'https://n.news.naver.com/mnews/article/{match.group(1)}/{match.group(2)}'
+        if query.get('oid') and query.get('aid'):
+            return f"https://n.news.naver.com/mnews/article/{query['oid']}/{query['aid']}"
+    query = urlencode(sorted((k, v) for k, v in parse_qsl(parts.query) if not _TRACKING_PARAMS.match(k)))
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower() or 'https', host, path, query, ''))
+
+
+def _url_hash(canonical):
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+
+
+# ── HTML 파싱 ──
+
+def _selectors_for(host):
+    for suffix, selector in SITE_SELECTORS.items():
+        if host == suffix or host.endswith('.' + suffix):
+            return selector
+    return None
+
+
+def extract_from_html(html, url):
+    """HTML → (제목, 본문). 사이트 선택자 → 일반 기사 선택자 → 긴 <p> 모음 순"""
+    soup = BeautifulSoup(html, 'lxml')
+
+    title = None
+    og = soup.select_one('meta[property="og:title"]')
+    if og and og.get('content'):
+        title = og['content'].strip()
+    elif soup.title and soup.title.string:
+        title = soup.title.string.strip()
+    if title and len(title) > 300:
+        title = title[:297] + '...'
+
+    body = None
+    site_selector = _selectors_for(urlsplit(url).netloc.lower())
+    if site_selector:
+        body = soup.select_one(site_selector)
+    if not body:
+        body = soup.select_one(GENERIC_SELECTORS)
+    if not body:
+        paragraphs = [p.get_text(strip=True) for p in soup.find_all('p')]
+        return title, '\n'.join(p for p in paragraphs if len(p) > 30)[:MAX_TEXT]
+
+    for tag in body.select(STRIP_SELECTORS):
+        tag.decompose()
+    return title, body.get_text('\n', strip=True)[:MAX_TEXT]
+
+
+class ArticleExtractor:
+
+    def __init__(self):
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        self._session.headers['User-Agent'] = USER_AGENT
+        self._app = None
+
+    def init_app(self, app):
+        self._app = app
+
+    # ── 캐시 (app context 를 직접 열어 봇 스레드에서도 사용) ──
+
+    def _cache_get(self, canonical):
+        if self._app is None:
+            return None
+        from app import db
+        from app.models.article_cache import ArticleCache
+        table = ArticleCache.__table__
+        try:
+            with self._app.app_context(), db.engine.connect() as conn:
+                row = conn.execute(
+                    table.select().where(table.c.url_hash == _url_hash(canonical),
+                                         table.c.expires_at > datetime.now())
+                ).first()
+        except Exception as e:
+            logger.warning(f'[ArticleExtract] 캐시 조회 실패: {e}')
+            return None
+        if row is None:
+            return None
+        if row.status != 'ok':
+            return ExtractedArticle(canonical, canonical, row.title, '', 'cache', row.method, error='cached failure')
+        text = zlib.decompress(row.body).decode('utf-8') if row.body else ''
+        return ExtractedArticle(canonical, canonical, row.title, text, 'cache', row.method)
+
+    def _cache_put(self, article):
+        if self._app is None:
+            return
+        from app import db
+        from app.models.article_cache import ArticleCache
+        table = ArticleCache.__table__
+        key = _url_hash(article.canonical)
+        now = datetime.now()
+        values = {
+            'url_hash': key,
+            'url': article.canonical,
+            'title': (article.title or '')[:500] or None,
+            'body': zlib.compress(article.text.encode('utf-8'), 6) if article.ok else None,
+            'method': article.method,
+            'status': 'ok' if article.ok else 'error',
+            'fetched_at': now,
+            'expires_at': now + (ARTICLE_TTL if article.ok else ERROR_TTL),
+        }
+        try:
+            with self._app.app_context(), db.engine.begin() as conn:
+                conn.execute(table.delete().where(table.c.url_hash == key))
+                conn.execute(table.insert().values(**values))
+        except Exception as e:
+            # 다른 프로세스가 같은 URL 을 동시에 저장한 경우 등 — 캐시는 없어도 동작
+            logger.info(f'[ArticleExtract] 캐시 저장 건너뜀: {type(e).__name__}')
+
+    def prune(self):
+        """만료된 캐시 행 삭제 (app context 안에서 호출). 삭제 건수 반환"""
+        from app import db
+        from app.models.article_cache import ArticleCache
+        deleted = ArticleCache.query.filter(ArticleCache.expires_at <= datetime.now()).delete(
+            synchronize_session=False)
+        db.session.commit()
+        return deleted
+
+    # ── 추출 ──
+
+    def fetch_static(self, url, canonical, timeout=10):
+        try:
+            with self._session.get(url, timeout=(5, timeout), stream=True, allow_redirects=True) as resp:
+                if resp.status_code != 200:
+                    return ExtractedArticle(url, canonical, error=f'HTTP {resp.status_code}')
+                chunks, size = [], 0
+                for chunk in resp.iter_content(64 * 1024):
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size > MAX_HTML_BYTES:
+                        break
+                raw = b''.join(chunks)
+                charset = requests.utils.get_encoding_from_headers(resp.headers)
+                final_url = resp.url
+            html = raw.decode(charset, errors='replace') if charset and charset.lower() != 'iso-8859-1' else raw
+            title, text = extract_from_html(html, final_url)
+            return ExtractedArticle(url, canonical, title, text, 'static')
+        except Exception as e:
+            return ExtractedArticle(url, canonical, error=f'{type(e).__name__}: {e}')
+
+    async def fetch_browser(self, url, canonical):
+        from app.utils.browser_pool import browser_page
+        try:
+            async with browser_page() as page:
+                await page.goto(url, wait_until='domcontentloaded', timeout=15000)
+                html = await page.content()
+                final_url = page.url
+            title, text = extract_from_html(html, final_url)
+            return ExtractedArticle(url, canonical, title, text, 'browser')
+        except Exception as e:
+            return ExtractedArticle(url, canonical, error=f'{type(e).__name__}: {e}')
+
+    def extract(self, url, timeout=10, refresh=False):
+        canonical = canonical_url(url)
+        if not refresh:
+            cached = self._cache_get(canonical)
+            if cached is not None:
+                cached.url = url
+                return cached
+        article = self.fetch_static(url, canonical, timeout)
+        self._cache_put(article)
+        return article
+
+    async def extract_async(self, url, browser_fallback=True, refresh=False):
+        from app.utils.job_runtime import run_blocking
+        canonical = canonical_url(url)
+        if not refresh:
+            cached = await run_blocking(self._cache_get, canonical)
+            # 정적 경로가 남긴 실패·짧은 본문(JS 렌더링 페이지)은 브라우저로 다시 시도
+            if cached is not None and (not browser_fallback or cached.ok and (
+                    len(cached.text) >= BROWSER_MIN_TEXT or cached.method == 'browser')):
+                cached.url = url
+                return cached
+        article = await run_blocking(self.fetch_static, url, canonical)
+        if browser_fallback and len(article.text) < BROWSER_MIN_TEXT:
+            rendered = await self.fetch_browser(url, canonical)
+            if rendered.ok and len(rendered.text) > len(article.text):
+                article = ExtractedArticle(url, canonical, rendered.title or article.title, rendered.text, 'browser')
+        await run_blocking(self._cache_put, article)
+        return article
+
+
+_extractor = ArticleExtractor()
+
+
+def init_article_extract(app):
+    """캐시 저장용 앱 등록 (create_app 에서 호출)"""
+    _extractor.init_app(app)
+
+
+def extract_article(url, timeout=10, refresh=False):
+    """기사 본문·제목 추출 (캐시 → 정적 HTML). ExtractedArticle 반환, 예외 없음"""
+    return _extractor.extract(url, timeout, refresh)
+
+
+async def extract_article_async(url, browser_fallback=True, refresh=False):
+    """extract_article 의 워커 공유 루프용 버전 — 정적 본문이 부족하면 브라우저로 렌더링"""
+    return await _extractor.extract_async(url, browser_fallback, refresh)
+
+
+def prune_article_cache():
+    return _extractor.prune()
@@ -1,9 +1,15 @@
 """주간 편향 리포트 생성 및 텔레그램 전송"""
 import os
-import requests
+import json
 from datetime import datetime, timedelta
 from collections import defaultdict
 
+from app.utils.telegram_delivery import send_message
+
+REPORT_CACHE_TTL = 600      # 리포트 캐시 (초)
+REPORT_CACHE_STALE = 300
+MIN_SOURCE_ARTICLES = 2     # 언론사 평균에 필요한 최소 기사 수
+
 
 def generate_weekly_report():
     """최근 7일 편향 데이터를 분석하여 리포트를 생성한다.
@@ -12,78 +18,109 @@ def generate_weekly_report():
         dict with keys: top_clusters, top_conservative, top_progressive,
                        most_divided_cluster, telegram_text, generated_at
     """
+    now = datetime.now()
+    return build_report(now - timedelta(days=7), now)
+
+
+def get_report(start=None, end=None):
+    """기간 리포트 (캐시). 기본은 최근 7일 — 10분 단위로 끊어 같은 구간이면 캐시 공유"""
+    from app.utils.page_cache import get_page_cache
+    if end is None:
+        now = datetime.now()
+        end = now.replace(minute=now.minute - now.minute % 10, second=0, microsecond=0)
+    if start is None:
+        start = end - timedelta(days=7)
+    key = f'bias_report:{start:%Y%m%d%H%M}:{end:%Y%m%d%H%M}'
+    value, _ = get_page_cache().get_or_build(
+        key,
+        lambda: json.dumps(build_report(start, end), ensure_ascii=False),
+        ttl=REPORT_CACHE_TTL,
+        stale_ttl=REPORT_CACHE_STALE,
+    )
+    return json.loads(value)
+
+
+def build_report(start, end):
+    """[start, end) 기간 편향 리포트 — 기사 행을 불러오지 않고 GROUP BY 집계만 사용"""
+    from sqlalchemy import func
     from app.models.bias import NewsArticle, ArticleCluster
     from app import db
 
-    cutoff = datetime.now() - timedelta(days=7)
+    in_range = (NewsArticle.created_at >= start, NewsArticle.created_at < end)
 
-    # --- 1. 클러스터 크기 TOP 3 ---
-    articles = NewsArticle.query.filter(
-        NewsArticle.created_at >= cutoff,
-    ).all()
+    total_articles = db.session.query(func.count(NewsArticle.id)).filter(*in_range).scalar() or 0
 
-    cluster_counts = defaultdict(list)
-    for a in articles:
-        if a.cluster_id:
-            cluster_counts[a.cluster_id].append(a)
-
-    top_clusters = []
-    if cluster_counts:
-        sorted_clusters = sorted(cluster_counts.items(), key=lambda x: len(x[1]), reverse=True)[:3]
-        for cluster_id, arts in sorted_clusters:
-            cluster = ArticleCluster.query.get(cluster_id)
-            if cluster:
-                sources = list(set(a.source for a in arts if a.source))
-                top_clusters.append({
-                    'id': cluster_id,
-                    'title': cluster.title,
-                    'count': len(arts),
-                    'sources': sources,
-                })
+    # --- 1. 클러스터 크기 TOP 3 ---
+    size = func.count(NewsArticle.id).label('size')
+    top_rows = db.session.query(NewsArticle.cluster_id, ArticleCluster.title, size).join(
+        ArticleCluster, ArticleCluster.id == NewsArticle.cluster_id
+    ).filter(*in_range).group_by(NewsArticle.cluster_id, ArticleCluster.title).order_by(
+        size.desc(), NewsArticle.cluster_id
+    ).limit(3).all()
+
+    cluster_sources = defaultdict(list)
+    if top_rows:
+        for cluster_id, source in db.session.query(NewsArticle.cluster_id, NewsArticle.source).filter(
+            *in_range,
+            NewsArticle.cluster_id.in_([r.cluster_id for r in top_rows]),
+            NewsArticle.source.isnot(None),
+        ).distinct().order_by(NewsArticle.cluster_id, NewsArticle.source):
+            cluster_sources[cluster_id].append(source)
+
+    top_clusters = [{
+        'id': r.cluster_id,
+        'title': r.title,
+        'count': r.size,
+        'sources': cluster_sources[r.cluster_id],
+    } for r in top_rows]
 
     # --- 2. 언론사별 평균 정치축 편향 TOP 3 보수/진보 ---
-    source_scores = defaultdict(list)
-    for a in articles:
-        if a.source and a.source_political is not None:
-            source_scores[a.source].append(a.source_political)
-
-    source_avg = {}
-    for src, scores in source_scores.items():
-        if len(scores) >= 2:  # 최소 2건 이상
-            source_avg[src] = sum(scores) / len(scores)
+    source_rows = db.session.query(
+        NewsArticle.source, func.avg(NewsArticle.source_political)
+    ).filter(
+        *in_range, NewsArticle.source.isnot(None), NewsArticle.source_political.isnot(None),
+    ).group_by(NewsArticle.source).having(
+        func.count(NewsArticle.source_political) >= MIN_SOURCE_ARTICLES
+    ).all()
 
-    sorted_by_score = sorted(source_avg.items(), key=lambda x: x[1])
+    sorted_by_score = sorted(((src, float(avg)) for src, avg in source_rows), key=lambda x: x[1])
     top_progressive = sorted_by_score[:3]  # 가장 진보 (낮은 점수)
     top_conservative = sorted_by_score[-3:][::-1]  # 가장 보수 (높은 점수)
 
     # --- 3. 진보-보수 언론이 가장 다르게 다룬 클러스터 ---
     most_divided = None
-    max_deviation = 0.0
-
-    for cluster_id, arts in cluster_counts.items():
-        pol_scores = [a.source_political for a in arts if a.source_political is not None]
-        if len(pol_scores) >= 2:
-            deviation = max(pol_scores) - min(pol_scores)
-            if deviation > max_deviation:
-                max_deviation = deviation
-                cluster = ArticleCluster.query.get(cluster_id)
-                if cluster:
-                    most_prog = min(arts, key=lambda a: a.source_political if a.source_political is not None else 0)
-                    most_cons = max(arts, key=lambda a: a.source_political if a.source_political is not None else 0)
-                    most_divided = {
-                        'id': cluster_id,
-                        'title': cluster.title,
-                        'deviation': round(deviation, 1),
-                        'progressive_source': most_prog.source,
-                        'progressive_score': most_prog.source_political,
-                        'conservative_source': most_cons.source,
-                        'conservative_score': most_cons.source_political,
-                    }
+    spread = (func.max(NewsArticle.source_political) - func.min(NewsArticle.source_political)).label('spread')
+    divided = db.session.query(NewsArticle.cluster_id, ArticleCluster.title, spread).join(
+        ArticleCluster, ArticleCluster.id == NewsArticle.cluster_id
+    ).filter(*in_range, NewsArticle.source_political.isnot(None)).group_by(
+        NewsArticle.cluster_id, ArticleCluster.title
+    ).having(func.count(NewsArticle.source_political) >= 2).order_by(
+        spread.desc(), NewsArticle.cluster_id
+    ).first()
+
+    if divided and divided.spread > 0:
+        ends = db.session.query(NewsArticle.source, NewsArticle.source_political).filter(
+            *in_range, NewsArticle.cluster_id == divided.cluster_id, NewsArticle.source_political.isnot(None),
+        ).order_by(NewsArticle.source_political, NewsArticle.id)
+        most_prog = ends.first()
+        most_cons = ends.order_by(None).order_by(NewsArticle.source_political.desc(), NewsArticle.id).first()
+        most_divided = {
+            'id': divided.cluster_id,
+            'title': divided.title,
+            'deviation': round(divided.spread, 1),
+            'progressive_source': most_prog.source,
+            'progressive_score': most_prog.source_political,
+            'conservative_source': most_cons.source,
+            'conservative_score': most_cons.source_political,
+        }
 
     # --- 텔레그램 메시지 포맷 ---
     now = datetime.now()
-    week_start = (now - timedelta(days=7)).strftime('%m/%d')
-    week_end = now.strftime('%m/%d')
+    # end 는 배타 경계 — 표시는 포함되는 마지막 날짜로, 올해가 아닌 구간은 연도까지
+    last = end - timedelta(microseconds=1)
+    date_format = '%m/%d' if start.year == last.year == now.year else '%Y/%m/%d'
+    week_start = start.strftime(date_format)
+    week_end = last.strftime(date_format)
 
     lines = [
         f"📊 *NR2 YouCheck 주간 편향 리포트*",
@@ -127,7 +164,7 @@ def generate_weekly_report():
         lines.append(f"  📏 편차: {most_divided['deviation']}점")
         lines.append("")
 
-    lines.append(f"📈 이번 주 분석 기사: {len(articles)}건")
+    lines.append(f"📈 이번 주 분석 기사: {total_articles}건")
     lines.append("👉 자세히 보기: https://nr2.kr/bias")
 
     telegram_text = '\n'.join(lines)
@@ -137,7 +174,7 @@ def generate_weekly_report():
         'top_conservative': [{'source': s, 'score': round(sc, 1)} for s, sc in top_conservative],
         'top_progressive': [{'source': s, 'score': round(sc, 1)} for s, sc in top_progressive],
         'most_divided_cluster': most_divided,
-        'total_articles': len(articles),
+        'total_articles': total_articles,
         'telegram_text': telegram_text,
         'generated_at': now.isoformat(),
         'week_start': week_start,
@@ -171,17 +208,7 @@ def send_weekly_report_to_telegram(text=None):
         report = generate_weekly_report()
         text = report['telegram_text']
 
-    url = f'https://api.telegram.org/bot{bot_token}/sendMessage'
-    payload = {
-        'chat_id': chat_id,
-        'text': text,
-        'parse_mode': 'Markdown',
-        'disable_web_page_preview': True,
-    }
-
-    try:
-        resp = requests.post(url, json=payload, timeout=15)
-        resp.raise_for_status()
+    result = send_message(bot_token, chat_id, text, parse_mode='Markdown', disable_preview=True)
+    if result.ok:
         return {'success': True, 'message': '텔레그램 전송 완료'}
-    except Exception as e:
-        return {'success': False, 'message': f'전송 실패: {str(e)[:200]}'}
+    return {'success': False, 'message': f'전송 실패: {(result.error or "")[:200]}'}
@@ -0,0 +1,110 @@
+"""YouCheck 편향 투표 집계
+
+투표할 때마다 기사의 전체 투표와 투표자를 다시 읽는 대신, apply_vote()가
+변화량만 원자적 UPDATE 로 더한다 (투표 수와 무관하게 쿼리 2회).
+등급 변경·투표 삭제처럼 증분으로 잡히지 않는 변화는 스케줄러의
+reconcile_tallies()가 GROUP BY 한 번으로 다시 맞춘다.
+"""
+import logging
+from sqlalchemy import func, case, select, or_
+from app import db
+from app.models.bias import NewsArticle, BiasVote
+from app.models.user import User, VOTE_WEIGHTS, EXPERT_TIERS
+
+logger = logging.getLogger(__name__)
+
+_WEIGHT_COLUMNS = {
+    'left': NewsArticle.weight_left,
+    'center': NewsArticle.weight_center,
+    'right': NewsArticle.weight_right,
+}
+_TALLY_ATTRS = ('weight_left', 'weight_center', 'weight_right', 'vote_count', 'expert_votes')
+
+
+def _refresh(article):
+    db.session.refresh(article, attribute_names=_TALLY_ATTRS)
+    article.set_tallies(
+        article.weight_left or 0.0, article.weight_center or 0.0, article.weight_right or 0.0,
+        article.vote_count or 0, article.expert_votes or 0,
+    )
+
+
+def apply_vote(article, vote, voter, old_bias=None):
+    """투표 1건 반영. 새 투표면 old_bias=None, 변경이면 바꾸기 전 bias (커밋은 호출부)"""
+    weight = voter.vote_weight
+    expert = voter.verify_tier in EXPERT_TIERS
+    deltas = {}
+
+    if old_bias is None:
+        deltas[NewsArticle.vote_count] = 1
+        deltas[NewsArticle.expert_votes] = int(expert)
+    else:
+        old_weight = vote.weight if vote.weight is not None else weight
+        deltas[_WEIGHT_COLUMNS[old_bias]] = -old_weight
+        deltas[NewsArticle.expert_votes] = int(expert) - int(bool(vote.is_expert))
+    column = _WEIGHT_COLUMNS[vote.bias]
+    deltas[column] = deltas.get(column, 0) + weight
+
+    vote.weight = weight
+    vote.is_expert = expert
+    values = {col: func.coalesce(col, 0) + delta for col, delta in deltas.items() if delta}
+    if values:
+        db.session.query(NewsArticle).filter(NewsArticle.id == article.id).update(
+            values, synchronize_session=False
+        )
+    _refresh(article)
+
+
+def _voter_weight():
+    weight = case(VOTE_WEIGHTS, value=User.verify_tier, else_=0)
+    return select(weight).where(User.id == BiasVote.user_id).scalar_subquery()
+
+
+def _voter_expert():
+    expert = case((User.verify_tier.in_(EXPERT_TIERS), True), else_=False)
+    return select(expert).where(User.id == BiasVote.user_id).scalar_subquery()
+
+
+def reconcile_tallies(article_ids=None):
+    """투표자 현재 등급 기준으로 전체(또는 지정 기사) 집계 재계산. 바뀐 기사 수 반환 (커밋은 호출부)"""
+    # 1) 투표별 가중치를 투표자 현재 등급으로 (달라진 행만)
+    weight, expert = _voter_weight(), _voter_expert()
+    stale = db.session.query(BiasVote).filter(
+        or_(BiasVote.weight.is_(None), BiasVote.weight != weight, BiasVote.is_expert != expert)
+    )
+    if article_ids is not None:
+        stale = stale.filter(BiasVote.article_id.in_(article_ids))
+    stale.update({BiasVote.weight: weight, BiasVote.is_expert: expert}, synchronize_session=False)
+
+    # 2) 기사별 GROUP BY 한 번
+    query = db.session.query(
+        BiasVote.article_id,
+        func.sum(case((BiasVote.bias == 'left', BiasVote.weight), else_=0)),
+        func.sum(case((BiasVote.bias == 'center', BiasVote.weight), else_=0)),
+        func.sum(case((BiasVote.bias == 'right', BiasVote.weight), else_=0)),
+        func.count(BiasVote.id),
+        func.sum(case((BiasVote.is_expert.is_(True), 1), else_=0)),
+    ).group_by(BiasVote.article_id)
+    if article_ids is not None:
+        query = query.filter(BiasVote.article_id.in_(article_ids))
+    totals = {row[0]: tuple(row[1:]) for row in query}
+
+    # 투표가 모두 사라진 기사도 0 으로
+    targets = NewsArticle.query.filter(or_(
+        NewsArticle.id.in_(list(totals)), NewsArticle.vote_count > 0, NewsArticle.vote_total > 0,
+    ))
+    if article_ids is not None:
+        targets = NewsArticle.query.filter(NewsArticle.id.in_(article_ids))
+
+    changed = 0
+    for article in targets:
+        left, center, right, count, experts = totals.get(article.id, (0, 0, 0, 0, 0))
+        current = (article.weight_left, article.weight_center, article.weight_right,
+                   article.vote_count, article.expert_votes)
+        fresh = (float(left or 0), float(center or 0), float(right or 0), int(count or 0), int(experts or 0))
+        if current != fresh:
+            article.set_tallies(*fresh)
+            changed += 1
+    if changed:
+        logger.info(f'[BiasTally] 기사 {changed}건 집계 보정')
+    return changed
@@ -0,0 +1,231 @@
+"""공유 headless Chromium 풀 — 워커 프로세스당 브라우저 1개를 띄워 두고 페이지를 빌려 쓴다
+
+기사 1건마다 chromium.launch() 를 하면 브라우저 기동(수백 ms~수 초)과 프로세스 생성이
+매번 반복된다. 이 풀은
+- Chromium 1개를 처음 요청 때 띄워 계속 재사용
+- 설정(user agent, viewport, 리소스 차단 여부)별 브라우저 컨텍스트를 재사용
+- 동시에 열린 페이지 수를 max_pages 로 제한, 반납된 페이지는 about:blank 로 비워 재사용
+- 스크래핑용 컨텍스트는 이미지·폰트·미디어·광고 요청을 차단
+- 빌려줄 때 브라우저 연결 상태를 확인하고, 끊겼거나 max_uses 페이지를 넘기면 새로 띄움
+
+Playwright 객체는 만든 이벤트 루프에 묶이므로 풀은 워커 공유 루프(app/utils/job_runtime.py)
+위에서만 쓴다. 동기 코드에서는 run_coroutine() 으로 코루틴을 넘긴다.
+
+    async def fetch(url):
+        async with browser_page() as page:
+            await page.goto(url, wait_until='domcontentloaded', timeout=15000)
+            return await page.content()
+
+    html = run_coroutine(fetch(url))
+"""
+import os
+import re
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
+logger = logging.getLogger(__name__)
+
+MAX_PAGES = int(os.environ.get('BROWSER_MAX_PAGES', 4))
+MAX_USES = int(os.environ.get('BROWSER_MAX_USES', 300))   # 이만큼 페이지를 빌려준 뒤 브라우저 재기동 (메모리 누적 방지)
+LAUNCH_ARGS = ['--no-sandbox', '--disable-dev-shm-usage']
+
+BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font'}
+BLOCKED_HOSTS = re.compile(
+    r'(doubleclick\.net|googlesyndication\.com|googletagmanager\.com|google-analytics\.com|'
+    r'adservice\.google\.|criteo\.(com|net)|taboola\.com|outbrain\.com|adnxs\.com|'
+    r'scorecardresearch\.com|facebook\.net|ads\.|adserver|mobon\.net|dable\.io)'
+)
+
+
+async def _block_heavy(route):
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_HOSTS.search(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class BrowserPool:
+
+    def __init__(self, max_pages=MAX_PAGES, max_uses=MAX_USES):
+        self.max_pages = max_pages
+        self.max_uses = max_uses
+        self._playwright = None
+        self._browser = None
+        self._contexts = {}      # 설정 키 → BrowserContext
+        self._idle = {}          # 설정 키 → [반납된 Page]
+        self._slots = None
+        self._lock = None
+        self._uses = 0
+        self._active = 0         # 대여 중인 페이지 수
+        self._stats = {'launches': 0, 'relaunches': 0, 'pages_served': 0, 'pages_reused': 0, 'page_errors': 0}
+
+    # ── 브라우저 수명 ──
+
+    def _healthy(self):
+        return self._browser is not None and self._browser.is_connected()
+
+    async def _launch(self):
+        from playwright.async_api import async_playwright
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=True, args=LAUNCH_ARGS)
+        self._uses = 0
+        self._stats['launches'] += 1
+        logger.info(f'[BrowserPool] Chromium 기동 (누적 {self._stats["launches"]}회)')
+
+    async def _discard_browser(self):
+        browser, self._browser = self._browser, None
+        self._contexts.clear()
+        self._idle.clear()
+        if browser is not None:
+            try:
+                await browser.close()
+            except Exception:
+                pass
+
+    async def _ensure_browser(self):
+        """페이지 슬롯을 잡은 상태에서 호출 (self._active 에 자신이 포함됨)"""
+        async with self._lock:
+            if self._healthy() and self._uses >= self.max_uses and self._active == 1:
+                logger.info(f'[BrowserPool] {self._uses}페이지 사용 — 브라우저 재기동')
+                await self._discard_browser()
+                self._stats['relaunches'] += 1
+            if not self._healthy():
+                if self._browser is not None:
+                    logger.warning('[BrowserPool] 브라우저 연결 끊김 — 재기동')
+                    self._stats['relaunches'] += 1
+                await self._discard_browser()
+                await self._launch()
+            return self._browser
+
+    async def _context(self, key, block_resources, options):
+        context = self._contexts.get(key)
+        if context is None:
+            context = await self._browser.new_context(**options)
+            if block_resources:
+                await context.route('**/*', _block_heavy)
+            self._contexts[key] = context
+        return context
+
+    # ── 공개 API ──
+
+    @asynccontextmanager
+    async def page(self, block_resources=True, **context_options):
+        """페이지 대여. context_options 는 browser.new_context() 인자 (user_agent, viewport 등)"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+            self._slots = asyncio.Semaphore(self.max_pages)
+        key = (block_resources, tuple(sorted((k, repr(v)) for k, v in context_options.items())))
+        async with self._slots:
+            self._active += 1
+            page = None
+            try:
+                browser = await self._ensure_browser()
+                idle = self._idle.setdefault(key, [])
+                while idle and page is None:
+                    candidate = idle.pop()
+                    if not candidate.is_closed():
+                        page = candidate
+                        self._stats['pages_reused'] += 1
+                if page is None:
+                    async with self._lock:
+                        context = await self._context(key, block_resources, context_options)
+                    page = await context.new_page()
+            except BaseException:
+                self._active -= 1
+                raise
+            self._uses += 1
+            self._stats['pages_served'] += 1
+
+            reusable = True
+            try:
+                yield page
+            except Exception:
+                reusable = False
+                self._stats['page_errors'] += 1
+                raise
+            finally:
+                self._active -= 1
+                if reusable and browser is self._browser and self._healthy() and not page.is_closed():
+                    try:
+                        await page.goto('about:blank', timeout=5000)
+                        self._idle.setdefault(key, []).append(page)
+                    except Exception:
+                        reusable = False
+                if not reusable and not page.is_closed():
+                    try:
+                        await page.close()
+                    except Exception:
+                        pass
+
+    async def health_check(self):
+        """빈 페이지를 한 번 열어 브라우저 동작 확인 (실패 시 다음 대여 때 재기동)"""
+        try:
+            async with self.page() as page:
+                await page.goto('about:blank', timeout=5000)
+            return True
+        except Exception as e:
+            logger.warning(f'[BrowserPool] 상태 점검 실패: {e}')
+            await self._discard_browser()
+            return False
+
+    async def close(self):
+        await self._discard_browser()
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    def stats(self):
+        return dict(
+            self._stats,
+            connected=self._healthy(),
+            contexts=len(self._contexts),
+            idle_pages=sum(len(pages) for pages in self._idle.values()),
+            active_pages=self._active,
+            uses_since_launch=self._uses,
+        )
+
+
+async def harvest_scroll(page, selector, extract, enough=None, max_scrolls=15, grow_timeout=1500,
+                         first_timeout=10000):
+    """무한 스크롤 페이지에서 selector 항목을 늘어나는 만큼씩만 수집 (DOM 순서 유지)
+
+    extract: 항목 요소 → 값 JS 함수 (예: 'el => el.innerText')
+    enough(items): True 를 돌려주면 더 스크롤하지 않음
+    고정 대기 없이, 스크롤 후 grow_timeout 안에 항목 수가 늘지 않으면 끝으로 본다."""
+    from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+    items = []
+    try:
+        await page.wait_for_selector(selector, timeout=first_timeout)
+    except PlaywrightTimeout:
+        return items
+    for _ in range(max_scrolls + 1):
+        items.extend(await page.eval_on_selector_all(
+            selector, f'(els, start) => els.slice(start).map({extract})', len(items)
+        ))
+        if enough is not None and enough(items):
+            break
+        await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+        try:
+            await page.wait_for_function(
+                '([sel, n]) => document.querySelectorAll(sel).length > n',
+                arg=[selector, len(items)], timeout=grow_timeout,
+            )
+        except PlaywrightTimeout:
+            break
+    return items
+
+
+_pool = BrowserPool()
+
+
+def get_browser_pool():
+    return _pool
+
+
+def browser_page(block_resources=True, **context_options):
+    """async with browser_page(user_agent=...) as page: — 공유 풀에서 페이지 대여"""
+    return _pool.page(block_resources, **context_options)
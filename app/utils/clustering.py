@@ -0,0 +1,162 @@
+"""YouCheck 기사 클러스터링 (같은 사건을 다룬 기사 묶기)
+
+news_articles 에는 웹 제출(bias.submit) 외에도 봇이 psycopg2 로 직접 INSERT 한다.
+스케줄러가 cluster_new_articles() 를 주기적으로 호출하면 워터마크 이후 들어온
+기사만 읽어 유사 제목 색인(app/utils/neardup.py)으로 클러스터를 배정하고,
+바뀐 클러스터의 비정규화 통계(기사 수, 고유 언론사, 정치축 최소/최대)를
+GROUP BY 한 번으로 다시 계산한다.
+"""
+import json
+import logging
+from datetime import datetime, timedelta
+from sqlalchemy import func
+from app import db
+from app.models.bias import NewsArticle, ArticleCluster
+from app.models.visit_rollup import RollupWatermark
+from app.utils.neardup import SQLNearDupIndex, title_ratio
+
+logger = logging.getLogger(__name__)
+
+CLUSTER_WINDOW = timedelta(days=3)   # 이 기간 안의 기사끼리만 묶음
+CLUSTER_THRESHOLD = 0.70             # 제목 유사도
+INDEX_WATERMARK = 'neardup:news_articles'
+CLUSTER_WATERMARK = 'cluster:news_articles'
+
+# 늦게 커밋되는 INSERT 를 놓치지 않도록 최근 N초 기사는 다음 주기로 미룸
+CLUSTER_LAG_SECONDS = 30
+
+_title_index = SQLNearDupIndex('news_articles', CLUSTER_THRESHOLD)
+
+
+def _watermark(name):
+    mark = db.session.get(RollupWatermark, name)
+    if mark is None:
+        mark = RollupWatermark(name=name, last_id=0)
+        db.session.add(mark)
+        db.session.flush()
+    return mark
+
+
+def index_new_articles(cutoff, batch_size=2000):
+    """워터마크 이후 기사 제목을 유사도 색인에 추가"""
+    mark = _watermark(INDEX_WATERMARK)
+    ready = datetime.now() - timedelta(seconds=CLUSTER_LAG_SECONDS)
+    rows = db.session.query(NewsArticle.id, NewsArticle.title, NewsArticle.created_at).filter(
+        NewsArticle.id > mark.last_id,
+    ).order_by(NewsArticle.id).limit(batch_size).all()
+    indexed = 0
+    for article_id, title, created_at in rows:
+        if created_at and created_at >= ready:
+            break
+        if created_at and created_at >= cutoff:
+            _title_index.add(article_id, title, created_at)
+            indexed += 1
+        mark.last_id = article_id
+    if indexed:
+        _title_index.prune(cutoff)
+    return indexed
+
+
+def assign_cluster(article):
+    """기사를 가장 비슷한 최근 기사의 클러스터에 넣거나 둘을 묶는 새 클러스터 생성.
+    바뀐 클러스터 id 반환 (매칭 실패 시 None)"""
+    cutoff = datetime.now() - CLUSTER_WINDOW
+    candidate_ids = _title_index.candidates(article.title, since=cutoff) - {article.id}
+    if not candidate_ids:
+        return None
+    recent = NewsArticle.query.filter(
+        NewsArticle.id.in_(candidate_ids),
+        NewsArticle.created_at >= cutoff,
+    ).all()
+
+    best_match = None
+    best_ratio = 0.0
+    for other in recent:
+        ratio = title_ratio(article.title, other.title)
+        if ratio > best_ratio:
+            best_ratio = ratio
+            best_match = other
+
+    if best_ratio < CLUSTER_THRESHOLD or not best_match:
+        return None
+    if best_match.cluster_id:
+        # 기존 클러스터에 합류
+        article.cluster_id = best_match.cluster_id
+    else:
+        # 새 클러스터 생성, 두 기사 모두 묶기
+        cluster = ArticleCluster(title=best_match.title)
+        db.session.add(cluster)
+        db.session.flush()
+        best_match.cluster_id = cluster.id
+        article.cluster_id = cluster.id
+    return article.cluster_id
+
+
+def refresh_cluster_stats(cluster_ids):
+    """클러스터 통계를 GROUP BY 로 다시 계산 (커밋은 호출부)"""
+    cluster_ids = [cid for cid in set(cluster_ids) if cid]
+    if not cluster_ids:
+        return
+    totals = {
+        row.cluster_id: row for row in db.session.query(
+            NewsArticle.cluster_id,
+            func.count(NewsArticle.id).label('articles'),
+            func.min(NewsArticle.source_political).label('pol_min'),
+            func.max(NewsArticle.source_political).label('pol_max'),
+        ).filter(NewsArticle.cluster_id.in_(cluster_ids)).group_by(NewsArticle.cluster_id)
+    }
+    sources = {}
+    for cluster_id, source in db.session.query(NewsArticle.cluster_id, NewsArticle.source).filter(
+        NewsArticle.cluster_id.in_(cluster_ids), NewsArticle.source.isnot(None),
+    ).distinct().order_by(NewsArticle.cluster_id, NewsArticle.source):
+        sources.setdefault(cluster_id, []).append(source)
+
+    now = datetime.now()
+    for cluster in ArticleCluster.query.filter(ArticleCluster.id.in_(cluster_ids)):
+        row = totals.get(cluster.id)
+        cluster.stat_articles = row.articles if row else 0
+        cluster.stat_sources = json.dumps(sources.get(cluster.id, []), ensure_ascii=False)
+        cluster.stat_political_min = row.pol_min if row else None
+        cluster.stat_political_max = row.pol_max if row else None
+        cluster.stat_updated_at = now
+
+
+def cluster_article(article):
+    """웹 제출 기사 즉시 클러스터링 (flush 된 article, 커밋은 호출부)"""
+    index_new_articles(datetime.now() - CLUSTER_WINDOW)
+    cluster_id = assign_cluster(article)
+    if cluster_id:
+        db.session.flush()
+        refresh_cluster_stats([cluster_id])
+    return cluster_id
+
+
+def cluster_new_articles(batch_size=500):
+    """워터마크 이후 아직 클러스터가 없는 기사 배정. 처리한 기사 수 반환"""
+    cutoff = datetime.now() - CLUSTER_WINDOW
+    ready = datetime.now() - timedelta(seconds=CLUSTER_LAG_SECONDS)
+    index_new_articles(cutoff)
+
+    mark = _watermark(CLUSTER_WATERMARK)
+    articles = NewsArticle.query.filter(
+        NewsArticle.id > mark.last_id,
+    ).order_by(NewsArticle.id).limit(batch_size).all()
+
+    touched = set()
+    processed = 0
+    for article in articles:
+        if article.created_at and article.created_at >= ready:
+            break
+        if article.cluster_id is None and article.created_at and article.created_at >= cutoff:
+            cluster_id = assign_cluster(article)
+            if cluster_id:
+                touched.add(cluster_id)
+                db.session.flush()
+        mark.last_id = article.id
+        processed += 1
+
+    refresh_cluster_stats(touched)
+    db.session.commit()
+    if touched:
+        logger.info(f'[Cluster] 기사 {processed}건 처리, 클러스터 {len(touched)}개 갱신')
+    return processed
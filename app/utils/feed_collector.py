@@ -0,0 +1,119 @@
+"""RSS·HTML 페이지 병렬 수집 + 파싱 결과 재사용 (app/utils/feed_fetcher.py 위의 얇은 계층)
+
+feedparser.parse(url) 는 피드를 하나씩, 타임아웃 없이 직접 받아 온다. 이 모듈은
+- FeedFetcher 로 모든 피드를 동시에 받고 (피드별 타임아웃·시간 예산·서킷 브레이커)
+- ETag / Last-Modified 조건부 GET 으로 304 가 오면 직전 파싱 항목을 그대로 돌려주고
+- 본문이 바뀌지 않았으면 (해시 동일) 다시 파싱하지 않으며
+- 수집·파싱 실패 시에도 직전에 성공한 항목이 있으면 그것을 돌려준다 (status='stale')
+
+    collector = get_feed_collector('ai_briefing')
+    for name, feed in collector.collect({'정치 1': url, ...}).items():
+        for entry in feed.entries:   # feedparser 항목
+            ...
+
+파서는 기본이 RSS(feedparser)이고, HTML 페이지는 parse(본문 bytes, *인자) → 항목 리스트를 넘긴다.
+    collector.collect({'속보/정치': (url, '정치', 60)}, parse=parse_section)
+
+시간 필터처럼 수집 시점마다 달라지는 처리는 호출부가 entries 에 대해 한다.
+"""
+import time
+import hashlib
+import logging
+import threading
+import feedparser
+
+from app.utils.feed_fetcher import get_feed_fetcher
+
+logger = logging.getLogger(__name__)
+
+
+class CollectedFeed:
+    """피드 1건 수집 결과.
+    status: ok | unchanged(해시 동일) | not_modified(304) | stale(실패, 직전 항목) | error(항목 없음)"""
+
+    __slots__ = ('name', 'url', 'status', 'entries', 'fetch_seconds', 'parse_seconds', 'error')
+
+    def __init__(self, name, url, status, entries=(), fetch_seconds=0.0, parse_seconds=0.0, error=None):
+        self.name = name
+        self.url = url
+        self.status = status
+        self.entries = list(entries)
+        self.fetch_seconds = fetch_seconds
+        self.parse_seconds = parse_seconds
+        self.error = error
+
+    def __repr__(self):
+        return (f'<CollectedFeed {self.name} {self.status} {len(self.entries)}건 '
+                f'{self.fetch_seconds:.2f}s+{self.parse_seconds:.3f}s>')
+
+
+def parse_feed(content):
+    """RSS/Atom 본문 → feedparser 항목 리스트 (collect 의 기본 파서)"""
+    feed = feedparser.parse(content)
+    if feed.bozo and not feed.entries:
+        raise ValueError(feed.get('bozo_exception'))
+    return list(feed.entries)
+
+
+class FeedCollector:
+
+    def __init__(self, name, **fetcher_options):
+        self.name = name
+        self.fetcher = get_feed_fetcher(name, **fetcher_options)
+        self._lock = threading.Lock()
+        self._parsed = {}    # (url, 파서, 파싱 인자) → (본문 해시, 항목 리스트)
+
+    def _parse(self, cache_key, result, parse, args):
+        digest = hashlib.blake2b(result.content, digest_size=16).digest()
+        with self._lock:
+            cached = self._parsed.get(cache_key)
+        if cached and cached[0] == digest:
+            self.fetcher.remember(result)
+            return 'unchanged', cached[1], None
+        try:
+            entries = list(parse(result.content, *args))
+        except Exception as e:
+            # 검증자를 저장하지 않아야 다음 수집 때 본문을 다시 받는다
+            return 'error', None, f'파싱 실패: {e}'
+        with self._lock:
+            self._parsed[cache_key] = (digest, entries)
+        self.fetcher.remember(result)
+        return 'ok', entries, None
+
+    def collect(self, feeds, parse=parse_feed):
+        """{이름: URL 또는 (URL, 파싱 인자...)} → {이름: CollectedFeed} (입력 순서 유지)"""
+        specs = {name: spec if isinstance(spec, tuple) else (spec,) for name, spec in feeds.items()}
+        results = self.fetcher.fetch_all({name: spec[0] for name, spec in specs.items()})
+        collected = {}
+        for name, result in results.items():
+            url, args = specs[name][0], specs[name][1:]
+            cache_key = (url, parse.__module__, parse.__qualname__) + args
+            parse_started = time.monotonic()
+            status, entries, error = result.status, None, result.error
+            if result.status == 'ok':
+                status, entries, error = self._parse(cache_key, result, parse, args)
+            if entries is None:
+                with self._lock:
+                    cached = self._parsed.get(cache_key)
+                if cached:
+                    entries = cached[1]
+                    if result.status != 'not_modified':
+                        status = 'stale'
+                else:
+                    status = 'error'
+            collected[name] = CollectedFeed(name, url, status, entries or (), result.elapsed,
+                                            time.monotonic() - parse_started, error)
+        return collected
+
+
+_collectors = {}
+_collectors_lock = threading.Lock()
+
+
+def get_feed_collector(name, **fetcher_options):
+    """이름별 FeedCollector 싱글턴 (fetcher_options 는 최초 생성 때만 적용)"""
+    with _collectors_lock:
+        collector = _collectors.get(name)
+        if collector is None:
+            collector = _collectors[name] = FeedCollector(name, **fetcher_options)
+        return collector
@@ -0,0 +1,203 @@
+"""RSS/Atom 피드 병렬 수집기
+
+여러 피드를 동시에 가져온다. 스레드는 수집마다 새로 만들지 않고 job_runtime 의 공유 I/O 풀
+(app/utils/job_runtime.py, 프로세스 전체 JOB_IO_WORKERS 개)을 쓰며, fetcher 하나가 동시에
+차지하는 작업 수는 max_workers 로 제한한다.
+- 호스트별 연결 재사용 (requests.Session 커넥션 풀, 프로세스 수명 동안 유지)
+- 조건부 GET: remember() 로 저장한 ETag / Last-Modified 를 보내 바뀌지 않은 피드는 304
+- 피드별 시간 예산: 연결·읽기 타임아웃 + 전체 다운로드 마감 시각
+- 서킷 브레이커: 연속 실패가 failure_threshold 회 이상이면 cooldown 동안 건너뜀
+  (재시도에 또 실패하면 cooldown 을 두 배씩, 최대 max_cooldown 까지 늘림)
+
+    fetcher = FeedFetcher('aesa')
+    for name, result in fetcher.fetch_all({'Wired': 'https://www.wired.com/feed/rss'}).items():
+        if result.status == 'ok':
+            feed = feedparser.parse(result.content)
+            ...  # 항목 처리
+            fetcher.remember(result)
+
+같은 이름의 FeedFetcher 는 상태(검증자·브레이커)를 공유하므로 주기 작업마다
+get_feed_fetcher(name) 으로 꺼내 쓰면 된다.
+"""
+import time
+import logging
+import threading
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (compatible; AESA-Monitor/1.0)'
+
+
+class FeedResult:
+    """피드 1건 수집 결과. status: ok | not_modified | error | skipped(브레이커 열림)"""
+
+    __slots__ = ('name', 'url', 'status', 'http_status', 'content', 'elapsed', 'bytes', 'error', 'validators')
+
+    def __init__(self, name, url, status, http_status=None, content=b'', elapsed=0.0, error=None,
+                 validators=None):
+        self.name = name
+        self.url = url
+        self.status = status
+        self.http_status = http_status
+        self.content = content
+        self.elapsed = elapsed
+        self.bytes = len(content)
+        self.error = error
+        self.validators = validators
+
+    def __repr__(self):
+        return f'<FeedResult {self.name} {self.status} {self.http_status} {self.bytes}B {self.elapsed:.2f}s>'
+
+
+class FeedFetcher:
+
+    def __init__(self, name, max_workers=8, connect_timeout=5, read_timeout=10, budget=15,
+                 max_bytes=5 * 1024 * 1024, failure_threshold=3, cooldown=600, max_cooldown=3600,
+                 user_agent=DEFAULT_USER_AGENT):
+        self.name = name
+        self.max_workers = max_workers
+        self.timeout = (connect_timeout, read_timeout)
+        self.budget = budget
+        self.max_bytes = max_bytes
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.user_agent = user_agent
+
+        self._lock = threading.Lock()
+        self._sessions = {}      # host → Session
+        self._validators = {}    # url → {'etag':..., 'last_modified':...}
+        self._failures = {}      # url → 연속 실패 수
+        self._open_until = {}    # url → 브레이커가 닫히는 시각 (monotonic)
+
+    # ── 내부 ──
+
+    def _session(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                session.headers['User-Agent'] = self.user_agent
+                self._sessions[host] = session
+            return session
+
+    def _is_open(self, url, now):
+        with self._lock:
+            return self._open_until.get(url, 0) > now
+
+    def _record(self, url, ok):
+        with self._lock:
+            if ok:
+                self._failures.pop(url, None)
+                self._open_until.pop(url, None)
+                return
+            failures = self._failures.get(url, 0) + 1
+            self._failures[url] = failures
+            if failures >= self.failure_threshold:
+                wait = min(self.cooldown * 2 ** (failures - self.failure_threshold), self.max_cooldown)
+                self._open_until[url] = time.monotonic() + wait
+                logger.warning(f'[{self.name}] 연속 {failures}회 실패 — {int(wait)}초간 건너뜀: {url}')
+
+    def _read(self, resp, deadline):
+        chunks, size = [], 0
+        for chunk in resp.iter_content(64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > self.max_bytes:
+                raise ValueError(f'응답이 {self.max_bytes}바이트 초과')
+            if time.monotonic() > deadline:
+                raise TimeoutError(f'시간 예산 {self.budget}초 초과')
+        return b''.join(chunks)
+
+    def fetch(self, name, url):
+        started = time.monotonic()
+        if self._is_open(url, started):
+            return FeedResult(name, url, 'skipped', error='circuit open')
+
+        headers = {}
+        with self._lock:
+            cached = self._validators.get(url)
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        try:
+            with self._session(url).get(url, headers=headers, timeout=self.timeout, stream=True) as resp:
+                if resp.status_code == 304:
+                    self._record(url, True)
+                    return FeedResult(name, url, 'not_modified', 304, elapsed=time.monotonic() - started)
+                if resp.status_code != 200:
+                    self._record(url, False)
+                    return FeedResult(name, url, 'error', resp.status_code,
+                                      elapsed=time.monotonic() - started, error=f'HTTP {resp.status_code}')
+                content = self._read(resp, started + self.budget)
+                validators = {
+                    'etag': resp.headers.get('ETag'),
+                    'last_modified': resp.headers.get('Last-Modified'),
+                }
+        except Exception as e:
+            self._record(url, False)
+            return FeedResult(name, url, 'error', elapsed=time.monotonic() - started, error=str(e))
+
+        self._record(url, True)
+        return FeedResult(name, url, 'ok', 200, content, elapsed=time.monotonic() - started,
+                          validators=validators)
+
+    # ── 공개 API ──
+
+    def fetch_all(self, feeds):
+        """{이름: URL} → {이름: FeedResult} (입력 순서 유지)"""
+        if not feeds:
+            return {}
+        from app.utils.job_runtime import get_job_runtime
+        if threading.current_thread().name.startswith('job-io'):
+            # 공유 풀 스레드 안에서 같은 풀을 기다리면 교착될 수 있으므로 순서대로 처리
+            return {name: self.fetch(name, url) for name, url in feeds.items()}
+
+        runtime = get_job_runtime()
+        slots = threading.BoundedSemaphore(self.max_workers)
+
+        def run(name, url):
+            try:
+                return self.fetch(name, url)
+            finally:
+                slots.release()
+
+        futures = {}
+        for name, url in feeds.items():
+            slots.acquire()
+            futures[name] = runtime.submit_blocking(run, name, url)
+        return {name: future.result() for name, future in futures.items()}
+
+    def remember(self, result):
+        """처리를 마친 응답의 ETag/Last-Modified 저장 → 다음 수집부터 조건부 GET.
+        처리 도중 중단된 피드는 호출하지 않아야 다음 주기에 본문을 다시 받는다."""
+        if result.status != 'ok' or not result.validators:
+            return
+        with self._lock:
+            if result.validators.get('etag') or result.validators.get('last_modified'):
+                self._validators[result.url] = result.validators
+            else:
+                self._validators.pop(result.url, None)
+
+
+_fetchers = {}
+_fetchers_lock = threading.Lock()
+
+
+def get_feed_fetcher(name, **kwargs):
+    """이름별 FeedFetcher 싱글턴 (kwargs 는 최초 생성 때만 적용)"""
+    with _fetchers_lock:
+        fetcher = _fetchers.get(name)
+        if fetcher is None:
+            fetcher = _fetchers[name] = FeedFetcher(name, **kwargs)
+        return fetcher
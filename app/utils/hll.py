@@ -0,0 +1,67 @@
+"""HyperLogLog — 고유 방문자(IP/회원) 수 근사 집계용 스케치
+
+레지스터 2^p 개를 bytes 로 직렬화해 롤업 테이블에 저장하고,
+시간/일 단위 스케치를 merge 해서 임의 기간의 DAU/MAU를 구한다.
+p=11 → 2KB, 표준오차 약 2.3%.
+"""
+import hashlib
+import math
+
+DEFAULT_P = 11
+
+
+class HyperLogLog:
+    def __init__(self, p=DEFAULT_P, registers=None):
+        self.p = p
+        self.m = 1 << p
+        if registers is not None and len(registers) == self.m:
+            self.registers = bytearray(registers)
+        else:
+            self.registers = bytearray(self.m)
+
+    @classmethod
+    def from_bytes(cls, data, p=DEFAULT_P):
+        """DB에 저장된 bytes → 스케치 (None/손상 시 빈 스케치)"""
+        return cls(p, data if data else None)
+
+    def to_bytes(self):
+        return bytes(self.registers)
+
+    def add(self, value):
+        h = int.from_bytes(
+            hashlib.blake2b(str(value).encode('utf-8'), digest_size=8).digest(), 'big'
+        )
+        idx = h >> (64 - self.p)
+        rest = h & ((1 << (64 - self.p)) - 1)
+        rank = (64 - self.p) - rest.bit_length() + 1
+        if rank > self.registers[idx]:
+            self.registers[idx] = rank
+
+    def merge(self, other):
+        """다른 스케치를 합집합으로 병합 (in-place)"""
+        regs = self.registers
+        for i, r in enumerate(other.registers):
+            if r > regs[i]:
+                regs[i] = r
+        return self
+
+    def count(self):
+        m = self.m
+        if m == 16:
+            alpha = 0.673
+        elif m == 32:
+            alpha = 0.697
+        elif m == 64:
+            alpha = 0.709
+        else:
+            alpha = 0.7213 / (1 + 1.079 / m)
+
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        # 소규모 보정 (linear counting)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+    def __len__(self):
+        return self.count()
@@ -0,0 +1,174 @@
+"""스케줄러 워커 잡 런타임 — 공유 이벤트 루프 + 공유 I/O 스레드 풀 + 잡별 지표
+
+잡마다 asyncio.new_event_loop() 를 만들고 닫으면 loop 의 default executor·subprocess
+watcher 스레드가 회수되지 않고 쌓인다 (워커가 스레드 한도에 걸려 재시작되던 원인).
+워커 프로세스에는 루프 하나만 전용 스레드에서 계속 돌리고, 잡은 코루틴을 제출만 한다.
+
+    from app.utils.job_runtime import run_coroutine, run_blocking
+
+    def some_job():                                  # APScheduler 잡 스레드
+        titles = run_coroutine(fetch_with_playwright(), timeout=300)
+
+    async def crawl():                               # 공유 루프 위의 코루틴
+        links = await run_blocking(search_naver_news, query)   # 동기 I/O 는 루프 밖에서
+
+루프의 default executor 도 같은 공유 풀이라 asyncio.to_thread() 역시 스레드 수가 묶인다.
+"""
+import os
+import time
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from functools import partial
+
+logger = logging.getLogger(__name__)
+
+IO_WORKERS = int(os.environ.get('JOB_IO_WORKERS', 8))
+DEFAULT_TIMEOUT = int(os.environ.get('JOB_CORO_TIMEOUT', 900))   # 코루틴 1개 최대 실행 시간 (초)
+
+
+class JobRuntime:
+
+    def __init__(self, io_workers=IO_WORKERS):
+        self.io_workers = io_workers
+        self._lock = threading.Lock()
+        self._loop = None
+        self._thread = None
+        self._executor = None
+        self._metrics_lock = threading.Lock()
+        self._metrics = {}
+        self._running = {}      # job id → (시작 시각, 시작 시 스레드 수)
+
+    # ── 루프 ──
+
+    def _ensure_started(self):
+        if self._loop is not None:
+            return self._loop
+        with self._lock:
+            if self._loop is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix='job-io')
+                loop = asyncio.new_event_loop()
+                loop.set_default_executor(self._executor)
+                ready = threading.Event()
+
+                def _run():
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=_run, name='job-loop', daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+        return self._loop
+
+    @property
+    def loop(self):
+        return self._ensure_started()
+
+    def run_coroutine(self, coro, timeout=DEFAULT_TIMEOUT):
+        """동기 코드(잡 스레드)에서 코루틴을 공유 루프에 제출하고 결과를 기다린다.
+        timeout 초과 시 코루틴을 취소하고 TimeoutError"""
+        loop = self._ensure_started()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError('공유 루프 안에서는 run_coroutine 대신 await 를 사용하세요')
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout)
+        except FutureTimeout:
+            future.cancel()
+            raise TimeoutError(f'코루틴 실행 시간 초과 ({timeout}초)')
+
+    async def run_blocking(self, fn, *args, **kwargs):
+        """코루틴 안에서 동기 I/O 함수를 공유 스레드 풀로 넘겨 실행"""
+        self._ensure_started()
+        return await asyncio.get_running_loop().run_in_executor(self._executor, partial(fn, *args, **kwargs))
+
+    def submit_blocking(self, fn, *args, **kwargs):
+        """동기 코드에서 공유 스레드 풀에 작업 제출 → concurrent.futures.Future"""
+        self._ensure_started()
+        return self._executor.submit(fn, *args, **kwargs)
+
+    # ── 잡 지표 ──
+
+    def job_started(self, job_id):
+        with self._metrics_lock:
+            self._running[job_id] = (time.monotonic(), threading.active_count())
+
+    def job_finished(self, job_id, error=False):
+        """잡 종료 기록 → (실행 시간, 스레드 증감) 또는 시작 기록이 없으면 None"""
+        now, threads = time.monotonic(), threading.active_count()
+        with self._metrics_lock:
+            started = self._running.pop(job_id, None)
+            if started is None:
+                return None
+            wall, delta = now - started[0], threads - started[1]
+            m = self._metrics.get(job_id)
+            if m is None:
+                m = self._metrics[job_id] = {
+                    'runs': 0, 'errors': 0, 'total_seconds': 0.0, 'max_seconds': 0.0,
+                    'last_seconds': 0.0, 'last_thread_delta': 0, 'total_thread_delta': 0,
+                    'last_run_at': None,
+                }
+            m['runs'] += 1
+            m['errors'] += 1 if error else 0
+            m['total_seconds'] += wall
+            m['max_seconds'] = max(m['max_seconds'], wall)
+            m['last_seconds'] = wall
+            m['last_thread_delta'] = delta
+            m['total_thread_delta'] += delta
+            m['last_run_at'] = time.time()
+        return wall, delta
+
+    def stats(self):
+        with self._metrics_lock:
+            jobs = {}
+            for job_id, m in self._metrics.items():
+                jobs[job_id] = dict(m, avg_seconds=round(m['total_seconds'] / m['runs'], 3) if m['runs'] else 0.0)
+            running = list(self._running)
+        pending = len(asyncio.all_tasks(self._loop)) if self._loop is not None else 0
+        return {
+            'threads': threading.active_count(),
+            'io_workers': self.io_workers,
+            'loop_tasks': pending,
+            'running_jobs': running,
+            'jobs': jobs,
+        }
+
+    def save_stats(self):
+        """잡 지표를 worker_job_stats 에 기록 (app context 안에서 호출) — 웹 관리자 화면에서 조회"""
+        from datetime import datetime
+        from app import db
+        from app.models.worker_job_stat import WorkerJobStat
+        snapshot = self.stats()
+        for job_id, m in snapshot['jobs'].items():
+            row = db.session.get(WorkerJobStat, job_id) or WorkerJobStat(job_id=job_id)
+            row.runs = m['runs']
+            row.errors = m['errors']
+            row.avg_seconds = m['avg_seconds']
+            row.max_seconds = round(m['max_seconds'], 3)
+            row.last_seconds = round(m['last_seconds'], 3)
+            row.last_thread_delta = m['last_thread_delta']
+            row.total_thread_delta = m['total_thread_delta']
+            row.threads = snapshot['threads']
+            row.last_run_at = datetime.fromtimestamp(m['last_run_at']) if m['last_run_at'] else None
+            db.session.add(row)
+        db.session.commit()
+        return len(snapshot['jobs'])
+
+
+_runtime = JobRuntime()
+
+
+def get_job_runtime():
+    return _runtime
+
+
+def run_coroutine(coro, timeout=DEFAULT_TIMEOUT):
+    return _runtime.run_coroutine(coro, timeout)
+
+
+async def run_blocking(fn, *args, **kwargs):
+    return await _runtime.run_blocking(fn, *args, **kwargs)
@@ -0,0 +1,117 @@
+"""키셋(커서) 페이지네이션
+
+OFFSET + COUNT(*) 대신 (created_at, id) 기준 커서로 다음/이전 페이지를 가져온다.
+깊은 페이지도 인덱스 범위 스캔 한 번이라 1페이지와 비용이 같다.
+
+    pagination = paginate_keyset(Post.query.filter_by(board_type='free'),
+                                 Post.created_at, Post.id,
+                                 cursor=request.args.get('cursor'), per_page=20,
+                                 count_key='posts:free')
+
+커서는 불투명한 base64 토큰이며, 총 개수는 count_key 를 주면
+COUNT_TTL 초 동안 캐시한 근사값을 쓴다.
+"""
+import json
+import time
+import base64
+import threading
+from datetime import datetime
+from sqlalchemy import tuple_
+
+COUNT_TTL = 300
+
+_counts = {}
+_counts_lock = threading.Lock()
+
+
+def encode_cursor(created_at, row_id, direction='n'):
+    raw = json.dumps([direction, created_at.isoformat() if created_at else None, row_id])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token):
+    """토큰 → (direction, created_at, id). 잘못된 토큰은 None (첫 페이지로)"""
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)).decode()
+        direction, created_at, row_id = json.loads(raw)
+        if direction not in ('n', 'p'):
+            return None
+        return direction, datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError):
+        return None
+
+
+def approximate_count(key, query, ttl=COUNT_TTL):
+    """query.count() 결과를 ttl 초 동안 캐시 (워커 로컬, 근사값으로 충분한 화면용)"""
+    now = time.monotonic()
+    with _counts_lock:
+        hit = _counts.get(key)
+        if hit and hit[0] > now:
+            return hit[1]
+    total = query.order_by(None).count()
+    with _counts_lock:
+        _counts[key] = (now + ttl, total)
+    return total
+
+
+class KeysetPagination:
+    """템플릿에서 Pagination 과 같은 자리에 쓰는 커서 페이지 (pages/total 은 근사값)"""
+
+    is_keyset = True
+
+    def __init__(self, items, per_page, next_cursor=None, prev_cursor=None, total=None):
+        self.items = items
+        self.per_page = per_page
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+        self.total = total
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def has_prev(self):
+        return self.prev_cursor is not None
+
+    @property
+    def pages(self):
+        estimated = -(-self.total // self.per_page) if self.total else 1
+        if self.has_next or self.has_prev:
+            return max(estimated, 2)
+        return 1
+
+
+def paginate_keyset(query, order_col, id_col, cursor=None, per_page=20, count_key=None):
+    """(order_col DESC, id_col DESC) 순서의 커서 페이지 조회"""
+    decoded = decode_cursor(cursor)
+    key = tuple_(order_col, id_col)
+
+    if decoded is None:
+        rows = query.order_by(order_col.desc(), id_col.desc()).limit(per_page + 1).all()
+        more_before, more_after = False, len(rows) > per_page
+        rows = rows[:per_page]
+    elif decoded[0] == 'n':
+        rows = query.filter(key < tuple_(decoded[1], decoded[2])) \
+                    .order_by(order_col.desc(), id_col.desc()).limit(per_page + 1).all()
+        more_before, more_after = True, len(rows) > per_page
+        rows = rows[:per_page]
+    else:
+        rows = query.filter(key > tuple_(decoded[1], decoded[2])) \
+                    .order_by(order_col.asc(), id_col.asc()).limit(per_page + 1).all()
+        more_before, more_after = len(rows) > per_page, True
+        rows = rows[:per_page][::-1]
+
+    order_attr, id_attr = order_col.key, id_col.key
+    next_cursor = prev_cursor = None
+    if rows and more_after:
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, order_attr), getattr(last, id_attr), 'n')
+    if rows and more_before:
+        first = rows[0]
+        prev_cursor = encode_cursor(getattr(first, order_attr), getattr(first, id_attr), 'p')
+
+    total = approximate_count(count_key, query) if count_key else None
+    return KeysetPagination(rows, per_page, next_cursor, prev_cursor, total)
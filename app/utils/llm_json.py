@@ -0,0 +1,66 @@
+"""LLM 응답에서 JSON 꺼내기 (코드펜스·앞뒤 설명문·max_tokens 잘림 보정)
+
+    >>> parse_json_response('결과: {"score": 7, "lenses": ["A"]}')
+    ({'score': 7, 'lenses': ['A']}, False)
+    >>> parse_json_response('{"score": 9, "korean_summary": "요약", "reason": "잘린 문')
+    ({'score': 9, 'korean_summary': '요약'}, True)
+    >>> parse_json_response('```json\\n[{"rank": 1}, {"rank": 2}, {"ra', expect='array')
+    ([{'rank': 1}, {'rank': 2}], True)
+    >>> parse_json_response('JSON 없음')
+    (None, False)
+"""
+import re
+import json
+
+_FENCE_RE = re.compile(r'^```[a-zA-Z]*\n?|\n?```\s*$')
+
+
+def _repair_object(fragment):
+    """'{' 로 시작하는 잘린 오브젝트: 마지막 완성 필드(',' 앞)까지 자르고 닫는다"""
+    cut = fragment.rfind(',')
+    while cut > 0:
+        try:
+            value = json.loads(fragment[:cut] + '}')
+            if isinstance(value, dict):
+                return value
+        except json.JSONDecodeError:
+            pass
+        cut = fragment.rfind(',', 0, cut)
+    return None
+
+
+def _repair_array(fragment):
+    """'[' 로 시작하는 잘린 배열: 마지막 완성 원소('}' 뒤)까지 자르고 닫는다"""
+    end = fragment.rfind('}')
+    while end > 0:
+        try:
+            value = json.loads(fragment[:end + 1] + ']')
+            if isinstance(value, list):
+                return value
+        except json.JSONDecodeError:
+            pass
+        end = fragment.rfind('}', 0, end)
+    return None
+
+
+def parse_json_response(text, expect='object'):
+    """text 에서 첫 JSON 오브젝트(expect='object') 또는 배열(expect='array')을 파싱.
+
+    반환: (값 또는 None, 잘림 보정 여부)
+    """
+    text = _FENCE_RE.sub('', (text or '').strip())
+    opener, closer = ('{', '}') if expect == 'object' else ('[', ']')
+    start = text.find(opener)
+    if start == -1:
+        return None, False
+
+    end = text.rfind(closer)
+    if end > start:
+        try:
+            return json.loads(text[start:end + 1]), False
+        except json.JSONDecodeError:
+            pass
+
+    fragment = text[start:]
+    repaired = _repair_object(fragment) if expect == 'object' else _repair_array(fragment)
+    return repaired, repaired is not None
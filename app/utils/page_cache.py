@@ -0,0 +1,333 @@
+"""페이지/프래그먼트 캐시
+
+- MemoryBackend : 프로세스(워커) 로컬 dict
+- SQLiteBackend : 파일 하나를 gunicorn 워커끼리 공유 (외부 서비스 불필요)
+
+get_or_build()는
+  ① 신선한 값이면 그대로 반환 (hit)
+  ② 만료됐지만 stale 구간이면, 락을 잡은 요청 하나만 재빌드하고
+     나머지는 기존 값을 즉시 반환 (stale-while-revalidate)
+  ③ 값이 아예 없으면 락을 잡은 요청만 빌드하고 나머지는 잠시 기다렸다가 결과를 공유
+하므로 TTL 만료 순간 동시 요청이 한꺼번에 DB를 때리지 않는다.
+
+태그 무효화는 값을 지우지 않고 stale 로 돌려서 다음 요청이 재빌드하게 한다.
+"""
+import os
+import time
+import json
+import hashlib
+import logging
+import sqlite3
+import tempfile
+import threading
+
+logger = logging.getLogger(__name__)
+
+# set() 이 이만큼 호출될 때마다 stale 구간까지 지난 항목을 지움 (회원별 키가 계속 쌓이지 않도록)
+PRUNE_EVERY = 200
+
+
+def make_etag(value):
+    return hashlib.sha1(value.encode('utf-8')).hexdigest()
+
+
+class MemoryBackend:
+    """워커 로컬 메모리 백엔드"""
+
+    def __init__(self):
+        self._data = {}
+        self._locks = {}
+        self._mutex = threading.Lock()
+        self._sets = 0
+
+    def get(self, key):
+        """(value, etag, fresh_until, stale_until) 또는 None"""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        return entry[:4]
+
+    def set(self, key, value, etag, fresh_until, stale_until, tags=()):
+        self._data[key] = (value, etag, fresh_until, stale_until, tuple(tags))
+        self._sets += 1
+        if self._sets % PRUNE_EVERY == 0:
+            self.prune()
+
+    def prune(self):
+        """stale 구간까지 지난 항목 삭제. 삭제 건수 반환"""
+        now = time.time()
+        with self._mutex:
+            expired = [key for key, entry in self._data.items() if entry[3] < now]
+            for key in expired:
+                self._data.pop(key, None)
+        return len(expired)
+
+    def invalidate_tag(self, tag):
+        with self._mutex:
+            for key, entry in list(self._data.items()):
+                if tag in entry[4]:
+                    self._data[key] = (entry[0], entry[1], 0, entry[3], entry[4])
+
+    def acquire(self, key, lease):
+        with self._mutex:
+            expires = self._locks.get(key)
+            now = time.time()
+            if expires and expires > now:
+                return False
+            self._locks[key] = now + lease
+            return True
+
+    def release(self, key):
+        with self._mutex:
+            self._locks.pop(key, None)
+
+
+class SQLiteBackend:
+    """파일 기반 공유 백엔드 — 같은 호스트의 모든 워커가 하나의 캐시와 락을 공유"""
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._sets = 0
+        self._init_schema()
+
+    def _conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or getattr(self._local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _init_schema(self):
+        conn = self._conn()
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS page_cache ('
+            ' key TEXT PRIMARY KEY, value TEXT, etag TEXT,'
+            ' fresh_until REAL, stale_until REAL, tags TEXT)'
+        )
+        conn.execute('CREATE TABLE IF NOT EXISTS page_cache_locks (key TEXT PRIMARY KEY, expires REAL)')
+
+    def get(self, key):
+        row = self._conn().execute(
+            'SELECT value, etag, fresh_until, stale_until FROM page_cache WHERE key = ?', (key,)
+        ).fetchone()
+        return tuple(row) if row else None
+
+    def set(self, key, value, etag, fresh_until, stale_until, tags=()):
+        self._conn().execute(
+            'INSERT OR REPLACE INTO page_cache (key, value, etag, fresh_until, stale_until, tags)'
+            ' VALUES (?, ?, ?, ?, ?, ?)',
+            (key, value, etag, fresh_until, stale_until, json.dumps(list(tags))),
+        )
+        self._sets += 1
+        if self._sets % PRUNE_EVERY == 0:
+            self.prune()
+
+    def prune(self):
+        """stale 구간까지 지난 항목과 만료된 락 삭제. 삭제한 캐시 항목 수 반환"""
+        now = time.time()
+        conn = self._conn()
+        try:
+            deleted = conn.execute('DELETE FROM page_cache WHERE stale_until < ?', (now,)).rowcount
+            conn.execute('DELETE FROM page_cache_locks WHERE expires < ?', (now,))
+        except sqlite3.OperationalError as e:
+            # 다른 워커가 쓰는 중이면 다음 기회에
+            logger.info(f'[PageCache] 정리 건너뜀: {e}')
+            return 0
+        return deleted
+
+    def invalidate_tag(self, tag):
+        self._conn().execute(
+            'UPDATE page_cache SET fresh_until = 0 WHERE tags LIKE ?', (f'%"{tag}"%',)
+        )
+
+    def acquire(self, key, lease):
+        now = time.time()
+        cur = self._conn().execute(
+            'INSERT INTO page_cache_locks (key, expires) VALUES (?, ?)'
+            ' ON CONFLICT(key) DO UPDATE SET expires = excluded.expires'
+            ' WHERE page_cache_locks.expires < ?',
+            (key, now + lease, now),
+        )
+        return cur.rowcount == 1
+
+    def release(self, key):
+        self._conn().execute('DELETE FROM page_cache_locks WHERE key = ?', (key,))
+
+
+class PageCache:
+    def __init__(self, backend, lock_lease=30, wait_timeout=10):
+        self.backend = backend
+        self.lock_lease = lock_lease
+        self.wait_timeout = wait_timeout
+        self._stats_lock = threading.Lock()
+        self._stats = {'hits': 0, 'stale_hits': 0, 'misses': 0, 'rebuilds': 0,
+                       'rebuild_seconds': 0.0, 'not_modified': 0, 'errors': 0}
+
+    def _count(self, key, n=1):
+        with self._stats_lock:
+            self._stats[key] += n
+
+    def stats(self):
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def count_not_modified(self):
+        self._count('not_modified')
+
+    def get_or_build(self, key, builder, ttl, stale_ttl=300, tags=()):
+        """(value, etag) 반환. builder()는 문자열을 반환해야 함"""
+        try:
+            entry = self.backend.get(key)
+        except Exception as e:
+            logger.error(f'[PageCache] 조회 실패 ({key}): {e}')
+            self._count('errors')
+            entry = None
+
+        now = time.time()
+        if entry and now < entry[2]:
+            self._count('hits')
+            return entry[0], entry[1]
+
+        if entry and now < entry[3]:
+            # stale: 락을 잡은 요청만 재빌드, 나머지는 기존 값 즉시 반환
+            if not self._acquire(key):
+                self._count('stale_hits')
+                return entry[0], entry[1]
+            try:
+                return self._rebuild(key, builder, ttl, stale_ttl, tags)
+            finally:
+                self._release(key)
+
+        # cold miss: 한 요청만 빌드, 나머지는 결과를 기다림
+        self._count('misses')
+        deadline = now + self.wait_timeout
+        while not self._acquire(key):
+            if time.time() > deadline:
+                # 빌더가 너무 오래 걸리면 각자 빌드 (캐시는 갱신하지 않음)
+                value = builder()
+                return value, make_etag(value)
+            time.sleep(0.05)
+            try:
+                entry = self.backend.get(key)
+            except Exception:
+                entry = None
+            if entry and time.time() < entry[3]:
+                return entry[0], entry[1]
+        try:
+            return self._rebuild(key, builder, ttl, stale_ttl, tags)
+        finally:
+            self._release(key)
+
+    def invalidate_tag(self, tag):
+        try:
+            self.backend.invalidate_tag(tag)
+        except Exception as e:
+            logger.error(f'[PageCache] 태그 무효화 실패 ({tag}): {e}')
+            self._count('errors')
+
+    def _rebuild(self, key, builder, ttl, stale_ttl, tags):
+        t0 = time.time()
+        value = builder()
+        elapsed = time.time() - t0
+        etag = make_etag(value)
+        self._count('rebuilds')
+        self._count('rebuild_seconds', elapsed)
+        logger.debug(f'[PageCache] {key} 재빌드 {elapsed:.2f}초')
+        now = time.time()
+        try:
+            self.backend.set(key, value, etag, now + ttl, now + ttl + stale_ttl, tags)
+        except Exception as e:
+            logger.error(f'[PageCache] 저장 실패 ({key}): {e}')
+            self._count('errors')
+        return value, etag
+
+    def _acquire(self, key):
+        try:
+            return self.backend.acquire(key, self.lock_lease)
+        except Exception:
+            return True
+
+    def _release(self, key):
+        try:
+            self.backend.release(key)
+        except Exception:
+            pass
+
+
+_page_cache = None
+
+
+def init_page_cache(app):
+    """설정에 따라 백엔드를 고르고, Post/Briefing 변경 시 태그 무효화 훅 등록"""
+    global _page_cache
+    backend_name = app.config.get('PAGE_CACHE_BACKEND', 'sqlite')
+    if backend_name == 'sqlite':
+        path = app.config.get('PAGE_CACHE_PATH') or os.path.join(tempfile.gettempdir(), 'nr2_page_cache.sqlite3')
+        try:
+            backend = SQLiteBackend(path)
+        except Exception as e:
+            app.logger.error(f'[PageCache] SQLite 백엔드 초기화 실패, 메모리로 대체: {e}')
+            backend = MemoryBackend()
+    else:
+        backend = MemoryBackend()
+    _page_cache = PageCache(backend)
+    _register_invalidation_hooks()
+    return _page_cache
+
+
+def get_page_cache():
+    global _page_cache
+    if _page_cache is None:
+        _page_cache = PageCache(MemoryBackend())
+    return _page_cache
+
+
+# ── 태그 무효화: 커밋된 Post/Briefing 작성·수정·삭제 감지 ──
+
+# 조회수·카운터 변경은 목록 내용을 바꾸지 않으므로 무효화 대상에서 제외
+_CONTENT_FIELDS = ('title', 'content', 'board_type', 'external_url', 'og_image')
+_hooks_registered = False
+
+
+def _register_invalidation_hooks():
+    global _hooks_registered
+    if _hooks_registered:
+        return
+    _hooks_registered = True
+
+    from sqlalchemy import event, inspect
+    from app import db
+    from app.models.post import Post
+    from app.models.briefing import Briefing
+
+    tag_for = {Post: 'posts', Briefing: 'briefings'}
+
+    def _content_changed(obj):
+        state = inspect(obj)
+        return any(state.attrs[f].history.has_changes() for f in _CONTENT_FIELDS if f in state.attrs)
+
+    @event.listens_for(db.session, 'before_flush')
+    def _collect(session, flush_context, instances):
+        tags = session.info.setdefault('page_cache_tags', set())
+        for obj in list(session.new) + list(session.deleted):
+            tag = tag_for.get(type(obj))
+            if tag:
+                tags.add(tag)
+        for obj in session.dirty:
+            if type(obj) is Briefing or (type(obj) is Post and _content_changed(obj)):
+                tags.add(tag_for[type(obj)])
+
+    @event.listens_for(db.session, 'after_commit')
+    def _invalidate(session):
+        tags = session.info.pop('page_cache_tags', None)
+        if tags and _page_cache is not None:
+            for tag in tags:
+                _page_cache.invalidate_tag(tag)
+
+    @event.listens_for(db.session, 'after_rollback')
+    def _discard(session):
+        session.info.pop('page_cache_tags', None)
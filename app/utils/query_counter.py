@@ -0,0 +1,57 @@
+"""요청 단위 SQL 쿼리 카운터
+
+init_query_counter(app) 후에는 요청마다 실행된 쿼리 수가 g.query_count 에 쌓이고,
+디버그/테스트 모드에서는 X-Query-Count 응답 헤더로 노출된다.
+테스트에서는 query_budget(n) 으로 구간 내 쿼리 수 상한을 검증한다.
+
+    with query_budget(6):
+        client.get('/boards/free/1')
+"""
+import threading
+from contextlib import contextmanager
+from flask import g, has_app_context
+from sqlalchemy import event
+
+_local = threading.local()
+
+
+def _on_execute(conn, cursor, statement, parameters, context, executemany):
+    if has_app_context() and 'query_count' in g:
+        g.query_count += 1
+    counters = getattr(_local, 'budgets', None)
+    if counters:
+        for c in counters:
+            c[0] += 1
+
+
+def init_query_counter(app):
+    from app import db
+
+    with app.app_context():
+        if not event.contains(db.engine, 'before_cursor_execute', _on_execute):
+            event.listen(db.engine, 'before_cursor_execute', _on_execute)
+
+    @app.before_request
+    def _start_query_count():
+        g.query_count = 0
+
+    @app.after_request
+    def _report_query_count(response):
+        if app.debug or app.testing:
+            response.headers['X-Query-Count'] = str(g.get('query_count', 0))
+        return response
+
+
+@contextmanager
+def query_budget(limit):
+    """구간 내 쿼리가 limit 을 넘으면 AssertionError (테스트용, 같은 스레드 기준)"""
+    counter = [0]
+    budgets = getattr(_local, 'budgets', None)
+    if budgets is None:
+        budgets = _local.budgets = []
+    budgets.append(counter)
+    try:
+        yield counter
+    finally:
+        budgets.remove(counter)
+    assert counter[0] <= limit, f'쿼리 {counter[0]}회 실행 (예산 {limit}회)'
@@ -1,9 +1,9 @@
 import os
 import feedparser
-import requests
 from datetime import datetime
 from app import db
 from app.models.scoop_alert import ScoopAlert
+from app.utils.telegram_delivery import send_message
 
 # RSS 소스
 RSS_SOURCES = {
@@ -25,16 +25,10 @@ def send_telegram_alert(source, title, link):
         return
         
     text = f"🚨 ⚡️ [단독]\n🏷️ 언론사: {source}\n📝 제목: {title}\n🔗 {link}"
-    url = f"https://api.telegram.org/bot{token}/sendMessage"
-    
-    try:
-        requests.post(url, json={
-            'chat_id': chat_id,
-            'text': text,
-            'disable_web_page_preview': False
-        }, timeout=5)
-    except Exception as e:
-        print(f"ScoopWatcher Telegram 발송 에러: {e}")
+
+    result = send_message(token, chat_id, text, parse_mode=None, disable_preview=False)
+    if not result.ok:
+        print(f"ScoopWatcher Telegram 발송 에러: {result.error}")
 
 def scoop_job(app_context):
     """지정된 RSS 피드에서 단독 기사를 감지합니다."""
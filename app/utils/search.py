@@ -0,0 +1,359 @@
+"""게시판 전문 검색 (한국어)
+
+게시글(제목·HTML 제거 본문·작성자)과 댓글을 search_documents 에 색인한다.
+- PostgreSQL + pg_trgm : search_documents 에 GIN 트라이그램 인덱스를 걸고
+  ILIKE 로 후보를 찾은 뒤 similarity 로 순위 매김
+- 그 외 (SQLite 등)   : 2글자 단위(바이그램) 역색인 search_postings 를 직접 관리
+
+색인은 SQLAlchemy after_flush 훅에서 게시글/댓글 작성·수정·삭제와 같은
+트랜잭션으로 갱신되고, 'flask rebuild-search' 로 전체 재구축할 수 있다.
+봇이 psycopg2 로 직접 INSERT 한 글처럼 훅을 거치지 않은 행은 스케줄러의
+index_new_documents() 가 워터마크 이후 행 중 색인에 없는 것만 골라 채운다
+(색인이 비어 있는 첫 배포 때는 기존 글 전체를 배치 단위로 채움).
+"""
+import re
+import logging
+import unicodedata
+from collections import Counter
+from datetime import datetime, timedelta
+from flask_sqlalchemy.pagination import Pagination
+from sqlalchemy import event, inspect, func, select, delete, insert, distinct
+from app import db
+from app.models.search import SearchDocument, SearchPosting
+from app.models.visit_rollup import RollupWatermark
+
+logger = logging.getLogger(__name__)
+
+MAX_RESULTS = 1000
+FIELD_WEIGHTS = {'t': 3, 'a': 2, 'b': 1}
+TF_CAP = 5
+WATERMARKS = {'post': 'search:posts', 'comment': 'search:comments'}
+
+# 늦게 커밋되는 INSERT 를 놓치지 않도록 최근 N초 행은 다음 주기로 미룸
+INDEX_LAG_SECONDS = 30
+
+_backend = 'bigram'
+_hooks_registered = False
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def strip_html(html):
+    text = _TAG_RE.sub(' ', html or '')
+    text = text.replace('&nbsp;', ' ').replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&')
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def normalize(text):
+    return unicodedata.normalize('NFKC', text or '').lower()
+
+
+def bigrams(text):
+    """'윤석열 대통령' → {'윤석','석열','대통','통령'} (1글자 토큰은 그대로)"""
+    terms = Counter()
+    for token in _TOKEN_RE.findall(normalize(text)):
+        if len(token) == 1:
+            terms[token] += 1
+            continue
+        for i in range(len(token) - 1):
+            terms[token[i:i + 2]] += 1
+    return terms
+
+
+def get_backend():
+    return _backend
+
+
+def init_search(app):
+    """검색 백엔드 결정 + 색인 갱신 훅 등록 (pg_trgm 인덱스는 startup_tasks 에서 생성)"""
+    global _backend
+    wanted = app.config.get('SEARCH_BACKEND', 'auto')
+    _backend = 'bigram'
+    if wanted in ('auto', 'pg_trgm'):
+        with app.app_context():
+            if db.engine.dialect.name == 'postgresql':
+                try:
+                    found = db.session.execute(db.text(
+                        "SELECT 1 FROM pg_indexes WHERE indexname = 'ix_search_documents_body_trgm'"
+                    )).first()
+                    db.session.commit()
+                    if found:
+                        _backend = 'pg_trgm'
+                except Exception as e:
+                    db.session.rollback()
+                    app.logger.warning(f'[Search] pg_trgm 확인 실패, 바이그램 색인 사용: {e}')
+    _register_hooks()
+
+
+# ── 색인 ──
+
+def _post_document(conn, post):
+    author = conn.execute(db.text('SELECT nickname FROM users WHERE id = :id'), {'id': post.user_id}).scalar()
+    return {
+        'doc_type': 'post', 'doc_id': post.id, 'post_id': post.id,
+        'board_type': post.board_type, 'title': (post.title or '')[:200],
+        'body': strip_html(post.content), 'author': author, 'created_at': post.created_at,
+    }
+
+
+def _comment_document(conn, comment):
+    row = conn.execute(db.text(
+        'SELECT p.board_type, u.nickname FROM posts p, users u WHERE p.id = :pid AND u.id = :uid'
+    ), {'pid': comment.post_id, 'uid': comment.user_id}).first()
+    return {
+        'doc_type': 'comment', 'doc_id': comment.id, 'post_id': comment.post_id,
+        'board_type': row[0] if row else None, 'title': None,
+        'body': comment.content or '', 'author': row[1] if row else None,
+        'created_at': comment.created_at,
+    }
+
+
+def _delete_documents(conn, doc_type, doc_ids):
+    if not doc_ids:
+        return
+    doc_pks = select(SearchDocument.id).where(
+        SearchDocument.doc_type == doc_type, SearchDocument.doc_id.in_(doc_ids)
+    )
+    conn.execute(delete(SearchPosting).where(SearchPosting.document_id.in_(doc_pks)))
+    conn.execute(delete(SearchDocument).where(
+        SearchDocument.doc_type == doc_type, SearchDocument.doc_id.in_(doc_ids)
+    ))
+
+
+def _delete_post_documents(conn, post_ids):
+    """게시글과 그 댓글 문서 전체 삭제"""
+    if not post_ids:
+        return
+    doc_pks = select(SearchDocument.id).where(SearchDocument.post_id.in_(post_ids))
+    conn.execute(delete(SearchPosting).where(SearchPosting.document_id.in_(doc_pks)))
+    conn.execute(delete(SearchDocument).where(SearchDocument.post_id.in_(post_ids)))
+
+
+def _write_documents(conn, docs):
+    for doc_type in ('post', 'comment'):
+        _delete_documents(conn, doc_type, [d['doc_id'] for d in docs if d['doc_type'] == doc_type])
+    postings = []
+    for doc in docs:
+        pk = conn.execute(insert(SearchDocument).values(**doc)).inserted_primary_key[0]
+        if _backend != 'bigram':
+            continue
+        for field, text in (('t', doc['title']), ('b', doc['body']), ('a', doc['author'])):
+            for term, tf in bigrams(text).items():
+                postings.append({
+                    'term': term[:8], 'document_id': pk, 'field': field,
+                    'weight': min(tf, TF_CAP) * FIELD_WEIGHTS[field],
+                })
+    if postings:
+        conn.execute(insert(SearchPosting), postings)
+
+
+_POST_FIELDS = ('title', 'content', 'board_type', 'user_id')
+
+
+def _changed(obj, fields):
+    state = inspect(obj)
+    return any(state.attrs[f].history.has_changes() for f in fields)
+
+
+def _register_hooks():
+    global _hooks_registered
+    if _hooks_registered:
+        return
+    _hooks_registered = True
+
+    from app.models.post import Post
+    from app.models.comment import Comment
+
+    @event.listens_for(db.session, 'after_flush')
+    def _update_index(session, flush_context):
+        posts, comments, deleted_posts, deleted_comments = [], [], [], []
+        for obj in session.new:
+            if type(obj) is Post:
+                posts.append(obj)
+            elif type(obj) is Comment:
+                comments.append(obj)
+        for obj in session.dirty:
+            if type(obj) is Post and _changed(obj, _POST_FIELDS):
+                posts.append(obj)
+            elif type(obj) is Comment and _changed(obj, ('content',)):
+                comments.append(obj)
+        for obj in session.deleted:
+            if type(obj) is Post:
+                deleted_posts.append(obj.id)
+            elif type(obj) is Comment:
+                deleted_comments.append(obj.id)
+        if not (posts or comments or deleted_posts or deleted_comments):
+            return
+
+        try:
+            conn = session.connection()
+            with conn.begin_nested():
+                _delete_post_documents(conn, deleted_posts)
+                _delete_documents(conn, 'comment', deleted_comments)
+                docs = [_post_document(conn, p) for p in posts if p.id not in deleted_posts]
+                docs += [_comment_document(conn, c) for c in comments
+                         if c.id not in deleted_comments and c.post_id not in deleted_posts]
+                _write_documents(conn, docs)
+        except Exception as e:
+            # 색인 실패가 글쓰기 자체를 막지 않도록 (rebuild-search 로 복구)
+            logger.error(f'[Search] 색인 갱신 실패: {e}')
+
+
+def rebuild_index(batch_size=500):
+    """search_documents/search_postings 전체 재구축. 색인한 문서 수 반환"""
+    from app.models.post import Post
+    from app.models.comment import Comment
+
+    db.session.execute(delete(SearchPosting))
+    db.session.execute(delete(SearchDocument))
+    db.session.commit()
+
+    total = 0
+    for doc_type, model, builder in (('post', Post, _post_document), ('comment', Comment, _comment_document)):
+        last_id = 0
+        while True:
+            rows = model.query.filter(model.id > last_id).order_by(model.id).limit(batch_size).all()
+            if not rows:
+                break
+            conn = db.session.connection()
+            _write_documents(conn, [builder(conn, r) for r in rows])
+            db.session.commit()
+            total += len(rows)
+            last_id = rows[-1].id
+            db.session.expunge_all()
+        _watermark(WATERMARKS[doc_type]).last_id = last_id
+        db.session.commit()
+    return total
+
+
+def _watermark(name):
+    mark = db.session.get(RollupWatermark, name)
+    if mark is None:
+        mark = RollupWatermark(name=name, last_id=0)
+        db.session.add(mark)
+        db.session.flush()
+    return mark
+
+
+def index_new_documents(batch_size=1000):
+    """워터마크 이후 게시글/댓글 중 색인에 없는 것만 색인. 종류별로 한 번에 batch_size 행까지.
+    색인한 문서 수 반환"""
+    from app.models.post import Post
+    from app.models.comment import Comment
+
+    ready = datetime.now() - timedelta(seconds=INDEX_LAG_SECONDS)
+    total = 0
+    for doc_type, model, builder in (('post', Post, _post_document), ('comment', Comment, _comment_document)):
+        mark = _watermark(WATERMARKS[doc_type])
+        rows = []
+        for row in model.query.filter(model.id > mark.last_id).order_by(model.id).limit(batch_size):
+            if row.created_at and row.created_at >= ready:
+                break
+            rows.append(row)
+        if not rows:
+            continue
+        indexed = {doc_id for (doc_id,) in db.session.query(SearchDocument.doc_id).filter(
+            SearchDocument.doc_type == doc_type,
+            SearchDocument.doc_id.in_([r.id for r in rows]),
+        )}
+        missing = [r for r in rows if r.id not in indexed]
+        if missing:
+            conn = db.session.connection()
+            _write_documents(conn, [builder(conn, r) for r in missing])
+        mark.last_id = rows[-1].id
+        db.session.commit()
+        total += len(missing)
+    if total:
+        logger.info(f'[Search] 훅을 거치지 않은 문서 {total}건 색인')
+    return total
+
+
+# ── 검색 ──
+
+class RankedPagination(Pagination):
+    """미리 순위 매긴 id 목록을 페이지 단위로 로드하는 Pagination"""
+
+    def _query_items(self):
+        ids = self._query_args['ids']
+        start = (self.page - 1) * self.per_page
+        return self._query_args['loader'](ids[start:start + self.per_page])
+
+    def _query_count(self):
+        return len(self._query_args['ids'])
+
+
+def _escape_like(q):
+    return q.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def _ranked_ids(q, key_col, fields, doc_types, board_type=None):
+    """조건에 맞는 문서를 key_col(post_id/doc_id) 단위로 묶어 점수순 id 목록 반환"""
+    D, P = SearchDocument, SearchPosting
+    q = (q or '').strip()
+    if not q:
+        return []
+    tokens = _TOKEN_RE.findall(normalize(q))
+    terms = list(bigrams(q))
+
+    filters = [D.doc_type.in_(doc_types)]
+    if board_type:
+        filters.append(D.board_type == board_type)
+
+    # 1글자 토큰('윤 대통령')은 긴 단어 안에서 바이그램으로만 색인되어 역색인으로 찾을 수 없고,
+    # 기호만 있는 검색어는 바이그램이 없으므로 둘 다 LIKE 로 처리
+    if _backend == 'pg_trgm' or not tokens or any(len(t) < 2 for t in tokens):
+        pattern = f'%{_escape_like(q)}%'
+        cols = {'t': D.title, 'b': D.body, 'a': D.author}
+        filters.append(db.or_(*[cols[f].ilike(pattern, escape='\\') for f in fields]))
+        if _backend == 'pg_trgm':
+            # 본문은 길어서 전체 similarity 가 거의 0 → 부분 일치(word_similarity) 사용
+            sims = {
+                f: (func.word_similarity(q, func.coalesce(cols[f], '')) if f == 'b'
+                    else func.similarity(func.coalesce(cols[f], ''), q))
+                for f in fields
+            }
+            score = func.greatest(*[sims[f] * FIELD_WEIGHTS[f] for f in fields], 0)
+        else:
+            score = db.literal(1)
+        stmt = select(key_col, func.max(score).label('score')).where(*filters)
+    else:
+        # 모든 바이그램이 같은 필드 안에 있어야 매칭 (제목에 하나, 작성자에 하나는 제외)
+        field_scores = select(
+            P.document_id, func.sum(P.weight).label('score')
+        ).where(P.term.in_(terms), P.field.in_(fields)).group_by(P.document_id, P.field).having(
+            func.count(distinct(P.term)) == len(terms)
+        ).subquery()
+        doc_scores = select(
+            field_scores.c.document_id, func.sum(field_scores.c.score).label('score')
+        ).group_by(field_scores.c.document_id).subquery()
+        stmt = select(key_col, func.max(doc_scores.c.score).label('score')).join(
+            doc_scores, doc_scores.c.document_id == D.id
+        ).where(*filters)
+
+    stmt = stmt.group_by(key_col).order_by(db.desc('score'), key_col.desc()).limit(MAX_RESULTS)
+    return [row[0] for row in db.session.execute(stmt)]
+
+
+def _loader(model):
+    def load(ids):
+        if not ids:
+            return []
+        rows = {r.id: r for r in model.query.filter(model.id.in_(ids)).all()}
+        return [rows[i] for i in ids if i in rows]
+    return load
+
+
+def search_posts(q, board_type=None, fields=('t', 'b', 'a'), include_comments=True, page=1, per_page=20):
+    """게시글 검색 (댓글에서 매칭되면 해당 게시글로) → RankedPagination[Post]"""
+    from app.models.post import Post
+    doc_types = ('post', 'comment') if include_comments else ('post',)
+    ids = _ranked_ids(q, SearchDocument.post_id, fields, doc_types, board_type)
+    return RankedPagination(page=page, per_page=per_page, error_out=False, ids=ids, loader=_loader(Post))
+
+
+def search_comments(q, page=1, per_page=20):
+    """댓글 본문 검색 → RankedPagination[Comment]"""
+    from app.models.comment import Comment
+    ids = _ranked_ids(q, SearchDocument.doc_id, ('b',), ('comment',))
+    return RankedPagination(page=page, per_page=per_page, error_out=False, ids=ids, loader=_loader(Comment))
@@ -0,0 +1,124 @@
+"""nr2.kr 단축 URL 클릭 write-behind 기록
+
+/s/<code> 리다이렉트 경로에서는 클릭을 버퍼에 넣기만 하고(쓰기 없음),
+플러셔 스레드가 모인 클릭을
+- url_click_log 에 일괄 INSERT
+- 단축 URL별 click_count 증가분을 합산해 UPDATE 한 번으로 반영한다.
+어뷰즈 방지 규칙(같은 ip_hash 가 24시간 안에 다시 누른 클릭은 click_count 에서 제외)은
+플러시 때 배치 단위로 한 번 조회해 판정하고, 채널 발송 직후 같은 IP 의 연타는
+CLICK_DEDUPE_SECONDS 동안 프로세스 안에서 먼저 걸러낸다.
+"""
+from collections import Counter, namedtuple
+from datetime import datetime, timedelta
+from app import db
+from app.utils.ttl_cache import TTLSet
+from app.utils.write_buffer import WriteBuffer
+
+CLICK_ABUSE_WINDOW = timedelta(hours=24)
+
+Click = namedtuple('Click', 'shortener_id clicked_at user_agent ip_hash referer device_type log fresh')
+
+_click_buffer = None
+_seen = TTLSet(600)
+
+
+def init_short_link_clicks(app):
+    global _click_buffer, _seen
+    from app.models.url_shortener import URLShortener, URLClickLog
+
+    def _write_clicks(clicks):
+        with app.app_context():
+            try:
+                # 24시간 안에 이미 기록된 (단축 URL, IP) 쌍 — 배치 전체를 한 번에 조회
+                pairs = {(c.shortener_id, c.ip_hash) for c in clicks if c.ip_hash and c.fresh}
+                counted = set()
+                if pairs:
+                    rows = db.session.query(URLClickLog.shortener_id, URLClickLog.ip_hash).filter(
+                        URLClickLog.shortener_id.in_({sid for sid, _ in pairs}),
+                        URLClickLog.ip_hash.in_({ip for _, ip in pairs}),
+                        URLClickLog.clicked_at >= datetime.now() - CLICK_ABUSE_WINDOW,
+                    ).distinct().all()
+                    counted = {(sid, ip) for sid, ip in rows}
+
+                deltas, last_clicked, logs = Counter(), {}, []
+                for c in clicks:
+                    count_this_click = c.fresh
+                    if c.ip_hash and count_this_click:
+                        key = (c.shortener_id, c.ip_hash)
+                        count_this_click = key not in counted
+                        counted.add(key)
+                    if count_this_click:
+                        deltas[c.shortener_id] += 1
+                        last_clicked[c.shortener_id] = max(last_clicked.get(c.shortener_id, c.clicked_at),
+                                                           c.clicked_at)
+                    if c.log:
+                        logs.append({
+                            'shortener_id': c.shortener_id,
+                            'clicked_at': c.clicked_at,
+                            'user_agent': c.user_agent,
+                            'ip_hash': c.ip_hash,
+                            'referer': c.referer,
+                            'device_type': c.device_type,
+                        })
+
+                if logs:
+                    db.session.execute(URLClickLog.__table__.insert(), logs)
+                if deltas:
+                    # NP 적립(Phase 2-B)은 여기서 deltas 기준으로 별도 커밋 예정
+                    URLShortener.query.filter(URLShortener.id.in_(list(deltas))).update(
+                        {
+                            URLShortener.click_count: db.func.coalesce(URLShortener.click_count, 0)
+                            + db.case(deltas, value=URLShortener.id, else_=0),
+                            URLShortener.last_clicked_at: db.case(last_clicked, value=URLShortener.id,
+                                                                  else_=URLShortener.last_clicked_at),
+                        },
+                        synchronize_session=False,
+                    )
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+            finally:
+                db.session.remove()
+
+    _seen = TTLSet(min(app.config.get('SHORTENER_DEDUPE_SECONDS', 600), CLICK_ABUSE_WINDOW.total_seconds()))
+    _click_buffer = WriteBuffer(
+        'short-link-clicks', _write_clicks,
+        max_size=app.config.get('SHORTENER_BUFFER_SIZE', 50000),
+        batch_size=app.config.get('SHORTENER_FLUSH_BATCH', 1000),
+        flush_interval=app.config.get('SHORTENER_FLUSH_INTERVAL_MS', 2000) / 1000,
+    )
+
+
+def record_click(shortener_id, code, request_meta=None):
+    """클릭 1회 적재 (DB 쓰기 없음). 버퍼가 없거나 가득 차면 False
+
+    request_meta 가 없으면 클릭 로그 없이 click_count 만 반영한다."""
+    if _click_buffer is None:
+        return False
+    meta = request_meta or {}
+    ip_hash = meta.get('ip_hash')
+    fresh = _seen.add((code, ip_hash)) if ip_hash else True
+    return _click_buffer.enqueue(Click(
+        shortener_id=shortener_id,
+        clicked_at=datetime.now(),
+        user_agent=meta.get('user_agent') or None,
+        ip_hash=ip_hash,
+        referer=meta.get('referer') or None,
+        device_type=meta.get('device_type') or None,
+        log=bool(request_meta),
+        fresh=fresh,
+    ))
+
+
+def flush_clicks():
+    """대기 중인 클릭 즉시 반영 (테스트/종료용)"""
+    if _click_buffer is None:
+        return 0
+    return _click_buffer.flush()
+
+
+def get_short_link_click_stats():
+    if _click_buffer is None:
+        return {}
+    return _click_buffer.stats()
@@ -0,0 +1,363 @@
+"""텔레그램 발송 공용 계층 (모든 봇·웹 알림이 공유)
+
+- 연결 재사용: 프로세스 하나에 requests.Session 하나 (커넥션 풀)
+- 채팅별 속도 제한: 같은 채팅 1초 1건, 그룹·채널은 분당 20건, 봇 전체 초당 30건
+  → 고정 sleep 없이 텔레그램 한도 안에서 최대한 빨리 보낸다
+- 429 응답의 retry_after 를 그대로 따르고, 네트워크 오류·5xx 는 지수 백오프 재시도
+- 4096자 제한에 맞춘 줄 단위 분할
+- 끝내 실패한 메시지는 telegram_outbox 에 남겨 flush_outbox() 가 다시 보낸다 (최소 1회 전달)
+- 봇별 발송 지표: get_delivery_stats()
+
+    result = send_message(token, chat_id, text)
+    if not result.ok:
+        logger.error(result.error)
+
+    # asyncio 코드에서는
+    result = await send_message_async(token, chat_id, text)
+"""
+import os
+import re
+import time
+import asyncio
+import logging
+import threading
+from collections import deque, defaultdict
+from datetime import datetime, timedelta
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+API_URL = 'https://api.telegram.org/bot{token}/{method}'
+MESSAGE_LIMIT = 4000          # 4096 에 여유를 둔 분할 기준
+MAX_RETRIES = 4
+BACKOFF_BASE = 1.0            # 1, 2, 4, 8초
+REQUEST_TIMEOUT = (5, 15)     # (연결, 읽기) — 재시도 경로
+QUICK_TIMEOUT = (3, 7)        # 웹 요청 안에서 보내는 1회 시도 (retries=0, block=False)
+PRIVATE_INTERVAL = 1.0        # 같은 개인 채팅 최소 간격
+GROUP_PER_MINUTE = 20         # 같은 그룹·채널 분당 최대
+BOT_PER_SECOND = 30           # 봇 전체 초당 최대
+OUTBOX_MAX_ATTEMPTS = 8
+OUTBOX_SENDING_TIMEOUT = timedelta(minutes=5)   # 'sending' 인 채 이보다 오래되면 죽은 워커로 보고 되돌림
+
+_TOKEN_RE = re.compile(r'^(\d+):[\w-]{20,}$')
+
+
+class DeliveryResult:
+    """메시지 1건(분할 시 전체) 발송 결과"""
+
+    __slots__ = ('ok', 'message_ids', 'error', 'response', 'parts')
+
+    def __init__(self, ok, message_ids=None, error=None, response=None, parts=0):
+        self.ok = ok
+        self.message_ids = message_ids or []
+        self.error = error
+        self.response = response
+        self.parts = parts
+
+    def __bool__(self):
+        return self.ok
+
+    def __repr__(self):
+        return f'<DeliveryResult ok={self.ok} parts={self.parts} error={self.error!r}>'
+
+
+def split_message(text, limit=MESSAGE_LIMIT):
+    """줄바꿈 경계로 limit 이하 조각 분할 (한 줄이 limit 보다 길면 그 줄만 강제로 자름)"""
+    text = text or ''
+    if len(text) <= limit:
+        return [text]
+    parts, current = [], ''
+    for line in text.split('\n'):
+        while len(line) > limit:
+            if current:
+                parts.append(current)
+                current = ''
+            parts.append(line[:limit])
+            line = line[limit:]
+        if current and len(current) + len(line) + 1 > limit:
+            parts.append(current)
+            current = line
+        else:
+            current = f'{current}\n{line}' if current else line
+    if current:
+        parts.append(current)
+    return parts
+
+
+def bot_id_of(token):
+    return (token or '').split(':', 1)[0]
+
+
+def _is_group(chat_id):
+    chat = str(chat_id)
+    return chat.startswith('@') or chat.startswith('-')
+
+
+class _RateLimiter:
+    """채팅별·봇별 발송 간격 관리 (스레드 안전, 대기는 락 밖에서)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._chat_last = {}                        # (bot, chat) → 마지막 발송 시각
+        self._chat_window = defaultdict(deque)      # (bot, chat) → 최근 1분 발송 시각 (그룹)
+        self._bot_window = defaultdict(deque)       # bot → 최근 1초 발송 시각
+        self._blocked_until = {}                    # (bot, chat) 또는 bot → 429 해제 시각
+
+    def _wait_needed(self, bot, chat, now):
+        key = (bot, chat)
+        wait = max(self._blocked_until.get(key, 0), self._blocked_until.get(bot, 0)) - now
+        if not _is_group(chat):
+            wait = max(wait, self._chat_last.get(key, 0) + PRIVATE_INTERVAL - now)
+        else:
+            window = self._chat_window[key]
+            while window and window[0] <= now - 60:
+                window.popleft()
+            if len(window) >= GROUP_PER_MINUTE:
+                wait = max(wait, window[0] + 60 - now)
+        bot_window = self._bot_window[bot]
+        while bot_window and bot_window[0] <= now - 1:
+            bot_window.popleft()
+        if len(bot_window) >= BOT_PER_SECOND:
+            wait = max(wait, bot_window[0] + 1 - now)
+        return wait
+
+    def acquire(self, bot, chat, block=True):
+        """발송 가능할 때까지 대기. 기다린 초 반환 (block=False 면 기다려야 할 때 None)"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._wait_needed(bot, chat, now)
+                if wait > 0 and not block:
+                    return None
+                if wait <= 0:
+                    key = (bot, chat)
+                    self._chat_last[key] = now
+                    if _is_group(chat):
+                        self._chat_window[key].append(now)
+                    self._bot_window[bot].append(now)
+                    return waited
+            time.sleep(wait)
+            waited += wait
+
+    def block(self, bot, chat, seconds):
+        """429 retry_after 반영 (chat=None 이면 봇 전체)"""
+        with self._lock:
+            key = bot if chat is None else (bot, chat)
+            self._blocked_until[key] = max(self._blocked_until.get(key, 0), time.monotonic() + seconds)
+
+
+class TelegramDelivery:
+
+    def __init__(self):
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=16)
+        self._session.mount('https://', adapter)
+        self._limiter = _RateLimiter()
+        self._stats_lock = threading.Lock()
+        self._stats = defaultdict(lambda: {
+            'sent': 0, 'failed': 0, 'retries': 0, 'rate_limited': 0,
+            'throttle_seconds': 0.0, 'outboxed': 0,
+        })
+        self._tokens = {}    # bot id → token (이 프로세스에서 한 번이라도 쓴 토큰)
+        self._app = None
+
+    # ── 지표 ──
+
+    def _count(self, bot, key, n=1):
+        with self._stats_lock:
+            self._stats[bot][key] += n
+
+    def stats(self):
+        with self._stats_lock:
+            return {bot: dict(values) for bot, values in self._stats.items()}
+
+    # ── 발송 ──
+
+    def _post(self, token, chat_id, text, parse_mode, disable_preview, retries=MAX_RETRIES, block=True):
+        """조각 1개 발송 (속도 제한·재시도 포함) → (응답 JSON 또는 None, 오류, 재시도 가치 여부)
+
+        block=False 면 속도 제한에 걸려도 기다리지 않고 바로 실패(재시도 가치 있음)로 돌려준다."""
+        bot = bot_id_of(token)
+        payload = {'chat_id': chat_id, 'text': text, 'disable_web_page_preview': disable_preview}
+        if parse_mode:
+            payload['parse_mode'] = parse_mode
+        url = API_URL.format(token=token, method='sendMessage')
+
+        timeout = REQUEST_TIMEOUT if block else QUICK_TIMEOUT
+        error = None
+        for attempt in range(retries + 1):
+            if attempt:
+                self._count(bot, 'retries')
+            waited = self._limiter.acquire(bot, str(chat_id), block)
+            if waited is None:
+                return None, '발송 속도 제한 대기 필요', True
+            self._count(bot, 'throttle_seconds', waited)
+            try:
+                resp = self._session.post(url, json=payload, timeout=timeout)
+            except requests.RequestException as e:
+                error = f'{type(e).__name__}: {e}'
+                if attempt < retries:
+                    time.sleep(BACKOFF_BASE * 2 ** attempt)
+                continue
+
+            if resp.status_code == 200:
+                return resp.json(), None, False
+            try:
+                body = resp.json()
+            except ValueError:
+                body = {}
+            error = f"HTTP {resp.status_code}: {body.get('description') or resp.text[:200]}"
+            if resp.status_code == 429:
+                self._count(bot, 'rate_limited')
+                retry_after = (body.get('parameters') or {}).get('retry_after', 5)
+                self._limiter.block(bot, str(chat_id), retry_after)
+                continue
+            if resp.status_code >= 500:
+                if attempt < retries:
+                    time.sleep(BACKOFF_BASE * 2 ** attempt)
+                continue
+            # 400/401/403 등 — 다시 보내도 같은 결과
+            return None, error, False
+        return None, error, True
+
+    def send(self, token, chat_id, text, parse_mode='HTML', disable_preview=True, outbox=True,
+             retries=MAX_RETRIES, block=True):
+        if not token or not chat_id:
+            return DeliveryResult(False, error='토큰 또는 chat_id 미설정')
+        bot = bot_id_of(token)
+        self._tokens[bot] = token
+
+        parts = split_message(text)
+        message_ids, response = [], None
+        for index, part in enumerate(parts):
+            response, error, retryable = self._post(token, chat_id, part, parse_mode, disable_preview,
+                                                    retries, block)
+            if response is None:
+                self._count(bot, 'failed')
+                logger.error(f'[Telegram] {chat_id} 발송 실패 ({index + 1}/{len(parts)}): {error}')
+                if retryable and outbox:
+                    # 못 보낸 조각부터 나머지를 대기열로
+                    self._to_outbox(bot, chat_id, '\n'.join(parts[index:]), parse_mode, disable_preview, error)
+                return DeliveryResult(False, message_ids, error, response, len(parts))
+            self._count(bot, 'sent')
+            message_ids.append((response.get('result') or {}).get('message_id'))
+        return DeliveryResult(True, message_ids, None, response, len(parts))
+
+    # ── 대기열 (outbox) ──
+
+    def init_app(self, app):
+        self._app = app
+
+    def _to_outbox(self, bot, chat_id, text, parse_mode, disable_preview, error):
+        if self._app is None:
+            return
+        from app import db
+        from app.models.telegram_outbox import TelegramOutbox
+        try:
+            with self._app.app_context(), db.engine.begin() as conn:
+                conn.execute(TelegramOutbox.__table__.insert().values(
+                    bot_id=bot, chat_id=str(chat_id), text=text, parse_mode=parse_mode,
+                    disable_preview=disable_preview, status='pending', attempts=1,
+                    last_error=(error or '')[:300], next_attempt_at=datetime.now() + timedelta(minutes=1),
+                    created_at=datetime.now(),
+                ))
+            self._count(bot, 'outboxed')
+        except Exception as e:
+            logger.error(f'[Telegram] 대기열 저장 실패: {e}')
+
+    def resolve_token(self, bot):
+        """봇 id → 토큰 (이 프로세스에서 쓴 토큰, 없으면 환경변수 검색)"""
+        token = self._tokens.get(bot)
+        if token:
+            return token
+        for value in os.environ.values():
+            match = _TOKEN_RE.match(value.strip())
+            if match and match.group(1) == bot:
+                self._tokens[bot] = value.strip()
+                return self._tokens[bot]
+        return None
+
+    def flush_outbox(self, limit=50):
+        """대기열의 발송 시각이 된 메시지 재발송 (app context 안에서 호출). 보낸 건수 반환"""
+        from app import db
+        from app.models.telegram_outbox import TelegramOutbox
+        now = datetime.now()
+        # 선점 후 발송을 끝내지 못한 행(워커 종료 등) → 다시 pending. 선점 시각이 없는 옛 행도 포함
+        released = db.session.query(TelegramOutbox).filter(
+            TelegramOutbox.status == 'sending',
+            db.or_(TelegramOutbox.claimed_at.is_(None),
+                   TelegramOutbox.claimed_at < now - OUTBOX_SENDING_TIMEOUT),
+        ).update({TelegramOutbox.status: 'pending', TelegramOutbox.claimed_at: None},
+                 synchronize_session=False)
+        db.session.commit()
+        if released:
+            logger.warning(f'[Telegram] 발송 중 멈춘 대기열 {released}건을 다시 대기로 전환')
+
+        due = TelegramOutbox.query.filter(
+            TelegramOutbox.status == 'pending', TelegramOutbox.next_attempt_at <= now,
+        ).order_by(TelegramOutbox.id).limit(limit).all()
+
+        sent = 0
+        for item in due:
+            token = self.resolve_token(item.bot_id)
+            if token is None:
+                continue
+            # 다른 프로세스와 겹치지 않게 선점
+            claimed = db.session.query(TelegramOutbox).filter(
+                TelegramOutbox.id == item.id, TelegramOutbox.status == 'pending',
+            ).update({TelegramOutbox.status: 'sending', TelegramOutbox.claimed_at: datetime.now()},
+                     synchronize_session=False)
+            db.session.commit()
+            if not claimed:
+                continue
+
+            result = self.send(token, item.chat_id, item.text, item.parse_mode, item.disable_preview,
+                               outbox=False)
+            db.session.refresh(item)
+            item.attempts = (item.attempts or 0) + 1
+            item.claimed_at = None
+            if result.ok:
+                item.status, item.sent_at, item.last_error = 'sent', datetime.now(), None
+                sent += 1
+            else:
+                item.last_error = (result.error or '')[:300]
+                if item.attempts >= OUTBOX_MAX_ATTEMPTS:
+                    item.status = 'failed'
+                else:
+                    item.status = 'pending'
+                    item.next_attempt_at = datetime.now() + timedelta(minutes=2 ** item.attempts)
+            db.session.commit()
+        return sent
+
+
+_delivery = TelegramDelivery()
+
+
+def init_telegram_delivery(app):
+    """실패 메시지를 저장할 앱 등록 (create_app 에서 호출)"""
+    _delivery.init_app(app)
+
+
+def send_message(token, chat_id, text, parse_mode='HTML', disable_preview=True, outbox=True,
+                 retries=MAX_RETRIES, block=True):
+    """텔레그램 메시지 발송 (자동 분할·속도 제한·재시도). DeliveryResult 반환
+
+    웹 요청 안에서는 retries=0, block=False 로 한 번만 시도하고 실패분은 outbox 로 넘긴다."""
+    return _delivery.send(token, chat_id, text, parse_mode, disable_preview, outbox, retries, block)
+
+
+async def send_message_async(token, chat_id, text, parse_mode='HTML', disable_preview=True, outbox=True,
+                             retries=MAX_RETRIES, block=True):
+    """send_message 의 asyncio 버전 — 대기·HTTP 는 스레드에서 처리해 이벤트 루프를 막지 않는다"""
+    return await asyncio.to_thread(send_message, token, chat_id, text, parse_mode, disable_preview, outbox,
+                                   retries, block)
+
+
+def flush_outbox(limit=50):
+    return _delivery.flush_outbox(limit)
+
+
+def get_delivery_stats():
+    return _delivery.stats()
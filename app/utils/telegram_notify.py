@@ -1,31 +1,23 @@
 """텔레그램 알림 유틸리티 — 게시판별 맞춤 포맷"""
 import os
 import re
-import requests
+from app.utils.telegram_delivery import send_message
 
 
 def send_telegram_message(text, chat_id=None):
-    """텔레그램 메시지 전송 (chat_id 명시 필수)"""
+    """텔레그램 메시지 전송 (chat_id 명시 필수)
+
+    웹 요청·앱 시작 중에 호출되므로 한 번만 시도하고, 실패하면 outbox 에 넘겨 스케줄러가 재발송한다."""
     token = os.environ.get('TELEGRAM_BOT_TOKEN')
     chat_id = chat_id or os.environ.get('TELEGRAM_CHAT_ID')
 
     if not token or not chat_id:
         return False
 
-    url = f"https://api.telegram.org/bot{token}/sendMessage"
-    payload = {
-        'chat_id': chat_id,
-        'text': text,
-        'parse_mode': 'HTML',
-        'disable_web_page_preview': False,
-    }
-
-    try:
-        response = requests.post(url, json=payload, timeout=10)
-        return response.ok
-    except Exception as e:
-        print(f"텔레그램 전송 실패: {str(e)}")
-        return False
+    result = send_message(token, chat_id, text, parse_mode='HTML', disable_preview=False, retries=0, block=False)
+    if not result.ok:
+        print(f"텔레그램 전송 실패: {result.error}")
+    return result.ok
 
 
 def send_to_channel(text):
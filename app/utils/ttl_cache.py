@@ -0,0 +1,75 @@
+"""크기 제한 + TTL 기반 인-프로세스 캐시 (조회 중복 제거, 단축 코드 조회 등)"""
+import time
+import threading
+from collections import OrderedDict
+
+
+class TTLSet:
+    """최근 본 키 집합. 키는 ttl 초 동안 유지되고 max_size 초과 시 오래된 것부터 제거"""
+
+    def __init__(self, ttl, max_size=100000):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, key):
+        """처음 보는 키(또는 만료된 키)면 등록하고 True, 이미 있으면 False"""
+        now = time.monotonic()
+        with self._lock:
+            expires = self._data.get(key)
+            if expires is not None and expires > now:
+                return False
+            self._data[key] = now + self.ttl
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+            return True
+
+    def __contains__(self, key):
+        with self._lock:
+            expires = self._data.get(key)
+            return expires is not None and expires > time.monotonic()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class TTLCache:
+    """키 → 값 LRU 캐시. 값은 ttl 초 동안 유효하고 max_size 초과 시 가장 오래 안 쓴 것부터 제거"""
+
+    def __init__(self, ttl, max_size=10000):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key)
+            if item is None or item[0] <= now:
+                if item is not None:
+                    del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            item = self._data.pop(key, None)
+        return item[1] if item is not None else None
+
+    def __len__(self):
+        return len(self._data)
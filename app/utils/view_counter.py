@@ -0,0 +1,73 @@
+"""게시글 조회수 write-behind 카운터
+
+요청 경로에서는 post_id 를 버퍼에 넣기만 하고(쓰기 없음),
+플러셔 스레드가 모인 조회를 게시글별 delta 로 합산해
+UPDATE posts SET views = views + CASE id ... END 한 번으로 반영한다.
+같은 회원/IP가 VIEW_DEDUPE_SECONDS 안에 다시 본 조회는 세지 않는다.
+"""
+import hashlib
+from collections import Counter
+from app import db
+from app.utils.ttl_cache import TTLSet
+from app.utils.write_buffer import WriteBuffer
+
+_view_buffer = None
+_seen = TTLSet(600)
+
+
+def init_view_counter(app):
+    global _view_buffer, _seen
+    from app.models.post import Post
+
+    def _write_views(post_ids):
+        deltas = Counter(post_ids)
+        with app.app_context():
+            try:
+                Post.query.filter(Post.id.in_(list(deltas))).update(
+                    {Post.views: db.func.coalesce(Post.views, 0) + db.case(deltas, value=Post.id, else_=0)},
+                    synchronize_session=False,
+                )
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+            finally:
+                db.session.remove()
+
+    _seen = TTLSet(app.config.get('VIEW_DEDUPE_SECONDS', 600))
+    _view_buffer = WriteBuffer(
+        'view-counter', _write_views,
+        max_size=app.config.get('VIEW_BUFFER_SIZE', 50000),
+        batch_size=app.config.get('VIEW_FLUSH_BATCH', 5000),
+        flush_interval=app.config.get('VIEW_FLUSH_INTERVAL_MS', 5000) / 1000,
+    )
+
+
+def viewer_key(user_id=None, ip=None, user_agent=None):
+    """중복 제거용 조회자 식별자 (회원 id, 비회원은 IP+UA 해시)"""
+    if user_id:
+        return f'u:{user_id}'
+    raw = f'{ip or ""}|{user_agent or ""}'
+    return 'a:' + hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def record_view(post_id, viewer=None):
+    """조회 1회 적재. 중복 조회거나 버퍼가 가득 차면 False"""
+    if viewer is not None and not _seen.add((post_id, viewer)):
+        return False
+    if _view_buffer is None:
+        return False
+    return _view_buffer.enqueue(post_id)
+
+
+def flush_views():
+    """대기 중인 조회수 즉시 반영 (테스트/종료용)"""
+    if _view_buffer is None:
+        return 0
+    return _view_buffer.flush()
+
+
+def get_view_counter_stats():
+    if _view_buffer is None:
+        return {}
+    return _view_buffer.stats()
@@ -0,0 +1,194 @@
+"""page_visits → visit_rollups 증분 집계
+
+스케줄러가 compact_page_visits()를 주기적으로 호출하면 워터마크 이후의
+새 방문 행만 읽어 시간/일 × 경로 prefix 단위로 합산하고,
+고유 IP/회원 수는 HyperLogLog 스케치로 병합한다.
+관리자 대시보드는 원본 테이블 대신 이 롤업만 읽는다.
+"""
+import logging
+from datetime import datetime, timedelta
+from sqlalchemy import func
+from app import db
+from app.models.page_visit import PageVisit
+from app.models.visit_rollup import VisitRollup, RollupWatermark
+from app.utils.hll import HyperLogLog
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_NAME = 'page_visits'
+ALL_PATHS = '*'
+
+# 버퍼 플러시가 늦게 커밋되는 행을 놓치지 않도록 최근 N초 행은 다음 주기로 미룸
+COMPACT_LAG_SECONDS = 60
+
+
+def path_prefix(path):
+    """'/boards/free/123' → '/boards/free', '/bias/55' → '/bias' (숫자 세그먼트 이전 최대 2단계)"""
+    kept = []
+    for part in (path or '').split('/'):
+        if not part:
+            continue
+        if part.isdigit() or len(kept) >= 2:
+            break
+        kept.append(part)
+    return ('/' + '/'.join(kept))[:100]
+
+
+def _new_bucket():
+    return {'pv': 0, 'upv': 0, 'apv': 0, 'ips': HyperLogLog(), 'users': HyperLogLog()}
+
+
+def compact_page_visits(batch_size=20000, max_batches=10):
+    """워터마크 이후 page_visits 를 롤업에 반영. 처리한 행 수 반환"""
+    wm = db.session.get(RollupWatermark, WATERMARK_NAME)
+    if wm is None:
+        wm = RollupWatermark(name=WATERMARK_NAME, last_id=0)
+        db.session.add(wm)
+        db.session.flush()
+
+    cutoff = datetime.now() - timedelta(seconds=COMPACT_LAG_SECONDS)
+    total = 0
+
+    for _ in range(max_batches):
+        rows = db.session.query(
+            PageVisit.id, PageVisit.created_at, PageVisit.path,
+            PageVisit.ip_address, PageVisit.user_id
+        ).filter(PageVisit.id > wm.last_id).order_by(PageVisit.id).limit(batch_size).all()
+
+        agg = {}
+        last_id = wm.last_id
+        processed = 0
+        reached_cutoff = False
+        for r in rows:
+            created = r.created_at or cutoff
+            if created >= cutoff:
+                reached_cutoff = True
+                break
+            last_id = r.id
+            processed += 1
+            hour = created.replace(minute=0, second=0, microsecond=0)
+            day = hour.replace(hour=0)
+            for prefix in (ALL_PATHS, path_prefix(r.path)):
+                for key in (('hour', hour, prefix), ('day', day, prefix)):
+                    b = agg.get(key)
+                    if b is None:
+                        b = agg[key] = _new_bucket()
+                    b['pv'] += 1
+                    b['ips'].add(r.ip_address)
+                    if r.user_id:
+                        b['upv'] += 1
+                        b['users'].add(r.user_id)
+                    else:
+                        b['apv'] += 1
+
+        if agg:
+            _merge_into_rollups(agg)
+        wm.last_id = last_id
+        db.session.commit()
+        total += processed
+
+        if reached_cutoff or len(rows) < batch_size:
+            break
+
+    if total:
+        logger.info(f'[Rollup] page_visits {total}건 집계 (watermark={wm.last_id})')
+    return total
+
+
+def _merge_into_rollups(agg):
+    """집계 결과를 기존 롤업 행에 더하거나 새로 추가 (키 전체를 한 번에 조회)"""
+    buckets = {k[1] for k in agg}
+    prefixes = {k[2] for k in agg}
+    existing = {
+        (r.granularity, r.bucket, r.path_prefix): r
+        for r in VisitRollup.query.filter(
+            VisitRollup.bucket.in_(buckets),
+            VisitRollup.path_prefix.in_(prefixes),
+        ).all()
+    }
+    for key, b in agg.items():
+        row = existing.get(key)
+        if row is None:
+            row = VisitRollup(
+                granularity=key[0], bucket=key[1], path_prefix=key[2],
+                pageviews=0, user_pageviews=0, anon_pageviews=0,
+            )
+            db.session.add(row)
+        else:
+            b['ips'].merge(HyperLogLog.from_bytes(row.ip_sketch))
+            b['users'].merge(HyperLogLog.from_bytes(row.user_sketch))
+        row.pageviews = (row.pageviews or 0) + b['pv']
+        row.user_pageviews = (row.user_pageviews or 0) + b['upv']
+        row.anon_pageviews = (row.anon_pageviews or 0) + b['apv']
+        row.ip_sketch = b['ips'].to_bytes()
+        row.user_sketch = b['users'].to_bytes()
+
+
+# ── 조회 ──
+
+def _day_start(d):
+    return datetime.combine(d, datetime.min.time())
+
+
+def daily_series(start_date, end_date, prefix=ALL_PATHS):
+    """일별 [{'date', 'visitors', 'logged_in', 'pageviews'}] — 쿼리 1회"""
+    rows = VisitRollup.query.filter(
+        VisitRollup.granularity == 'day',
+        VisitRollup.path_prefix == prefix,
+        VisitRollup.bucket >= _day_start(start_date),
+        VisitRollup.bucket <= _day_start(end_date),
+    ).all()
+    by_day = {r.bucket.date(): r for r in rows}
+
+    series = []
+    d = start_date
+    while d <= end_date:
+        r = by_day.get(d)
+        series.append({
+            'date': d.strftime('%m/%d'),
+            'visitors': HyperLogLog.from_bytes(r.ip_sketch).count() if r else 0,
+            'logged_in': HyperLogLog.from_bytes(r.user_sketch).count() if r else 0,
+            'pageviews': r.pageviews if r else 0,
+        })
+        d += timedelta(days=1)
+    return series
+
+
+def distinct_visitors(start_date, end_date, prefix=ALL_PATHS):
+    """기간 내 고유 (IP, 회원) 수 — 일별 스케치 병합 (MAU 등)"""
+    ips, users = HyperLogLog(), HyperLogLog()
+    rows = db.session.query(VisitRollup.ip_sketch, VisitRollup.user_sketch).filter(
+        VisitRollup.granularity == 'day',
+        VisitRollup.path_prefix == prefix,
+        VisitRollup.bucket >= _day_start(start_date),
+        VisitRollup.bucket <= _day_start(end_date),
+    ).all()
+    for ip_sketch, user_sketch in rows:
+        ips.merge(HyperLogLog.from_bytes(ip_sketch))
+        users.merge(HyperLogLog.from_bytes(user_sketch))
+    return ips.count(), users.count()
+
+
+def top_prefixes(start_date, end_date, limit=10):
+    """기간 내 페이지뷰 상위 경로 prefix [(path, hits)]"""
+    hits = func.sum(VisitRollup.pageviews)
+    return db.session.query(VisitRollup.path_prefix, hits.label('hits')).filter(
+        VisitRollup.granularity == 'day',
+        VisitRollup.path_prefix != ALL_PATHS,
+        VisitRollup.bucket >= _day_start(start_date),
+        VisitRollup.bucket <= _day_start(end_date),
+    ).group_by(VisitRollup.path_prefix).order_by(hits.desc()).limit(limit).all()
+
+
+def hourly_series(since, prefix=ALL_PATHS):
+    """since 이후 시간별 [{'hour', 'visitors', 'pageviews'}]"""
+    rows = VisitRollup.query.filter(
+        VisitRollup.granularity == 'hour',
+        VisitRollup.path_prefix == prefix,
+        VisitRollup.bucket >= since,
+    ).order_by(VisitRollup.bucket).all()
+    return [{
+        'hour': r.bucket.strftime('%m/%d %H시'),
+        'visitors': HyperLogLog.from_bytes(r.ip_sketch).count(),
+        'pageviews': r.pageviews,
+    } for r in rows]
@@ -0,0 +1,134 @@
+"""요청 경로 밖에서 DB 쓰기를 모아 처리하는 인-프로세스 버퍼
+
+요청 핸들러는 enqueue()로 행만 넣고 즉시 반환하며,
+백그라운드 플러셔 스레드가 flush_interval 마다 또는 batch_size 가 차면
+flush_fn(rows) 한 번으로 일괄 기록한다.
+
+- 큐가 가득 차면 요청을 막지 않고 버리며 dropped 카운터를 올린다.
+- 프로세스 종료(atexit) 시 남은 행을 마지막으로 플러시한다.
+- gunicorn --preload 로 fork 된 경우 워커별로 스레드를 다시 띄운다.
+"""
+import os
+import atexit
+import logging
+import queue
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBuffer:
+    """bounded queue + 백그라운드 플러셔"""
+
+    def __init__(self, name, flush_fn, max_size=10000, batch_size=500, flush_interval=2.0):
+        self.name = name
+        self.flush_fn = flush_fn
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._queue = None
+        self._wakeup = None
+        self._thread = None
+        self._pid = None
+        self._stats = {'enqueued': 0, 'flushed': 0, 'dropped': 0, 'failed': 0, 'flushes': 0}
+        atexit.register(self.shutdown)
+
+    # ── 생산자 ──
+
+    def enqueue(self, row):
+        """행 1개 추가 (절대 블로킹하지 않음). 버려지면 False"""
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self._count('dropped')
+            return False
+        self._count('enqueued')
+        if self._queue.qsize() >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    # ── 소비자 ──
+
+    def flush(self):
+        """큐에 쌓인 행을 batch_size 단위로 모두 기록. 기록한 행 수 반환"""
+        if self._queue is None:
+            return 0
+        total = 0
+        with self._flush_lock:
+            while True:
+                rows = self._drain(self.batch_size)
+                if not rows:
+                    break
+                try:
+                    self.flush_fn(rows)
+                except Exception as e:
+                    self._count('failed', len(rows))
+                    logger.error(f'[{self.name}] 플러시 실패 ({len(rows)}건 폐기): {e}')
+                    continue
+                self._count('flushed', len(rows))
+                self._count('flushes')
+                total += len(rows)
+        return total
+
+    def shutdown(self):
+        """종료 시 남은 행 플러시 (atexit)"""
+        if self._pid != os.getpid():
+            return
+        try:
+            n = self.flush()
+            if n:
+                logger.info(f'[{self.name}] 종료 전 {n}건 플러시')
+        except Exception as e:
+            logger.error(f'[{self.name}] 종료 플러시 실패: {e}')
+
+    def stats(self):
+        """enqueued/flushed/dropped/failed 카운터 + 현재 큐 길이"""
+        with self._lock:
+            data = dict(self._stats)
+        data['pending'] = self._queue.qsize() if self._queue is not None else 0
+        return data
+
+    # ── 내부 ──
+
+    def _count(self, key, n=1):
+        with self._lock:
+            self._stats[key] += n
+
+    def _drain(self, limit):
+        rows = []
+        while len(rows) < limit:
+            try:
+                rows.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return rows
+
+    def _ensure_started(self):
+        pid = os.getpid()
+        if self._pid == pid and self._thread is not None:
+            return
+        with self._lock:
+            if self._pid == pid and self._thread is not None:
+                return
+            # fork 이후엔 부모의 큐/스레드를 버리고 새로 시작
+            self._queue = queue.Queue(maxsize=self.max_size)
+            self._flush_lock = threading.Lock()
+            self._wakeup = threading.Event()
+            self._pid = pid
+            self._thread = threading.Thread(
+                target=self._run, name=f'{self.name}-flusher', daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f'[{self.name}] 플러셔 오류: {e}')
@@ -1,14 +1,16 @@
 import os
 import json
-import asyncio
 import logging
 import psycopg2
 import requests
 from bs4 import BeautifulSoup
 from anthropic import Anthropic
-from playwright.async_api import async_playwright
 from datetime import datetime
 
+from app.utils.article_extract import extract_article_async
+from app.utils.job_runtime import run_coroutine, run_blocking
+from app.utils.telegram_delivery import send_message
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -131,32 +133,10 @@ def search_candidate_news():
         return []
 
 async def fetch_article_text(url):
-    try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            try:
-                page = await browser.new_page()
-                await page.goto(url, wait_until='domcontentloaded', timeout=15000)
-
-                content = ""
-                if "naver.com" in url:
-                    elem = await page.query_selector("#dic_area")
-                    if elem:
-                        content = await elem.inner_text()
-
-                if not content:
-                    paragraphs = await page.query_selector_all("p")
-                    text_blocks = []
-                    for p_elem in paragraphs:
-                        text_blocks.append(await p_elem.inner_text())
-                    content = "\n".join(text_blocks)
-
-                return content.strip()
-            finally:
-                await browser.close()
-    except Exception as e:
-        logger.error(f"본문 로드 오류 ({url}): {e}")
-        return ""
+    article = await extract_article_async(url)
+    if not article.ok:
+        logger.error(f"본문 로드 오류 ({url}): {article.error}")
+    return article.text.strip()
 
 def parse_candidate_updates(text):
     if not ANTHROPIC_API_KEY:
@@ -232,15 +212,9 @@ def broadcast_update(update_obj):
         targets.append((BOT_TOKEN_NR, CHAT_ID_NR))
         
     for token, chat_id in targets:
-        url = f'https://api.telegram.org/bot{token}/sendMessage'
-        try:
-            requests.post(url, json={
-                'chat_id': chat_id,
-                'text': message,
-                'disable_web_page_preview': True
-            }, timeout=10)
-        except Exception as e:
-            logger.error(f"텔레그램 발송 예외: {e}")
+        result = send_message(token, chat_id, message, parse_mode=None, disable_preview=True)
+        if not result.ok:
+            logger.error(f"텔레그램 발송 예외: {result.error}")
 
 def process_and_check_updates(parsed_updates):
     if not parsed_updates:
@@ -297,27 +271,19 @@ def process_and_check_updates(parsed_updates):
 
 async def run_candidate_tracker_async():
     logger.info("후보 현황 트래커 시작...")
-    init_candidate_db()
+    await run_blocking(init_candidate_db)
     
-    links = search_candidate_news()
+    links = await run_blocking(search_candidate_news)
     for link in links:
         text = await fetch_article_text(link)
         if len(text) > 100:
-            updates = parse_candidate_updates(text)
-            process_and_check_updates(updates)
+            updates = await run_blocking(parse_candidate_updates, text)
+            await run_blocking(process_and_check_updates, updates)
             
     logger.info("후보 현황 트래커 작업 완료.")
 
 def check_candidate_changes():
-    loop = asyncio.new_event_loop()
-    try:
-        loop.run_until_complete(run_candidate_tracker_async())
-    finally:
-        try:
-            loop.run_until_complete(loop.shutdown_asyncgens())
-        except Exception:
-            pass
-        loop.close()
+    run_coroutine(run_candidate_tracker_async(), timeout=None)
 
 if __name__ == "__main__":
     check_candidate_changes()
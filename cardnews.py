@@ -33,6 +33,9 @@ except ImportError:  # 배포 환경 외
 
 import requests
 
+from app.utils.browser_pool import browser_page
+from app.utils.job_runtime import run_coroutine
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
@@ -348,40 +351,37 @@ def build_html(headline: str, issues: list[dict], date_str: str,
 # ══════════════════════════════════════════════════
 #  3. Playwright 렌더링 (headless chromium)
 # ══════════════════════════════════════════════════
-def render_cards(html: str, out_dir: str) -> list[str]:
-    """HTML → 카드별 1080×1080 PNG. 저장 경로 목록 반환."""
-    from playwright.sync_api import sync_playwright
-
-    os.makedirs(out_dir, exist_ok=True)
+async def _render_cards_async(html: str, out_dir: str) -> list[str]:
     paths: list[str] = []
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(
-            headless=True,
-            args=["--no-sandbox", "--disable-dev-shm-usage"],
-        )
-        page = browser.new_page(
-            viewport={"width": CARD_W, "height": CARD_H},
-            device_scale_factor=1,
-        )
+    # 카드는 웹폰트·data URI 이미지가 필요하므로 리소스 차단 없는 컨텍스트
+    async with browser_page(
+        block_resources=False,
+        viewport={"width": CARD_W, "height": CARD_H},
+        device_scale_factor=1,
+    ) as page:
         # 'load'로 <link> 스타일시트 fetch까지 보장하고, 폰트 실제 로드는
         # 스크립트의 document.fonts.ready 로 대기(networkidle 은 CDN 지연 시 멈춤 위험).
-        page.set_content(html, wait_until="load", timeout=15000)
+        await page.set_content(html, wait_until="load", timeout=15000)
         # 폰트 로드 + 오버플로 축소 완료 대기
         try:
-            page.wait_for_function("window.__fitDone === true", timeout=10000)
+            await page.wait_for_function("window.__fitDone === true", timeout=10000)
         except Exception:
             logger.warning("[카드뉴스] fit 대기 타임아웃 — 그대로 렌더")
 
-        cards = page.query_selector_all(".card")
+        cards = await page.query_selector_all(".card")
         for idx, card in enumerate(cards, start=1):
             fname = f"{idx:02d}.png"
             fpath = os.path.join(out_dir, fname)
-            card.screenshot(path=fpath)
+            await card.screenshot(path=fpath)
             paths.append(fpath)
+    return paths
 
-        browser.close()
 
+def render_cards(html: str, out_dir: str) -> list[str]:
+    """HTML → 카드별 1080×1080 PNG. 저장 경로 목록 반환.
+    브라우저는 공유 풀(app/utils/browser_pool.py)의 Chromium 을 재사용한다."""
+    os.makedirs(out_dir, exist_ok=True)
+    paths = run_coroutine(_render_cards_async(html, out_dir), timeout=120)
     logger.info(f"[카드뉴스] {len(paths)}장 렌더 완료 → {out_dir}")
     return paths
 
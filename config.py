@@ -55,6 +55,26 @@ class Config:
     # Kakao
     KAKAO_JS_KEY = os.environ.get('KAKAO_JS_KEY', '')
 
+    # 방문 추적 버퍼 (before_request → 백그라운드 일괄 INSERT)
+    VISIT_BUFFER_SIZE = int(os.environ.get('VISIT_BUFFER_SIZE', 10000))
+    VISIT_FLUSH_BATCH = int(os.environ.get('VISIT_FLUSH_BATCH', 500))
+    VISIT_FLUSH_INTERVAL_MS = int(os.environ.get('VISIT_FLUSH_INTERVAL_MS', 2000))
+
+    # 게시글 조회수 write-behind (같은 조회자 중복 제거 구간 포함)
+    VIEW_DEDUPE_SECONDS = int(os.environ.get('VIEW_DEDUPE_SECONDS', 600))
+    VIEW_FLUSH_INTERVAL_MS = int(os.environ.get('VIEW_FLUSH_INTERVAL_MS', 5000))
+
+    # 단축 URL 클릭 write-behind (같은 IP 연타는 이 구간 동안 프로세스 안에서 먼저 제외)
+    SHORTENER_DEDUPE_SECONDS = int(os.environ.get('SHORTENER_DEDUPE_SECONDS', 600))
+    SHORTENER_FLUSH_INTERVAL_MS = int(os.environ.get('SHORTENER_FLUSH_INTERVAL_MS', 2000))
+
+    # 페이지 캐시: 'sqlite' (워커 간 공유 파일) | 'memory' (워커 로컬)
+    PAGE_CACHE_BACKEND = os.environ.get('PAGE_CACHE_BACKEND', 'sqlite')
+    PAGE_CACHE_PATH = os.environ.get('PAGE_CACHE_PATH')
+
+    # 게시판 검색: 'auto' (PostgreSQL이면 pg_trgm) | 'pg_trgm' | 'bigram'
+    SEARCH_BACKEND = os.environ.get('SEARCH_BACKEND', 'auto')
+
     # Logging
     LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
     LOG_FILE = os.environ.get('LOG_FILE', 'logs/nr2.log')
@@ -86,6 +106,7 @@ class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
     WTF_CSRF_ENABLED = False
+    PAGE_CACHE_BACKEND = 'memory'
 
 
 config = {
@@ -15,25 +15,11 @@ from html import unescape
 from bs4 import BeautifulSoup
 import asyncio
 
-logger = logging.getLogger(__name__)
-
+from app.utils.browser_pool import browser_page, harvest_scroll
+from app.utils.job_runtime import run_coroutine
+from app.utils.telegram_delivery import send_message
 
-def _run_async(coro):
-    """asyncio.run 대체: event loop를 명시적으로 생성/종료해 자원 누수를 방지.
-
-    asyncio.run()은 내부에서 shutdown_default_executor()가 새 스레드를 시작하는데,
-    워커 프로세스가 스레드 포화 상태면 여기서 RuntimeError('can't start new thread')가 발생한다.
-    명시적으로 loop를 관리하면 누수 원인이 되는 executor/asyncgen 정리 단계를 통제할 수 있다.
-    """
-    loop = asyncio.new_event_loop()
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        try:
-            loop.run_until_complete(loop.shutdown_asyncgens())
-        except Exception:
-            pass
-        loop.close()
+logger = logging.getLogger(__name__)
 
 BOT_TOKEN = os.environ.get('SCRAP_BOT_TOKEN')
 CHAT_ID = os.environ.get('SCRAP_CHAT_ID', '5132309076')
@@ -151,53 +137,81 @@ def fetch_html(url, limit=3):
     return titles
 
 
+# 사설 항목 → [언론사, 설명] (BeautifulSoup get_text(strip=True) 와 같은 규칙: 텍스트 노드별 trim 후 이어붙임)
+_EDITORIAL_ITEM_JS = """el => {
+    const text = node => {
+        if (!node) return null;
+        const walker = document.createTreeWalker(node, NodeFilter.SHOW_TEXT);
+        let out = '', cur;
+        while ((cur = walker.nextNode())) out += cur.nodeValue.trim();
+        return out;
+    };
+    return [text(el.querySelector('.press_name')), text(el.querySelector('.description'))];
+}"""
+EDITORIAL_PER_PAPER = 3
+
+
+def _collect_editorials(rows, target_papers, results):
+    """[언론사, 설명] 행을 언론사별 최대 3건까지 results 에 추가"""
+    for press_name, description in rows:
+        if not press_name or press_name not in target_papers or not description:
+            continue
+        title = _clean_title(description)
+        if title and len(results[press_name]) < EDITORIAL_PER_PAPER and title not in results[press_name]:
+            results[press_name].append(title)
+    return results
+
+
 async def fetch_naver_editorials(target_papers):
-    from playwright.async_api import async_playwright
+    """네이버 사설 모음(오늘·어제)에서 대상 언론사 사설 제목 수집.
+
+    두 날짜를 페이지 2개로 동시에 열고, 항목이 더 늘지 않거나 필요한 만큼 모이면 스크롤을 멈춘다.
+    결과는 기존과 같이 오늘 것을 먼저, 모자라면 어제 것으로 채운다."""
     from datetime import datetime, timedelta
-    
+
     today = datetime.now()
     dates = [
         today.strftime("%Y%m%d"),
         (today - timedelta(days=1)).strftime("%Y%m%d")
     ]
-    
-    results = {paper: [] for paper in target_papers}
-    
-    try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            try:
-                for date_str in dates:
-                    url = f"https://news.naver.com/opinion/editorial?date={date_str}"
-                    page = await browser.new_page(
-                        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0 Safari/537.36"
-                    )
-                    await page.goto(url, wait_until="networkidle", timeout=30000)
-                    for _ in range(15):
-                        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                        await page.wait_for_timeout(800)
-                    html = await page.content()
-                    await page.close()
-
-                    soup = BeautifulSoup(html, "html.parser")
-                    for item in soup.find_all(class_='opinion_editorial_item'):
-                        press_tag = item.find(class_='press_name')
-                        if not press_tag:
-                            continue
-                        press_name = press_tag.get_text(strip=True)
-
-                        if press_name in target_papers:
-                            desc_tag = item.find(class_='description')
-                            if desc_tag:
-                                title = _clean_title(desc_tag.get_text(strip=True))
-                                if title and len(results[press_name]) < 3:
-                                    if title not in results[press_name]:
-                                        results[press_name].append(title)
-            finally:
-                await browser.close()
-    except Exception as e:
-        logger.error(f"Playwright 에러: {e}")
-        
+    rows_by_date = {date_str: [] for date_str in dates}
+
+    def merged():
+        results = {paper: [] for paper in target_papers}
+        for date_str in dates:
+            _collect_editorials(rows_by_date[date_str], target_papers, results)
+        return results
+
+    def filled(results):
+        return all(len(results[paper]) >= EDITORIAL_PER_PAPER for paper in target_papers)
+
+    async def harvest(index, date_str):
+        url = f"https://news.naver.com/opinion/editorial?date={date_str}"
+        if index == 0:
+            # 오늘 페이지는 자기 항목만으로 채워져야 멈춤 (어제 것보다 우선)
+            def enough(rows):
+                rows_by_date[date_str] = rows
+                return filled(_collect_editorials(rows, target_papers, {p: [] for p in target_papers}))
+        else:
+            def enough(rows):
+                rows_by_date[date_str] = rows
+                return filled(merged())
+        async with browser_page(
+            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0 Safari/537.36"
+        ) as page:
+            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            rows_by_date[date_str] = await harvest_scroll(
+                page, '.opinion_editorial_item', _EDITORIAL_ITEM_JS, enough=enough,
+            )
+
+    started = datetime.now()
+    outcomes = await asyncio.gather(*(harvest(i, d) for i, d in enumerate(dates)), return_exceptions=True)
+    for date_str, outcome in zip(dates, outcomes):
+        if isinstance(outcome, Exception):
+            logger.error(f"Playwright 에러 ({date_str}): {outcome}")
+    results = merged()
+    logger.info(f"[사설] 네이버 사설 수집 {(datetime.now() - started).total_seconds():.1f}s "
+                f"({', '.join(f'{d}:{len(rows_by_date[d])}건' for d in dates)})")
     return results
 
 
@@ -210,26 +224,19 @@ async def fetch_asiae_siron(limit=3):
     아시아경제는 공식 사설 섹션 부재. '시론'이 사설격 컨텐츠.
     HTML SSR에 기사 미노출이라 Playwright로 렌더링 후 article.component_bx 추출.
     """
-    from playwright.async_api import async_playwright
-
     url = 'https://www.asiae.co.kr/list/opinion-column/column15/'
     items = []
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            try:
-                page = await browser.new_page(
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
-                               'AppleWebKit/537.36 Chrome/120.0 Safari/537.36'
-                )
-                await page.goto(url, wait_until='networkidle', timeout=20000)
-                await page.wait_for_timeout(2000)
-                items = await page.eval_on_selector_all(
-                    'article.component_bx a[href*="/article/"]',
-                    'els => els.map(e => e.innerText.trim())'
-                )
-            finally:
-                await browser.close()
+        async with browser_page(
+            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
+                       'AppleWebKit/537.36 Chrome/120.0 Safari/537.36'
+        ) as page:
+            await page.goto(url, wait_until='networkidle', timeout=20000)
+            await page.wait_for_timeout(2000)
+            items = await page.eval_on_selector_all(
+                'article.component_bx a[href*="/article/"]',
+                'els => els.map(e => e.innerText.trim())'
+            )
     except Exception as e:
         logger.warning(f'아시아경제 Playwright 실패: {e}')
         return []
@@ -289,7 +296,7 @@ def fetch_titles(paper):
         if name == '내일신문':
             return fetch_naeil_direct()
         if name == '아시아경제':
-            return _run_async(fetch_asiae_siron())
+            return run_coroutine(fetch_asiae_siron())
     return None  # 미지원
 
 
@@ -378,7 +385,7 @@ def send_editorial():
     if papers_to_fallback:
         target_names = [name for _, name, _ in papers_to_fallback]
         print(f"\n[Playwright] 네이버 사설 페이지 보완 수집 시작: {target_names}")
-        fallback_res = _run_async(fetch_naver_editorials(target_names))
+        fallback_res = run_coroutine(fetch_naver_editorials(target_names))
 
         for category, name, p in papers_to_fallback:
             added_titles = fallback_res.get(name, [])
@@ -399,41 +406,17 @@ def send_editorial():
 
     message = format_message(editorials)
 
-    # 4096자 초과 시 분할
-    if len(message) > 4000:
-        parts = []
-        current = ''
-        for line in message.split('\n'):
-            if len(current) + len(line) + 1 > 4000:
-                parts.append(current)
-                current = line
-            else:
-                current += '\n' + line if current else line
-        if current:
-            parts.append(current)
-    else:
-        parts = [message]
-
     if not BOT_TOKEN:
         print('SCRAP_BOT_TOKEN 없음 — 전송 생략')
         return
 
-    url = f'https://api.telegram.org/bot{BOT_TOKEN}/sendMessage'
-    for part in parts:
-        try:
-            resp = requests.post(url, json={
-                'chat_id': CHAT_ID,
-                'text': part,
-                'parse_mode': 'HTML',
-                'disable_web_page_preview': True,
-            }, timeout=10)
-            if resp.status_code == 200:
-                print(f'전송 완료 ({len(part)}자)')
-            else:
-                print(f'전송 실패: {resp.text}')
-        except Exception as e:
-            logger.error(f'전송 오류: {e}')
-            print(f'오류: {e}')
+    # 4096자 초과 시 분할·속도 제한은 공용 발송 계층이 처리
+    result = send_message(BOT_TOKEN, CHAT_ID, message, parse_mode='HTML', disable_preview=True)
+    if result.ok:
+        print(f'전송 완료 ({result.parts}개 메시지, {len(message)}자)')
+    else:
+        logger.error(f'전송 오류: {result.error}')
+        print(f'전송 실패: {result.error}')
 
     logger.info('=== 사설봇 완료 ===')
     print('사설봇 완료 ✅')
@@ -477,7 +460,7 @@ def send_editorial_nureongi():
 
     if papers_to_fallback:
         target_names = [name for _, name, _ in papers_to_fallback]
-        fallback_res = _run_async(fetch_naver_editorials(target_names))
+        fallback_res = run_coroutine(fetch_naver_editorials(target_names))
         for category, name, p in papers_to_fallback:
             added_titles = fallback_res.get(name, [])
             rows = editorials[category]
@@ -492,33 +475,11 @@ def send_editorial_nureongi():
 
     message = format_message(editorials)
     
-    # 분할 발송
-    if len(message) > 4000:
-        parts = []
-        current = ''
-        for line in message.split('\n'):
-            if len(current) + len(line) + 1 > 4000:
-                parts.append(current)
-                current = line
-            else:
-                current += '\n' + line if current else line
-        if current:
-            parts.append(current)
+    result = send_message(NUREONGI_TOKEN, NUREONGI_CHAT, message, parse_mode='HTML', disable_preview=True)
+    if result.ok:
+        print(f'누렁이 정보방 전송 완료 ({result.parts}개 메시지, {len(message)}자)')
     else:
-        parts = [message]
-
-    url = f'https://api.telegram.org/bot{NUREONGI_TOKEN}/sendMessage'
-    for part in parts:
-        resp = requests.post(url, json={
-            'chat_id': NUREONGI_CHAT,
-            'text': part,
-            'parse_mode': 'HTML',
-            'disable_web_page_preview': True,
-        }, timeout=10)
-        if resp.status_code == 200:
-            print(f'누렁이 정보방 전송 완료 ({len(part)}자)')
-        else:
-            print(f'누렁이 정보방 전송 실패: {resp.text}')
+        print(f'누렁이 정보방 전송 실패: {result.error}')
 
 
 def _collect_evening_editorials():
@@ -566,7 +527,7 @@ def _collect_evening_editorials():
     if papers_to_fallback:
         target_names = [name for _, name, _ in papers_to_fallback]
         print(f'\n[Playwright] 네이버 사설 페이지 보완 수집 시작: {target_names}')
-        fallback_res = _run_async(fetch_naver_editorials(target_names))
+        fallback_res = run_coroutine(fetch_naver_editorials(target_names))
         for category, name, p in papers_to_fallback:
             added = fallback_res.get(name, [])
             rows = editorials[category]
@@ -589,34 +550,11 @@ def _send_evening(message, token, chat_id, label):
     if not token:
         print(f'[{label}] 토큰 없음 — 전송 생략')
         return
-    if len(message) > 4000:
-        parts, current = [], ''
-        for line in message.split('\n'):
-            if len(current) + len(line) + 1 > 4000:
-                parts.append(current)
-                current = line
-            else:
-                current += '\n' + line if current else line
-        if current:
-            parts.append(current)
+    result = send_message(token, chat_id, message, parse_mode='HTML', disable_preview=True)
+    if result.ok:
+        print(f'[{label}] 전송 완료 ({result.parts}개 메시지, {len(message)}자)')
     else:
-        parts = [message]
-
-    url = f'https://api.telegram.org/bot{token}/sendMessage'
-    for part in parts:
-        try:
-            resp = requests.post(url, json={
-                'chat_id': chat_id,
-                'text': part,
-                'parse_mode': 'HTML',
-                'disable_web_page_preview': True,
-            }, timeout=10)
-            if resp.status_code == 200:
-                print(f'[{label}] 전송 완료 ({len(part)}자)')
-            else:
-                print(f'[{label}] 전송 실패: {resp.text[:200]}')
-        except Exception as e:
-            logger.error(f'[{label}] 전송 오류: {e}')
+        logger.error(f'[{label}] 전송 오류: {result.error}')
 
 
 def send_editorial_afternoon():
@@ -15,6 +15,7 @@ import pytz
 import requests
 
 from app.utils.press_map import PRESS_MAP
+from app.utils.telegram_delivery import send_message
 
 logger = logging.getLogger(__name__)
 
@@ -24,8 +25,6 @@ BOT_TOKEN_SCRAP = os.environ.get('SCRAP_BOT_TOKEN')
 CHAT_ID_SCRAP = os.environ.get('SCRAP_CHAT_ID', '5132309076')
 
 NAVER_API_URL = 'https://openapi.naver.com/v1/search/news.json'
-TELEGRAM_API = 'https://api.telegram.org/bot{token}/sendMessage'
-TELEGRAM_LIMIT = 4096
 
 # 순서 고정 — CATEGORIES 리스트 인덱스 순으로 메시지에 출력.
 CATEGORIES = [
@@ -384,52 +383,16 @@ def format_exclusive_message(items, edition='morning'):
     return '\n'.join(lines)
 
 
-def _split_for_telegram(text, limit=TELEGRAM_LIMIT):
-    """4096자 초과 시 줄바꿈 경계로 분할."""
-    if len(text) <= limit:
-        return [text]
-    parts = []
-    current = ''
-    for line in text.split('\n'):
-        if len(current) + len(line) + 1 > limit:
-            if current:
-                parts.append(current)
-            current = line
-        else:
-            current = f'{current}\n{line}' if current else line
-    if current:
-        parts.append(current)
-    return parts
-
-
 def _send_telegram(token, chat_id, text, channel_label):
     if not token:
         logger.warning(f'[{channel_label}] 봇 토큰 미설정 — 발송 스킵')
         return False
-    url = TELEGRAM_API.format(token=token)
-    parts = _split_for_telegram(text)
-    ok = True
-    for idx, chunk in enumerate(parts, 1):
-        try:
-            resp = requests.post(
-                url,
-                json={
-                    'chat_id': chat_id,
-                    'text': chunk,
-                    'parse_mode': 'HTML',
-                    'disable_web_page_preview': True,
-                },
-                timeout=10,
-            )
-            if resp.status_code == 200:
-                logger.info(f'[{channel_label}] 발송 완료 ({idx}/{len(parts)}, {len(chunk)}자)')
-            else:
-                ok = False
-                logger.error(f'[{channel_label}] 발송 실패 HTTP {resp.status_code}: {resp.text[:200]}')
-        except Exception as e:
-            ok = False
-            logger.error(f'[{channel_label}] 발송 예외: {e}')
-    return ok
+    result = send_message(token, chat_id, text, parse_mode='HTML', disable_preview=True)
+    if result.ok:
+        logger.info(f'[{channel_label}] 발송 완료 ({result.parts}개 메시지, {len(text)}자)')
+    else:
+        logger.error(f'[{channel_label}] 발송 실패: {result.error}')
+    return result.ok
 
 
 def send_exclusive_news(edition='morning'):
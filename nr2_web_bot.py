@@ -10,6 +10,8 @@ import logging
 import requests
 from datetime import datetime, timedelta
 
+from app.utils.telegram_delivery import send_message
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -22,21 +24,10 @@ def tg_send(chat_id, text):
     if not BOT_TOKEN:
         logger.warning('[WebBot] TELEGRAM_BOT_TOKEN 미설정')
         return False
-    url = f"https://api.telegram.org/bot{BOT_TOKEN}/sendMessage"
-    payload = {
-        'chat_id': chat_id,
-        'text': text,
-        'parse_mode': 'HTML',
-        'disable_web_page_preview': False,
-    }
-    try:
-        resp = requests.post(url, json=payload, timeout=10)
-        if not resp.ok:
-            logger.error(f'[WebBot] 전송 실패: {resp.text}')
-        return resp.ok
-    except Exception as e:
-        logger.error(f'[WebBot] 전송 오류: {e}')
-        return False
+    result = send_message(BOT_TOKEN, chat_id, text, parse_mode='HTML', disable_preview=False)
+    if not result.ok:
+        logger.error(f'[WebBot] 전송 실패: {result.error}')
+    return result.ok
 
 
 # ──────────────────────────────────────────────
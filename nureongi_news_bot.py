@@ -1,10 +1,13 @@
 """누렁이 뉴스봇 v2 - 언론사 표시 + 속보/단독 강화 + DB 저장"""
 import os
-import asyncio
-import requests
+import re
+import time
 import json
+import functools
 from bs4 import BeautifulSoup
-from telegram import Bot
+from app.utils.feed_collector import get_feed_collector
+from app.utils.neardup import NearDupIndex, dedupe
+from app.utils.telegram_delivery import send_message
 
 BOT_TOKEN = os.environ.get('NUREONGI_NEWS_BOT_TOKEN')
 CHAT_ID = "@gazzzza2025"
@@ -189,55 +192,89 @@ SECTION_EMOJI = {
 }
 
 
-def parse_articles(url, section_name, limit=30):
-    """네이버 뉴스 섹션 파싱 - 언론사 포함"""
+# --- 수집 단계: 모든 섹션 페이지를 keep-alive 세션으로 동시에 받고 lxml 로 파싱 ---
+
+CRAWL_USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)'
+
+
+def _collector():
+    # 한 번에 받는 페이지는 최대 속보 4 + 섹션 4 — 스레드를 그 이상 둘 필요가 없다
+    return get_feed_collector('nureongi_news', max_workers=len(BREAKING_SOURCES) + len(SOURCES),
+                              user_agent=CRAWL_USER_AGENT)
+
+
+def _html_page(parse):
+    """parse(soup, *인자) → 수집기 파서 parse(본문 bytes, *인자)"""
+    @functools.wraps(parse)
+    def parse_page(content, *args):
+        return parse(BeautifulSoup(content, 'lxml', from_encoding='utf-8'), *args)
+    return parse_page
+
+
+def _crawl(pages, parse, label):
+    """pages: {키: (url, 파싱 인자...)} → {키: parse(soup, *인자) 결과 리스트}
+
+    304·본문 해시 동일 시 파싱 재사용, 실패 시 직전 결과 사용은 FeedCollector 가 맡는다.
+    결과 dict 는 호출부가 수정하므로 매번 복사본을 돌려준다."""
+    started = time.monotonic()
+    parsed = {}
+    for key, feed in _collector().collect(pages, parse).items():
+        if feed.error:
+            print(f"[{label}] {key} 오류: {feed.error}")
+        parsed[key] = [dict(item) for item in feed.entries]
+        print(f"[{label}] {key}: {len(feed.entries)}건 {feed.status} "
+              f"(다운로드 {feed.fetch_seconds:.2f}s, 파싱 {feed.parse_seconds:.3f}s)")
+    print(f"[{label}] {len(pages)}개 페이지 {time.monotonic() - started:.2f}s")
+    return parsed
+
+
+@_html_page
+def _parse_section(soup, section_name, limit):
+    """네이버 뉴스 섹션/속보 페이지 → 기사 목록 (언론사 포함)"""
     articles = []
-    headers = {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)'}
-    try:
-        res = requests.get(url, headers=headers, timeout=10)
-        soup = BeautifulSoup(res.text, 'html.parser')
-        items = soup.select('.sa_item')[:limit]
-        for item in items:
-            title_el = item.select_one('a.sa_text_title')
-            press_el = item.select_one('.sa_text_press')
-            if not title_el:
-                continue
-            title = title_el.get_text(strip=True)
-            link = title_el.get('href', '')
-            press = press_el.get_text(strip=True) if press_el else '미상'
-            if not link.startswith('http'):
-                continue
-            articles.append({
-                'title': title,
-                'link': link,
-                'press': press,
-                'section': section_name,
-            })
-    except Exception as e:
-        print(f"크롤링 오류 [{section_name}]: {e}")
+    for item in soup.select('.sa_item')[:limit]:
+        title_el = item.select_one('a.sa_text_title')
+        press_el = item.select_one('.sa_text_press')
+        if not title_el:
+            continue
+        title = title_el.get_text(strip=True)
+        link = title_el.get('href', '')
+        press = press_el.get_text(strip=True) if press_el else '미상'
+        if not link.startswith('http'):
+            continue
+        articles.append({
+            'title': title,
+            'link': link,
+            'press': press,
+            'section': section_name,
+        })
     return articles
 
 
+def parse_articles(url, section_name, limit=30):
+    """네이버 뉴스 섹션 파싱 - 언론사 포함"""
+    return _crawl({section_name: (url, section_name, limit)}, _parse_section, '뉴스')[section_name]
+
+
 def get_news():
     """키워드/태그 매칭 기사 수집"""
     all_articles = []
     seen_links = set()
 
-    # 1) 속보 페이지 먼저 (최신순)
+    # 속보 페이지(최신순) → 일반 섹션 순서로 합치되, 8개 페이지는 한 번에 동시 수집
+    pages = {}
     for section_name, url in BREAKING_SOURCES:
-        for art in parse_articles(url, section_name, limit=60):
-            if art['link'] not in seen_links:
-                seen_links.add(art['link'])
-                all_articles.append(art)
-
-    # 2) 일반 섹션
+        pages[f'속보/{section_name}'] = (url, section_name, 60)
     for section_name, url in SOURCES:
-        for art in parse_articles(url, section_name, limit=30):
+        pages[f'섹션/{section_name}'] = (url, section_name, 30)
+
+    for articles in _crawl(pages, _parse_section, '뉴스').values():
+        for art in articles:
             if art['link'] not in seen_links:
                 seen_links.add(art['link'])
                 all_articles.append(art)
 
-    # 3) 필터: 키워드 또는 특수태그 매칭
+    # 필터: 키워드 또는 특수태그 매칭
     matched = []
     for art in all_articles:
         title = art['title']
@@ -277,18 +314,7 @@ def format_message(art):
 def _deduplicate_articles(articles, threshold=0.65):
     """제목 유사도 기반 중복 제거 — 같은 사건은 대표 기사 1건만 선택.
     속보/단독 우선, 그 다음 통신사(연합뉴스) 우선."""
-    import difflib
-    selected = []
-    for art in articles:
-        is_dup = False
-        for sel in selected:
-            ratio = difflib.SequenceMatcher(None, art['title'], sel['title']).ratio()
-            if ratio >= threshold:
-                is_dup = True
-                break
-        if not is_dup:
-            selected.append(art)
-    return selected
+    return dedupe(articles, lambda art: art['title'], threshold)
 
 
 # === nr2.kr 크로스포스팅 ===
@@ -442,7 +468,7 @@ def _archive_old_articles():
         conn.close()
 
 
-async def send_news():
+def send_news():
     if not BOT_TOKEN:
         print("NUREONGI_NEWS_BOT_TOKEN 환경변수 없음")
         return
@@ -464,14 +490,12 @@ async def send_news():
         sent_set = set()
         print("[뉴스봇v2] 경고: DB 연결 실패, sent URL 조회 불가 (이번 사이클은 보수적으로 스킵)")
 
-    bot = Bot(BOT_TOKEN)
     try:
         # DB 연결 실패 시 이번 사이클 전면 스킵 — 발송 후 기록할 수 없으면 재발송 위험
         if not sent_conn:
             print("[뉴스봇v2] DB 없음 — 발송 건너뜀")
             return
 
-        await bot.initialize()
         articles = get_news()
 
         # 이미 보낸 기사 제외 (DB 기반 30일 이력)
@@ -498,18 +522,14 @@ async def send_news():
             # 텔레그램 발송: 회당 3건 제한
             if new_count < MAX_SEND_PER_CYCLE:
                 message = format_message(art)
-                try:
-                    await bot.send_message(
-                        CHAT_ID, message,
-                        parse_mode="HTML",
-                        disable_web_page_preview=True
-                    )
+                # 채널 발송 간격은 공용 발송 계층의 속도 제한이 맞춘다 (고정 sleep 없음)
+                result = send_message(BOT_TOKEN, CHAT_ID, message, parse_mode="HTML", disable_preview=True)
+                if result.ok:
                     tag = "🚨속보" if art['is_breaking'] else "📰"
                     print(f"✅ {tag} [{art['press']}] {art['title'][:30]}")
                     new_count += 1
-                    await asyncio.sleep(2)
-                except Exception as e:
-                    print(f"❌ 전송 실패: {e}")
+                else:
+                    print(f"❌ 전송 실패: {result.error}")
 
                 # nr2.kr 크로스포스팅 (텔레그램과 독립적으로 동작)
                 try:
@@ -540,12 +560,6 @@ async def send_news():
         except Exception as e:
             print(f"[랭킹] 수집 오류: {e}")
     finally:
-        # python-telegram-bot Bot은 httpx AsyncClient를 통해 백그라운드 스레드/커넥션을 쥐고 있음.
-        # 매 호출마다 명시적으로 shutdown 하지 않으면 워커 프로세스에 thread/fd가 누적돼 "can't start new thread" 발생.
-        try:
-            await bot.shutdown()
-        except Exception as e:
-            print(f"[뉴스봇v2] Bot shutdown 경고: {e}")
         if sent_conn:
             try:
                 sent_conn.close()
@@ -563,59 +577,58 @@ RANKING_SECTIONS = {
 }
 
 
+@_html_page
+def _parse_naver_ranking(soup, section_name):
+    """언론사별 많이 본 뉴스 박스 → 1~10위 기사"""
+    ranking = []
+    seen_links = set()
+    for box in soup.select('.rankingnews_box'):
+        press_el = box.select_one('.rankingnews_name')
+        press = press_el.get_text(strip=True) if press_el else '미상'
+
+        for item in box.select('.rankingnews_list li'):
+            link_el = item.select_one('a.list_title')
+            rank_el = item.select_one('.list_ranking_num')
+            if not link_el:
+                continue
+
+            link = link_el.get('href', '')
+            if not link.startswith('http') or link in seen_links:
+                continue
+            seen_links.add(link)
+
+            title = link_el.get_text(strip=True)
+            rank_str = rank_el.get_text(strip=True) if rank_el else '0'
+            rank = int(rank_str.replace('위', '').strip())
+
+            if rank >= 1 and rank <= 10:
+                ranking.append({
+                    'title': title,
+                    'link': link,
+                    'press': press,
+                    'section': section_name,
+                    'rank': rank,
+                    'is_ranking': True,
+                })
+    return ranking
+
+
 def fetch_naver_ranking():
     """네이버 뉴스 분야별 많이 본 뉴스 TOP 10 수집
 
     Returns:
         list of dicts with keys: title, link, press, section, rank, is_ranking
     """
-    headers = {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)'}
+    pages = {
+        section_name: (
+            f'https://news.naver.com/main/ranking/popularDay.naver?rankingType=popular_day&sectionId={section_id}',
+            section_name,
+        )
+        for section_name, section_id in RANKING_SECTIONS.items()
+    }
     all_ranking = []
-
-    for section_name, section_id in RANKING_SECTIONS.items():
-        url = f'https://news.naver.com/main/ranking/popularDay.naver?rankingType=popular_day&sectionId={section_id}'
-        try:
-            res = requests.get(url, headers=headers, timeout=10)
-            res.raise_for_status()
-            soup = BeautifulSoup(res.text, 'html.parser')
-
-            boxes = soup.select('.rankingnews_box')
-            seen_links = set()
-
-            for box in boxes:
-                press_el = box.select_one('.rankingnews_name')
-                press = press_el.get_text(strip=True) if press_el else '미상'
-
-                items = box.select('.rankingnews_list li')
-                for item in items:
-                    link_el = item.select_one('a.list_title')
-                    rank_el = item.select_one('.list_ranking_num')
-                    if not link_el:
-                        continue
-
-                    link = link_el.get('href', '')
-                    if not link.startswith('http') or link in seen_links:
-                        continue
-                    seen_links.add(link)
-
-                    title = link_el.get_text(strip=True)
-                    rank_str = rank_el.get_text(strip=True) if rank_el else '0'
-                    rank = int(rank_str.replace('위', '').strip())
-
-                    if rank >= 1 and rank <= 10:
-                        all_ranking.append({
-                            'title': title,
-                            'link': link,
-                            'press': press,
-                            'section': section_name,
-                            'rank': rank,
-                            'is_ranking': True,
-                        })
-
-            print(f"[랭킹] {section_name}: {sum(1 for a in all_ranking if a['section'] == section_name)}건")
-        except Exception as e:
-            print(f"[랭킹] {section_name} 수집 오류: {e}")
-
+    for articles in _crawl(pages, _parse_naver_ranking, '랭킹').values():
+        all_ranking.extend(articles)
     return all_ranking
 
 
@@ -627,53 +640,47 @@ DAUM_SECTIONS = {
 }
 
 
+@_html_page
+def _parse_daum_section(soup, section_name):
+    """다음 뉴스 섹션 상위 10개 기사"""
+    articles = []
+    for item in soup.select('.cont_thumb')[:10]:
+        title_el = item.select_one('.tit_txt')
+        link_el = item.select_one('a')
+        info_el = item.select_one('.info_txt')
+
+        if not title_el:
+            continue
+
+        title = title_el.get_text(strip=True)
+        href = link_el.get('href', '') if link_el else ''
+
+        # 언론사 이름 추출 (시간 정보 제거)
+        press = ''
+        if info_el:
+            raw = info_el.get_text(strip=True)
+            press = re.sub(r'\d+[분시간일]+\s*전$', '', raw).strip()
+
+        if title and href:
+            articles.append({
+                'title': title,
+                'link': href,
+                'press': press or '미상',
+                'section': section_name,
+            })
+    return articles
+
+
 def fetch_daum_ranking():
     """다음 뉴스 섹션별 상위 기사 수집 (에디터 큐레이션 기반)
 
     Returns:
         list of dicts with keys: title, link, press, section
     """
-    import re
-    headers = {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)'}
+    pages = {section_name: (url, section_name) for section_name, url in DAUM_SECTIONS.items()}
     all_articles = []
-
-    for section_name, url in DAUM_SECTIONS.items():
-        try:
-            res = requests.get(url, headers=headers, timeout=10)
-            res.encoding = 'utf-8'
-            res.raise_for_status()
-            soup = BeautifulSoup(res.text, 'html.parser')
-
-            items = soup.select('.cont_thumb')[:10]
-            for item in items:
-                title_el = item.select_one('.tit_txt')
-                link_el = item.select_one('a')
-                info_el = item.select_one('.info_txt')
-
-                if not title_el:
-                    continue
-
-                title = title_el.get_text(strip=True)
-                href = link_el.get('href', '') if link_el else ''
-
-                # 언론사 이름 추출 (시간 정보 제거)
-                press = ''
-                if info_el:
-                    raw = info_el.get_text(strip=True)
-                    press = re.sub(r'\d+[분시간일]+\s*전$', '', raw).strip()
-
-                if title and href:
-                    all_articles.append({
-                        'title': title,
-                        'link': href,
-                        'press': press or '미상',
-                        'section': section_name,
-                    })
-
-            print(f"[다음] {section_name}: {sum(1 for a in all_articles if a['section'] == section_name)}건")
-        except Exception as e:
-            print(f"[다음] {section_name} 수집 오류: {e}")
-
+    for articles in _crawl(pages, _parse_daum_section, '다음').values():
+        all_articles.extend(articles)
     return all_articles
 
 
@@ -683,20 +690,18 @@ def cross_platform_ranking(naver_articles, daum_articles):
     Returns:
         list of naver article dicts that also appear on daum
     """
-    import difflib
-    cross = []
-    used_daum = set()
+    daum_index = NearDupIndex(threshold=0.70)
+    for i, daum in enumerate(daum_articles):
+        daum_index.add(i, daum['title'])
 
+    cross = []
     for nav in naver_articles:
-        for i, daum in enumerate(daum_articles):
-            if i in used_daum:
-                continue
-            ratio = difflib.SequenceMatcher(None, nav['title'], daum['title']).ratio()
-            if ratio >= 0.70:
-                nav['is_cross_platform'] = True
-                cross.append(nav)
-                used_daum.add(i)
-                break
+        # 순차 비교와 같은 결과 — 조건을 만족하는 다음 기사 중 목록 순서가 가장 앞선 것과 짝지음
+        matches = sorted(i for i, _ in daum_index.query(nav['title']))
+        if matches:
+            nav['is_cross_platform'] = True
+            cross.append(nav)
+            daum_index.remove(matches[0])
 
     print(f"[교집합] 네이버 {len(naver_articles)}건 × 다음 {len(daum_articles)}건 → 교집합 {len(cross)}건")
     return cross
@@ -737,15 +742,8 @@ def save_ranking_to_db(art):
 
 
 def run_news_bot():
-    loop = asyncio.new_event_loop()
-    try:
-        loop.run_until_complete(send_news())
-    finally:
-        try:
-            loop.run_until_complete(loop.shutdown_asyncgens())
-        except Exception:
-            pass
-        loop.close()
+    # 발송이 공용 발송 계층(동기)으로 바뀌어 이벤트 루프 없이 잡 스레드에서 바로 실행
+    send_news()
 
 
 def run_ranking_collector():
@@ -9,7 +9,10 @@ from urllib.parse import urlparse
 from datetime import datetime
 from bs4 import BeautifulSoup
 from anthropic import Anthropic
-from playwright.async_api import async_playwright
+
+from app.utils.article_extract import extract_article_async
+from app.utils.job_runtime import run_coroutine, run_blocking
+from app.utils.telegram_delivery import send_message
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -176,28 +179,10 @@ def search_naver_news(query):
         return []
 
 async def fetch_article_text(url):
-    try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            try:
-                page = await browser.new_page()
-                await page.goto(url, wait_until='domcontentloaded', timeout=15000)
-
-                content = ""
-                if "naver.com" in url:
-                    elem = await page.query_selector("#dic_area")
-                    if elem: content = await elem.inner_text()
-
-                if not content:
-                    paragraphs = await page.query_selector_all("p")
-                    content = "\n".join([await p_elem.inner_text() for p_elem in paragraphs])
-
-                return content.strip()
-            finally:
-                await browser.close()
-    except Exception as e:
-        logger.error(f"본문 로드 오류 ({url}): {e}")
-        return ""
+    article = await extract_article_async(url)
+    if not article.ok:
+        logger.error(f"본문 로드 오류 ({url}): {article.error}")
+    return article.text.strip()
 
 def parse_poll_data_with_claude(prompt_context, text, poll_type):
     if not ANTHROPIC_API_KEY:
@@ -322,26 +307,10 @@ def send_telegram_targets(message):
     if BOT_TOKEN_SCRAP: targets.append((BOT_TOKEN_SCRAP, CHAT_ID_SCRAP))
     if BOT_TOKEN_NR: targets.append((BOT_TOKEN_NR, CHAT_ID_NR))
         
-    parts = []
-    current = ""
-    for line in message.split('\n'):
-        if len(current) + len(line) + 1 > 4000:
-            parts.append(current)
-            current = line
-        else:
-            current += '\n' + line if current else line
-    if current: parts.append(current)
-
     for token, chat_id in targets:
-        url = f'https://api.telegram.org/bot{token}/sendMessage'
-        for part in parts:
-            try:
-                requests.post(url, json={
-                    'chat_id': chat_id,
-                    'text': part,
-                }, timeout=10)
-            except Exception as e:
-                logger.error(f"텔레그램 발송 오류: {e}")
+        result = send_message(token, chat_id, message, parse_mode=None, disable_preview=False)
+        if not result.ok:
+            logger.error(f"텔레그램 발송 오류: {result.error}")
 
 def format_poll_message():
     conn = get_db_connection()
@@ -392,35 +361,27 @@ def format_poll_message():
 
 async def run_poll_tracker_async():
     logger.info("여론조사 트래커 (광역) 시작...")
-    init_db()
+    await run_blocking(init_db)
     for region in REGIONS:
-        links = search_naver_news(f"2026 지방선거 여론조사 {region} 광역단체장")
+        links = await run_blocking(search_naver_news, f"2026 지방선거 여론조사 {region} 광역단체장")
         for link in links:
             text = await fetch_article_text(link)
             if len(text) > 100:
-                poll_data = parse_poll_data_with_claude(region, text, "wide")
+                poll_data = await run_blocking(parse_poll_data_with_claude, region, text, "wide")
                 if poll_data:
                     c_map = {name: party for name, party in CANDIDATES.get(region, [])}
-                    upsert_poll_data(region, poll_data, c_map)
+                    await run_blocking(upsert_poll_data, region, poll_data, c_map)
         await asyncio.sleep(2)
         
-    message = format_poll_message()
-    send_telegram_targets(message)
+    message = await run_blocking(format_poll_message)
+    await run_blocking(send_telegram_targets, message)
     logger.info("여론조사 트래커 (광역) 완료.")
 
 def run_poll_tracker():
     if os.getenv("ENABLE_POLL_BOT", "false").lower() != "true":
         logger.info("[POLL_BOT] blocked at function entry")
         return
-    loop = asyncio.new_event_loop()
-    try:
-        loop.run_until_complete(run_poll_tracker_async())
-    finally:
-        try:
-            loop.run_until_complete(loop.shutdown_asyncgens())
-        except Exception:
-            pass
-        loop.close()
+    run_coroutine(run_poll_tracker_async(), timeout=None)
 
 
 async def check_basic_polls_async():
@@ -428,14 +389,14 @@ async def check_basic_polls_async():
     
     # 1. 기초단체장 경합지
     for region, cands in BASIC_TARGETS.items():
-        links = search_naver_news(f"2026 지방선거 여론조사 {region}")
+        links = await run_blocking(search_naver_news, f"2026 지방선거 여론조사 {region}")
         for link in links:
             text = await fetch_article_text(link)
             if len(text) > 100:
-                poll_data = parse_poll_data_with_claude(region, text, "basic")
+                poll_data = await run_blocking(parse_poll_data_with_claude, region, text, "basic")
                 if poll_data:
                     c_map = {name: party for name, party in cands}
-                    is_new = upsert_poll_data(region, poll_data, c_map)
+                    is_new = await run_blocking(upsert_poll_data, region, poll_data, c_map)
                     if is_new:
                         # 즉시 발송 포맷
                         pollster = poll_data.get("pollster", "")
@@ -447,19 +408,19 @@ async def check_basic_polls_async():
                             pct = res.get("percentage")
                             msg += f"({p}) {c} ▶ {pct}%\n"
                         msg += f"📈 [{pollster} / {poll_date}]\n\n출처: https://t.me/gazzzza2025"
-                        send_telegram_targets(msg)
+                        await run_blocking(send_telegram_targets, msg)
         await asyncio.sleep(2)
                         
     # 2. 교육감 17개 시도
     for region in REGIONS:
         db_region = f"{region} 교육감"
-        links = search_naver_news(f"2026 지방선거 여론조사 {region} 교육감")
+        links = await run_blocking(search_naver_news, f"2026 지방선거 여론조사 {region} 교육감")
         for link in links:
             text = await fetch_article_text(link)
             if len(text) > 100:
-                poll_data = parse_poll_data_with_claude(region, text, "edu")
+                poll_data = await run_blocking(parse_poll_data_with_claude, region, text, "edu")
                 if poll_data:
-                    is_new = upsert_poll_data(db_region, poll_data)
+                    is_new = await run_blocking(upsert_poll_data, db_region, poll_data)
                     if is_new:
                         pollster = poll_data.get("pollster", "")
                         poll_date = poll_data.get("poll_date", "")
@@ -470,17 +431,17 @@ async def check_basic_polls_async():
                             pct = res.get("percentage")
                             msg += f"{c} ({p}) ▶ {pct}%\n"
                         msg += f"📈 [{pollster} / {poll_date}]\n\n출처: https://t.me/gazzzza2025"
-                        send_telegram_targets(msg)
+                        await run_blocking(send_telegram_targets, msg)
         await asyncio.sleep(2)
                         
     # 3. 정당 지지율
-    links = search_naver_news("정당 지지율 여론조사 2026")
+    links = await run_blocking(search_naver_news, "정당 지지율 여론조사 2026")
     for link in links:
         text = await fetch_article_text(link)
         if len(text) > 100:
-            poll_data = parse_poll_data_with_claude("전국", text, "party")
+            poll_data = await run_blocking(parse_poll_data_with_claude, "전국", text, "party")
             if poll_data:
-                is_new = upsert_poll_data("정당지지율", poll_data)
+                is_new = await run_blocking(upsert_poll_data, "정당지지율", poll_data)
                 if is_new:
                     pollster = poll_data.get("pollster", "")
                     poll_date = poll_data.get("poll_date", "")
@@ -494,7 +455,7 @@ async def check_basic_polls_async():
                             # 길이에 맞춰 정렬 (단순 출력)
                             msg += f"{p[:5]:<5} ▶ {found_parties[p]}%\n"
                     msg += f"📈 [{pollster} / {poll_date}]\n\n출처: https://t.me/gazzzza2025"
-                    send_telegram_targets(msg)
+                    await run_blocking(send_telegram_targets, msg)
     
     logger.info("기초/교육감/정당 여론조사 확인 완료.")
 
@@ -502,15 +463,7 @@ def check_basic_polls():
     if os.getenv("ENABLE_POLL_BOT", "false").lower() != "true":
         logger.info("[POLL_BOT] blocked at function entry")
         return
-    loop = asyncio.new_event_loop()
-    try:
-        loop.run_until_complete(check_basic_polls_async())
-    finally:
-        try:
-            loop.run_until_complete(loop.shutdown_asyncgens())
-        except Exception:
-            pass
-        loop.close()
+    run_coroutine(check_basic_polls_async(), timeout=None)
 
 if __name__ == "__main__":
     run_poll_tracker()
@@ -1,13 +1,15 @@
 import os
 import re
-import asyncio
 import html
 import requests
 import urllib.parse
 from datetime import datetime, date
 import logging
 from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright
+
+from app.utils.browser_pool import browser_page
+from app.utils.job_runtime import run_coroutine
+from app.utils.telegram_delivery import send_message
 
 # 이메일 주소 패턴 — 뉴스1 기사 본문에 기자 이메일이 섞여 나오는 문제 방지
 EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
@@ -84,10 +86,8 @@ async def parse_schedule_text(url, locator_selector_primary, targets):
     """Playwright로 해당 URL의 특정 영역 텍스트를 추출해 타겟 섹션만 파싱"""
     results = {t: [] for t in targets}
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        try:
-            page = await browser.new_page(user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0 Safari/537.36')
+    try:
+        async with browser_page(user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0 Safari/537.36') as page:
             await page.goto(url, wait_until='domcontentloaded', timeout=15000)
             await page.wait_for_timeout(3000) # JS Render 대기
             
@@ -145,10 +145,8 @@ async def parse_schedule_text(url, locator_selector_primary, targets):
                         if 'mailto:' in line:
                             continue
                         results[current_section].append(line)
-        except Exception as e:
-            logger.error(f"Playwright error on {url}: {e}")
-        finally:
-            await browser.close()
+    except Exception as e:
+        logger.error(f"Playwright error on {url}: {e}")
             
     return results
 
@@ -216,26 +214,17 @@ def _run_schedule_job(bot_token, chat_id, job_name="일정봇"):
 
     news1_url = fetch_news1_schedule_url()
 
-    # 명시적 loop 생성 후 try/finally로 반드시 close — Playwright 서브프로세스 누수 방지.
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        news1_data = {t: [] for t in NEWS1_TARGETS}
-        if news1_url:
-            logger.info(f"파싱 시작: News1 ({news1_url})")
-            news1_data = loop.run_until_complete(parse_schedule_text(news1_url, '.detail_body', NEWS1_TARGETS))
-        else:
-            logger.warning("뉴스1 일정 기사를 찾지 못했습니다.")
+    # Playwright 파싱은 워커 공유 이벤트 루프에서 실행 (잡마다 loop 를 만들지 않음)
+    news1_data = {t: [] for t in NEWS1_TARGETS}
+    if news1_url:
+        logger.info(f"파싱 시작: News1 ({news1_url})")
+        news1_data = run_coroutine(parse_schedule_text(news1_url, '.detail_body', NEWS1_TARGETS))
+    else:
+        logger.warning("뉴스1 일정 기사를 찾지 못했습니다.")
 
-        logger.info("파싱 시작: 국회 (https://assembly.go.kr/portal/main/main.do)")
-        assembly_url = 'https://assembly.go.kr/portal/main/main.do'
-        assembly_data = loop.run_until_complete(parse_schedule_text(assembly_url, '#nowNa-text', ASSEMBLY_TARGETS))
-    finally:
-        try:
-            loop.run_until_complete(loop.shutdown_asyncgens())
-        except Exception:
-            pass
-        loop.close()
+    logger.info("파싱 시작: 국회 (https://assembly.go.kr/portal/main/main.do)")
+    assembly_url = 'https://assembly.go.kr/portal/main/main.do'
+    assembly_data = run_coroutine(parse_schedule_text(assembly_url, '#nowNa-text', ASSEMBLY_TARGETS))
     
     message = format_schedule_message(news1_data, assembly_data)
 
@@ -246,36 +235,14 @@ def _run_schedule_job(bot_token, chat_id, job_name="일정봇"):
         print(f"[SKIP] {job_name} 일정 내용 없음 — 발송 중단")
         return
 
-    # 분할 전송 방어 로직
-    parts = []
-    current = ''
-    for line in message.split('\n'):
-        if len(current) + len(line) + 1 > 4000:
-            parts.append(current)
-            current = line
-        else:
-            current += '\n' + line if current else line
-    if current:
-        parts.append(current)
-        
-    url = f'https://api.telegram.org/bot{bot_token}/sendMessage'
-    for part in parts:
-        try:
-            resp = requests.post(url, json={
-                'chat_id': chat_id,
-                'text': part,
-                'parse_mode': 'HTML',
-                'disable_web_page_preview': True,
-            }, timeout=10)
-            if resp.status_code == 200:
-                logger.info(f"{job_name} 발송 완료 ({len(part)}자)")
-                print(f"{job_name} 발송 완료 ({len(part)}자)")
-            else:
-                logger.error(f"발송 에러: {resp.text}")
-                print(f"발송 에러: {resp.text}")
-        except Exception as e:
-            logger.error(f"전송 예외: {e}")
-            
+    result = send_message(bot_token, chat_id, message, parse_mode='HTML', disable_preview=True)
+    if result.ok:
+        logger.info(f"{job_name} 발송 완료 ({result.parts}개 메시지, {len(message)}자)")
+        print(f"{job_name} 발송 완료 ({result.parts}개 메시지, {len(message)}자)")
+    else:
+        logger.error(f"발송 에러: {result.error}")
+        print(f"발송 에러: {result.error}")
+
     logger.info(f"=== {job_name} 종료 ===")
 
 def send_schedule():
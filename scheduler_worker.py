@@ -14,7 +14,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-from app import create_app
+from app import create_app, db
 app = create_app()
 
 from app.jobs.youtube_feed import check_and_post_new_videos
@@ -32,6 +32,9 @@ from editorial_bot import (
 from schedule_bot import send_schedule, send_schedule_nureongi
 from vip_alert_bot import run_vip_alert
 from app.utils.bias_report import generate_weekly_report, send_weekly_report_to_telegram
+from app.utils.telegram_delivery import flush_outbox
+from app.utils.job_runtime import get_job_runtime, run_coroutine
+from app.utils.browser_pool import get_browser_pool
 from exclusive_news_bot import send_exclusive_news
 from nr2_web_bot import poll_commands, send_youcheck_daily
 from weekly_briefing import send_weekly_briefing
@@ -45,31 +48,30 @@ executors = {
 scheduler = BlockingScheduler(executors=executors, timezone='Asia/Seoul')
 INTERVAL_MINUTES = int(os.environ.get('YOUTUBE_CHECK_INTERVAL', 10))
 
-# ─── 스케줄러 하드닝: 진단 로그 + 하트비트 자가복구 (telegram NetworkError: can't start new thread 대응) ───
-# 목표는 ①관측가능성 ②자가복구 두 가지뿐. H1(asyncio default executor 스레드 회수) 근본픽스는
-# editorial_bot.py:24 주석이 경고하는 부작용 영역이라 1주 진단 데이터로 확증 후 별도 Phase에서 진행.
+# ─── 잡 런타임 (app/utils/job_runtime.py) ───
+# 코루틴은 워커 공유 이벤트 루프 1개에서, 동기 I/O 는 공유 스레드 풀(JOB_IO_WORKERS)에서 실행되어
+# 잡마다 event loop 를 만들고 닫으며 스레드가 쌓이던 문제를 없앴다.
+# THREAD_LIMIT 초과 시 os._exit(1) 은 런타임 밖에서 새는 경우를 위한 최후 안전장치로만 남긴다.
 THREAD_LIMIT = int(os.environ.get('THREAD_LIMIT', 40))
+runtime = get_job_runtime()
 
-# 진단 로그: APScheduler 이벤트 리스너로 잡 본문을 전혀 건드리지 않고 실행 전후 스레드 수를 기록.
-# (submitted=실행 직전, executed/error=실행 종료 → 잡별 스레드 증감 delta 특정)
-# 주의: executor max_workers=3 으로 최대 3개 잡이 겹칠 수 있어 delta는 동시 실행 잡과 교란될 수 있음.
-# 누수의 권위 신호는 하트비트의 절대 threads 수와 주간 추세이고, DIAG delta는 용의 잡 좁히기용.
-_diag_before = {}
-
+# 잡별 실행 시간·스레드 증감: APScheduler 이벤트 리스너로 잡 본문을 건드리지 않고 기록.
+# (submitted=실행 직전, executed/error=실행 종료. executor max_workers=3 이라 겹친 잡끼리 delta 가 교란될 수 있어
+#  누적 total_thread_delta 의 추세로 판단한다)
 def _diag_on_submitted(event):
     if event.job_id == 'heartbeat':
         return
-    _diag_before[event.job_id] = threading.active_count()
+    runtime.job_started(event.job_id)
 
 def _diag_on_done(event):
     if event.job_id == 'heartbeat':
         return
-    before = _diag_before.pop(event.job_id, None)
-    after = threading.active_count()
-    if before is None:
-        logger.info(f"[DIAG] job={event.job_id} after={after} (no before snapshot)")
+    result = runtime.job_finished(event.job_id, error=event.code == EVENT_JOB_ERROR)
+    if result is None:
+        logger.info(f"[DIAG] job={event.job_id} threads={threading.active_count()} (no before snapshot)")
     else:
-        logger.info(f"[DIAG] job={event.job_id} before={before} after={after} delta={after - before}")
+        wall, delta = result
+        logger.info(f"[DIAG] job={event.job_id} wall={wall:.1f}s threads={threading.active_count()} delta={delta}")
 
 scheduler.add_listener(_diag_on_submitted, EVENT_JOB_SUBMITTED)
 scheduler.add_listener(_diag_on_done, EVENT_JOB_EXECUTED | EVENT_JOB_ERROR)
@@ -78,7 +80,23 @@ scheduler.add_listener(_diag_on_done, EVENT_JOB_EXECUTED | EVENT_JOB_ERROR)
 def heartbeat_job():
     n = threading.active_count()
     jobs = scheduler.get_jobs()
-    logger.info(f"[HEARTBEAT] threads={n} jobs={len(jobs)}")
+    stats = runtime.stats()
+    logger.info(f"[HEARTBEAT] threads={n} jobs={len(jobs)} loop_tasks={stats['loop_tasks']} running={stats['running_jobs']}")
+    # 공유 Chromium 이 떠 있으면 상태 점검 (끊겼으면 여기서 재기동)
+    pool = get_browser_pool()
+    if pool.stats()['launches']:
+        try:
+            run_coroutine(pool.health_check(), timeout=60)
+        except Exception as e:
+            logger.error(f"[HEARTBEAT] 브라우저 상태 점검 실패: {e}")
+        logger.info(f"[HEARTBEAT] browser={pool.stats()}")
+    # 관리자 화면(/admin/api/worker-stats)용 스냅샷
+    with app.app_context():
+        try:
+            runtime.save_stats()
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"[HEARTBEAT] 잡 지표 저장 실패: {e}")
     if n > THREAD_LIMIT:
         # 사후 부검용: 스레드 수 + 전체 잡 이름 목록 + 살아있는 스레드 이름 전체를 남기고 강제 종료.
         # 스케줄러 잡은 executor 워커 스레드에서 돌므로 sys.exit는 스레드만 죽임 → os._exit(1) 필수.
@@ -170,6 +188,18 @@ def vip_alert_job():
     logger.info('[Scheduler] VIP 알림봇 실행 중...')
     run_vip_alert()
 
+@scheduler.scheduled_job('interval', minutes=1, id='telegram_outbox', coalesce=True, max_instances=1)
+def telegram_outbox_job():
+    """발송 실패로 대기열에 남은 텔레그램 메시지 재발송"""
+    with app.app_context():
+        try:
+            sent = flush_outbox()
+            if sent:
+                logger.info(f'[Scheduler] 텔레그램 대기열 재발송 {sent}건')
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f'[Scheduler] 텔레그램 대기열 재발송 실패: {e}')
+
 @scheduler.scheduled_job('cron', day_of_week='mon', hour=9, minute=0, id='weekly_bias_report', timezone='Asia/Seoul')
 def weekly_bias_report():
     logger.info('[Scheduler] 주간 편향 리포트 생성 및 전송 중...')
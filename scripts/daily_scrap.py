@@ -21,10 +21,13 @@ import json
 import urllib.request
 import urllib.parse
 import urllib.error
-import difflib
 import logging
 from datetime import datetime, timedelta, timezone
 
+# 독립 실행 스크립트 — app 패키지(Flask) 초기화 없이 표준 라이브러리만 쓰는 모듈을 직접 불러온다
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app', 'utils'))
+from neardup import dedupe  # noqa: E402
+
 # ── 로거 ─────────────────────────────────────────────────────────────────────
 logging.basicConfig(
     level=logging.INFO,
@@ -224,17 +227,8 @@ def _filter_by_time(articles: list[dict], start: datetime, end: datetime) -> lis
 # ────────────────────────────────────────────────────────────────────────────
 
 def _deduplicate(articles: list[dict], threshold: float = DEDUP_THRESHOLD) -> list[dict]:
-    """제목 유사도 기반 중복 제거."""
-    selected = []
-    for art in articles:
-        title = art.get('_clean_title', art.get('title', ''))
-        is_dup = any(
-            difflib.SequenceMatcher(None, title, s.get('_clean_title', '')).ratio() >= threshold
-            for s in selected
-        )
-        if not is_dup:
-            selected.append(art)
-    return selected
+    """제목 유사도 기반 중복 제거 (MinHash/LSH 후보만 정확 비교)."""
+    return dedupe(articles, lambda art: art.get('_clean_title', art.get('title', '')), threshold)
 
 
 def _classify_section(title: str) -> str:
@@ -12,7 +12,6 @@ RSS entry의 원문 summary는 DB에 저장되지 않으므로, 제목과 출처
     python scripts/rescore_aesa_articles.py --limit 20 # 20건만 시험 실행
 """
 import argparse
-import json
 import logging
 import os
 import sys
@@ -25,6 +24,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app import create_app, db
 from app.models.aesa_article import AesaArticle
+from app.utils.llm_json import parse_json_response
 from aesa_monitoring_bot import PROMPT_TEMPLATE
 
 KST = timezone(timedelta(hours=9))
@@ -47,10 +47,9 @@ def rescore_one(client, article):
         messages=[{"role": "user", "content": prompt}],
     )
     text = response.content[0].text
-    if "{" not in text or "}" not in text:
+    result, _ = parse_json_response(text)
+    if result is None:
         raise ValueError(f"Claude 응답에서 JSON을 찾지 못함: {text[:200]}")
-    start, end = text.find("{"), text.rfind("}") + 1
-    result = json.loads(text[start:end])
     return (
         min(int(result.get("score", 0)), 10),
         result.get("korean_summary", ""),
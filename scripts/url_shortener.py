@@ -6,21 +6,21 @@
 
 공개 함수:
 - shorten_url(original_url, ...) → str
-- resolve_code(code, request_meta=None) → str | None
+- resolve_code(code, request_meta=None) → str | None  (DB 쓰기 없음, 클릭은 버퍼 경유)
 - get_user_shorteners(user_id, limit, offset) → list[URLShortener]
 - get_click_stats(code, days=7) → dict | None
 """
 import logging
-import re
 import secrets
 import string
 from datetime import datetime, timedelta
 
-import requests
-
 from app import db
 from app.models.url_shortener import URLShortener, URLClickLog
+from app.utils.article_extract import extract_article
 from app.utils.press_map import resolve_press_name, extract_domain
+from app.utils.short_link_clicks import record_click
+from app.utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -29,14 +29,10 @@ CODE_ALPHABET = string.ascii_letters + string.digits  # base62
 CODE_LEN = 6
 CODE_RETRY = 5
 OG_TIMEOUT = 5
-OG_UA = 'NR2-Shortener/1.0 (+https://nr2.kr)'
-CLICK_ABUSE_WINDOW_HOURS = 24
+LINK_CACHE_SECONDS = 600   # 코드 → URL 매핑은 생성 후 바뀌지 않으므로 길게 캐시
+LINK_CACHE_SIZE = 20000
 
-_OG_TITLE_RE = re.compile(
-    r'<meta[^>]+property=["\']og:title["\'][^>]+content=["\']([^"\']+)',
-    re.IGNORECASE,
-)
-_TITLE_RE = re.compile(r'<title[^>]*>([^<]+)</title>', re.IGNORECASE)
+_links = TTLCache(LINK_CACHE_SECONDS, max_size=LINK_CACHE_SIZE)   # code → (id, original_url, expires_at)
 
 
 def _generate_code(length=CODE_LEN):
@@ -44,28 +40,12 @@ def _generate_code(length=CODE_LEN):
 
 
 def _extract_og_title(url):
-    """OG title 우선, 없으면 <title>. 실패해도 예외 없이 None 반환."""
-    try:
-        resp = requests.get(
-            url,
-            timeout=OG_TIMEOUT,
-            headers={'User-Agent': OG_UA},
-            allow_redirects=True,
-        )
-        if resp.status_code != 200:
-            return None
-        html = resp.text[:50000]
-        m = _OG_TITLE_RE.search(html)
-        title = m.group(1).strip() if m else None
-        if not title:
-            m = _TITLE_RE.search(html)
-            title = m.group(1).strip() if m else None
-        if title and len(title) > 300:
-            title = title[:297] + '...'
-        return title
-    except Exception as e:
-        logger.info(f'[단축] OG 추출 실패 ({url[:60]}): {type(e).__name__}')
+    """OG title 우선, 없으면 <title>. 실패해도 예외 없이 None 반환 (기사 추출 캐시 공유)."""
+    article = extract_article(url, timeout=OG_TIMEOUT)
+    if not article.ok:
+        logger.info(f'[단축] OG 추출 실패 ({url[:60]}): {article.error[:80]}')
         return None
+    return article.title
 
 
 def shorten_url(original_url, source_bot=None, user_id=None,
@@ -133,60 +113,41 @@ def shorten_url(original_url, source_bot=None, user_id=None,
 
 
 def resolve_code(code, request_meta=None):
-    """code → original_url. 만료/미존재 시 None.
+    """code → original_url. 만료/미존재 시 None. DB 쓰기 없음.
 
-    클릭 로그는 항상 기록. 어뷰즈 방지:
-    동일 ip_hash + shortener_id가 24시간 내 중복이면 click_count 증가만 skip.
+    코드 조회는 인-프로세스 LRU(LINK_CACHE_SECONDS) 우선. 클릭은 버퍼에 넣기만 하고
+    플러셔(app/utils/short_link_clicks.py)가 로그 INSERT·click_count 증가를 일괄 반영한다.
+    어뷰즈 방지: 동일 ip_hash + shortener_id가 24시간 내 중복이면 click_count 증가만 skip.
     """
     if not code:
         return None
-    try:
-        row = URLShortener.query.filter_by(code=code).first()
-        if not row:
+    link = _links.get(code)
+    if link is None:
+        try:
+            row = (
+                db.session.query(URLShortener.id, URLShortener.original_url, URLShortener.expires_at)
+                .filter_by(code=code)
+                .first()
+            )
+        except Exception as e:
+            db.session.rollback()
+            logger.warning(f'[단축] resolve 실패 ({code}): {type(e).__name__}: {e}')
             return None
-        now = datetime.now()
-        if row.expires_at and row.expires_at < now:
+        if not row:
             return None
+        link = (row.id, row.original_url, row.expires_at)
+        _links.set(code, link)
 
-        ip_hash = (request_meta or {}).get('ip_hash')
-        count_this_click = True
-        if ip_hash:
-            window_start = now - timedelta(hours=CLICK_ABUSE_WINDOW_HOURS)
-            recent = URLClickLog.query.filter(
-                URLClickLog.shortener_id == row.id,
-                URLClickLog.ip_hash == ip_hash,
-                URLClickLog.clicked_at >= window_start,
-            ).first()
-            if recent:
-                count_this_click = False
-
-        if request_meta:
-            log = URLClickLog(
-                shortener_id=row.id,
-                user_agent=(request_meta.get('user_agent') or None),
-                ip_hash=ip_hash,
-                referer=(request_meta.get('referer') or None),
-                device_type=(request_meta.get('device_type') or None),
-            )
-            db.session.add(log)
-
-        if count_this_click:
-            row.click_count = (row.click_count or 0) + 1
-            row.last_clicked_at = now
-            # NP 적립은 Phase 2-B에서 별도 커밋
-            # if row.user_id:
-            #     from app.models.user import User
-            #     from app.models.np_point import award_np
-            #     user = User.query.get(row.user_id)
-            #     if user:
-            #         award_np(user, 'shortener_click', description=f'/s/{code}')
-
-        db.session.commit()
-        return row.original_url
-    except Exception as e:
-        db.session.rollback()
-        logger.warning(f'[단축] resolve 실패 ({code}): {type(e).__name__}: {e}')
+    shortener_id, original_url, expires_at = link
+    if expires_at and expires_at < datetime.now():
         return None
+    record_click(shortener_id, code, request_meta)
+    return original_url
+
+
+def get_link_cache_stats():
+    """단축 코드 LRU 적중 통계 (현재 워커 기준)."""
+    return {'size': len(_links), 'hits': _links.hits, 'misses': _links.misses}
 
 
 def get_user_shorteners(user_id, limit=50, offset=0):
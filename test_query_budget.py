@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""게시글 상세 쿼리 수 테스트 — 댓글 스레드가 많아도 쿼리 수가 늘지 않는지 확인"""
+import sys
+
+from app import create_app, db
+from app.models import User, Post, Comment
+from app.routes.boards import load_post_detail
+from app.utils.query_counter import query_budget
+
+ROOT_COMMENTS = 30
+REPLIES_PER_COMMENT = 3
+
+app = create_app('testing')
+
+with app.app_context():
+    db.create_all()
+
+    print("=" * 50)
+    print("게시글 상세 쿼리 수 테스트")
+    print("=" * 50)
+
+    # 테스트 데이터: 작성자 1명 + 댓글 작성자 10명, 댓글 30개 × 답글 3개
+    author = User(email='author@nr2.com', nickname='작성자', password_hash='x')
+    commenters = [User(email=f'c{i}@nr2.com', nickname=f'댓글러{i}', password_hash='x') for i in range(10)]
+    db.session.add_all([author] + commenters)
+    db.session.commit()
+
+    post = Post(title='쿼리 수 테스트', content='본문', board_type='free', user_id=author.id)
+    db.session.add(post)
+    db.session.commit()
+
+    for i in range(ROOT_COMMENTS):
+        root = Comment(content=f'댓글 {i}', user_id=commenters[i % 10].id, post_id=post.id)
+        db.session.add(root)
+        db.session.flush()
+        for j in range(REPLIES_PER_COMMENT):
+            db.session.add(Comment(content=f'답글 {i}-{j}', user_id=commenters[(i + j + 1) % 10].id,
+                                   post_id=post.id, parent_id=root.id))
+    db.session.commit()
+    post_id = post.id
+    total = ROOT_COMMENTS * (1 + REPLIES_PER_COMMENT)
+    print(f"\n테스트 게시글: id={post_id}, 댓글 {total}개")
+
+    # 1. 상세 데이터 로드는 4쿼리 고정
+    print("\n1. load_post_detail() 쿼리 예산 4회")
+    db.session.expunge_all()
+    try:
+        with query_budget(4) as used:
+            detail = load_post_detail(post_id)
+            comments = detail['root_comments'] + [r for rs in detail['replies'].values() for r in rs]
+            nicknames = [c.author.nickname for c in comments] + [detail['post'].author.nickname]
+    except AssertionError as e:
+        print(f"   ✗ {e}")
+        sys.exit(1)
+    print(f"   ✓ {used[0]}회 (댓글 {len(comments)}개, 작성자 {len(set(nicknames))}명)")
+
+    # 2. 템플릿 렌더링까지 포함해도 4쿼리 (템플릿에서 지연 로딩이 일어나지 않아야 함)
+    print("\n2. 상세 페이지 렌더링 쿼리 예산 4회")
+    db.session.expunge_all()
+    with app.test_request_context(f'/boards/free/{post_id}'):
+        from flask import render_template
+        try:
+            with query_budget(4) as used:
+                detail = load_post_detail(post_id)
+                html = render_template(
+                    'boards/view.html', post=detail['post'], youtube_embed_url=None,
+                    images=detail['images'], root_comments=detail['root_comments'],
+                    replies_by_parent=detail['replies'],
+                    up_count=detail['up_count'], down_count=detail['down_count'],
+                    user_vote=detail['user_vote'], board_name='자유게시판',
+                    is_lounge=False, lounge_badge='', lounge_image='',
+                )
+        except AssertionError as e:
+            print(f"   ✗ {e}")
+            sys.exit(1)
+    if '답글 0-0' not in html:
+        print("   ✗ 답글이 렌더링되지 않았습니다.")
+        sys.exit(1)
+    print(f"   ✓ {used[0]}회 ({len(html):,}자 렌더링)")
+
+    print("\n" + "=" * 50)
+    print("✓ 모든 테스트 통과!")
+    print("=" * 50)
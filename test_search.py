@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""게시판 검색 테스트 — 바이그램 색인 백엔드 (SQLite)"""
+import sys
+
+from app import create_app, db
+from app.models import User, Post
+from app.utils.search import search_posts, get_backend
+
+app = create_app('testing')
+
+
+def check(label, query, expected, **kwargs):
+    found = [p.title for p in search_posts(query, **kwargs).items]
+    if sorted(found) != sorted(expected):
+        print(f"   ✗ {label}: '{query}' → {found} (기대값 {expected})")
+        sys.exit(1)
+    print(f"   ✓ {label}: '{query}' → {len(found)}건")
+
+
+with app.app_context():
+    db.create_all()
+
+    print("=" * 50)
+    print(f"게시판 검색 테스트 (백엔드: {get_backend()})")
+    print("=" * 50)
+
+    author = User(email='search@nr2.com', nickname='대통령실', password_hash='x')
+    db.session.add(author)
+    db.session.commit()
+
+    db.session.add_all([
+        Post(title='윤석열 대통령 기자회견', content='<p>오늘 오전 회견</p>', board_type='free', user_id=author.id),
+        Post(title='경제 브리핑', content='<p>금리 동결 소식</p>', board_type='free', user_id=author.id),
+        Post(title='윤석열 관련 소식', content='<p>별다른 내용 없음</p>', board_type='free', user_id=author.id),
+        Post(title='윤 대통령 지지율', content='<p>여론조사 결과</p>', board_type='free', user_id=author.id),
+    ])
+    db.session.commit()
+
+    # 1. 기본 바이그램 검색
+    print("\n1. 2글자 이상 검색어")
+    check("제목 일치", '기자회견', ['윤석열 대통령 기자회견'])
+    check("본문 일치", '금리', ['경제 브리핑'])
+    check("여러 단어", '윤석열 대통령', ['윤석열 대통령 기자회견'])
+    check("단어 순서 무관", '대통령 윤석열', ['윤석열 대통령 기자회견'])
+
+    # 2. 1글자 토큰이 섞인 검색어 (색인에 1글자 항목이 없으므로 LIKE 경로)
+    print("\n2. 1글자 토큰 포함 검색어")
+    check("뒤에 1글자", '석열 대', ['윤석열 대통령 기자회견'])
+    check("앞에 1글자", '윤 대통령', ['윤 대통령 지지율'])
+    check("1글자만", '윤', ['윤석열 대통령 기자회견', '윤석열 관련 소식', '윤 대통령 지지율'])
+
+    # 3. 검색어가 서로 다른 필드에 나뉘어 있으면 매칭하지 않음
+    #    ('소식'은 제목, '대통령'은 작성자 닉네임 '대통령실' 에만 있음)
+    print("\n3. 필드 교차 매칭 제외")
+    check("제목+작성자", '소식 대통령', [])
+    check("작성자", '대통령실', ['윤석열 대통령 기자회견', '경제 브리핑', '윤석열 관련 소식', '윤 대통령 지지율'])
+
+    print("\n" + "=" * 50)
+    print("✓ 모든 테스트 통과!")
+    print("=" * 50)
@@ -1,11 +1,12 @@
 """VIP 알림봇 - 실시간 뉴스 모니터링 (네이버 API) — 중복 필터링 강화"""
 import os
 import re
-import time
 import requests
 import json
 import logging
 import urllib.parse
+from app.utils.neardup import NearDupIndex, hasher_for
+from app.utils.telegram_delivery import send_message
 
 logger = logging.getLogger(__name__)
 
@@ -30,32 +31,46 @@ def _normalize(title):
     return _STRIP_RE.sub('', title).lower()
 
 
-def _is_similar(title, existing_titles, threshold=0.55):
-    """새 제목이 기존 제목과 유사한지 판별"""
+def _similar_pair(title, other, threshold=0.55):
+    """두 제목이 같은 뉴스인지 판별 (1.0 = 유사, 0.0 = 다름)"""
     norm = _normalize(title)
-    if len(norm) < 4:
-        return False
-    for ex in existing_titles:
-        ex_norm = _normalize(ex)
-        if len(ex_norm) < 4:
-            continue
-        # 1) 한쪽이 다른쪽을 포함
-        if norm in ex_norm or ex_norm in norm:
-            return True
-        # 2) 글자 집합 Jaccard 유사도
-        s1, s2 = set(norm), set(ex_norm)
-        jaccard = len(s1 & s2) / len(s1 | s2) if s1 | s2 else 0
-        if jaccard >= threshold:
-            # 추가 검증: 앞 8글자 겹침
-            min_len = min(len(norm), len(ex_norm))
-            prefix = min(8, min_len)
-            if norm[:prefix] == ex_norm[:prefix]:
-                return True
-            # 공통 부분문자열 비율
-            common = _lcs_len(norm, ex_norm)
-            if common >= min_len * 0.5:
-                return True
-    return False
+    ex_norm = _normalize(other)
+    if len(norm) < 4 or len(ex_norm) < 4:
+        return 0.0
+    # 1) 한쪽이 다른쪽을 포함
+    if norm in ex_norm or ex_norm in norm:
+        return 1.0
+    # 2) 글자 집합 Jaccard 유사도
+    s1, s2 = set(norm), set(ex_norm)
+    jaccard = len(s1 & s2) / len(s1 | s2) if s1 | s2 else 0
+    if jaccard >= threshold:
+        # 추가 검증: 앞 8글자 겹침
+        min_len = min(len(norm), len(ex_norm))
+        prefix = min(8, min_len)
+        if norm[:prefix] == ex_norm[:prefix]:
+            return 1.0
+        # 공통 부분문자열 비율
+        common = _lcs_len(norm, ex_norm)
+        if common >= min_len * 0.5:
+            return 1.0
+    return 0.0
+
+
+# 포함 관계(짧은 제목 ⊂ 긴 제목)도 후보로 잡히도록 밴드당 1행 — 재현율 우선
+_title_hasher = hasher_for(0.55)
+
+
+def _title_index(titles):
+    """제목 유사도 색인 — LSH 후보만 _similar_pair 로 정확 비교"""
+    index = NearDupIndex(threshold=1.0, verify=_similar_pair, hasher=_title_hasher)
+    for title in titles:
+        index.add(len(index), title)
+    return index
+
+
+def _is_similar(title, index):
+    """새 제목이 색인된 기존 제목과 유사한지 판별"""
+    return index.best(title) is not None
 
 
 def _lcs_len(s1, s2):
@@ -139,6 +154,7 @@ def check_and_send():
 
     # 이번 사이클에서 전송한 제목 (타겟 간 중복 방지)
     cycle_titles = list(sent_titles)
+    cycle_index = _title_index(cycle_titles)
 
     for target in TARGETS:
         all_articles = []
@@ -158,7 +174,7 @@ def check_and_send():
             if art['link'] in sent_links:
                 continue
             # 2) 제목 유사도 중복 (과거 이력 + 이번 사이클 전체)
-            if _is_similar(art['title'], cycle_titles):
+            if _is_similar(art['title'], cycle_index):
                 sent_links.add(art['link'])  # 링크도 기록해서 다음에 안 봄
                 continue
             # 3) 타겟당 최대 2개
@@ -168,10 +184,12 @@ def check_and_send():
             if first_run:
                 sent_links.add(art['link'])
                 cycle_titles.append(art['title'])
+                cycle_index.add(len(cycle_index), art['title'])
                 continue
 
             sent_links.add(art['link'])
             cycle_titles.append(art['title'])
+            cycle_index.add(len(cycle_index), art['title'])
 
             message = (
                 f"{target['emoji']} <b>{target['name']} 관련 뉴스</b>\n\n"
@@ -179,23 +197,14 @@ def check_and_send():
                 f"🔗 {art['link']}"
             )
 
-            try:
-                url = f"https://api.telegram.org/bot{BOT_TOKEN}/sendMessage"
-                resp = requests.post(url, json={
-                    'chat_id': CHAT_ID,
-                    'text': message,
-                    'parse_mode': 'HTML',
-                    'disable_web_page_preview': True,
-                }, timeout=10)
-                if resp.status_code == 200:
-                    print(f"✅ {target['emoji']} {art['title'][:40]}")
-                    new_count += 1
-                    target_count += 1
-                    time.sleep(3)
-                else:
-                    print(f"❌ 전송 실패: {resp.text}")
-            except Exception as e:
-                print(f"❌ 오류: {e}")
+            # 고정 sleep 대신 공용 발송 계층의 채팅별 속도 제한
+            result = send_message(BOT_TOKEN, CHAT_ID, message, parse_mode='HTML', disable_preview=True)
+            if result.ok:
+                print(f"✅ {target['emoji']} {art['title'][:40]}")
+                new_count += 1
+                target_count += 1
+            else:
+                print(f"❌ 전송 실패: {result.error}")
 
     # 이번 사이클 제목도 이력에 저장
     save_sent(sent_links, cycle_titles)
@@ -3,11 +3,10 @@ import os
 import logging
 from datetime import datetime, timedelta
 
-import requests
-
 from app import db
 from app.models.post import Post
 from app.models import Comment, Like
+from app.utils.telegram_delivery import send_message
 
 logger = logging.getLogger(__name__)
 
@@ -92,22 +91,9 @@ def send_weekly_briefing(app):
         logger.error('[Weekly] NUREONGI_NEWS_BOT_TOKEN 또는 TELEGRAM_CHAT_ID 미설정')
         return False
 
-    url = f'https://api.telegram.org/bot{token}/sendMessage'
-    payload = {
-        'chat_id': chat_id,
-        'text': text,
-        'parse_mode': None,
-        'disable_web_page_preview': True,
-    }
-
-    try:
-        resp = requests.post(url, json=payload, timeout=15)
-        if resp.ok:
-            logger.info(f'[Weekly] 채널 발송 완료 (TOP {len(ranked)}개)')
-            return True
-        else:
-            logger.error(f'[Weekly] 발송 실패: {resp.text}')
-            return False
-    except Exception as e:
-        logger.error(f'[Weekly] 발송 예외: {e}')
-        return False
+    result = send_message(token, chat_id, text, parse_mode=None, disable_preview=True)
+    if result.ok:
+        logger.info(f'[Weekly] 채널 발송 완료 (TOP {len(ranked)}개)')
+        return True
+    logger.error(f'[Weekly] 발송 실패: {result.error}')
+    return False